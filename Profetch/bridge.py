@@ -4,9 +4,37 @@ Bridge module for uniPROscope MCP Client.
 
 import requests
 import asyncio
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar, Union
 from dataclasses import dataclass
 
+try:
+    from .cancellation import CancellableAdapter, CancelToken, run_cancellable
+    from .entry_store import MemoryEntryCache, SQLiteEntryStore
+    from .export import gene_name, write_tables
+    from .metrics import ENTRY_CACHE
+    from .properties import compute_properties
+    from .sequences import SequenceCache, compile_motif
+    from .similarity import KmerIndex, banded_alignment_score
+except ImportError:  # loaded as a top-level module by mcp_server.py
+    from cancellation import CancellableAdapter, CancelToken, run_cancellable
+    from entry_store import MemoryEntryCache, SQLiteEntryStore
+    from export import gene_name, write_tables
+    from metrics import ENTRY_CACHE
+    from properties import compute_properties
+    from sequences import SequenceCache, compile_motif
+    from similarity import KmerIndex, banded_alignment_score
+
+T = TypeVar("T")
+
+_CACHE_MEMORY_HITS = ENTRY_CACHE.labels("memory")
+_CACHE_STORE_HITS = ENTRY_CACHE.labels("store")
+_CACHE_MISSES = ENTRY_CACHE.labels("miss")
+
+ACCESSION_RE = re.compile(
+    r"[OPQ][0-9][A-Z0-9]{3}[0-9]|[A-NR-Z][0-9](?:[A-Z][A-Z0-9]{2}[0-9]){1,2}"
+)
+
 
 @dataclass
 class Config:
@@ -15,6 +43,15 @@ class Config:
     timeout: float = 30.0
     request_delay: float = 1.0
     api_key: Optional[str] = None
+    # SQLite file holding UniProt entries shared by all worker processes
+    cache_path: Optional[str] = None
+    # Connections to UniProt opened by start(), ahead of the first request
+    prewarm_connections: int = 4
+    # In-process entry cache: most entries kept, and seconds each stays valid
+    entry_cache_size: int = 2048
+    entry_cache_ttl: Optional[float] = 86400.0
+    # Directory that export() writes under; export paths are relative to it
+    export_dir: str = "~/profetch_exports"
 
 
 class Bridge:
@@ -25,28 +62,148 @@ class Bridge:
     def __init__(self, config: Optional[Config] = None):
         self.config = config or Config()
         self.session = requests.Session()
+        # Lets a cancelled tool call abort its in-flight UniProt requests
+        self.session.mount("https://", CancellableAdapter())
+        self.session.mount("http://", CancellableAdapter())
+        self.sequences = SequenceCache()
+        self.kmer_index = KmerIndex()
+        self._entries = MemoryEntryCache(self.config.entry_cache_size, self.config.entry_cache_ttl)
+        self.entry_store = (
+            SQLiteEntryStore(self.config.cache_path, max_age=self.config.entry_cache_ttl)
+            if self.config.cache_path
+            else None
+        )
+        self._in_flight: Set[CancelToken] = set()
+        self._drained: Optional[asyncio.Event] = None
+        self._closing = False
+        self._prewarm: Optional["asyncio.Future[Any]"] = None
+
+    async def start(self) -> None:
+        """Open connections to UniProt in the background, ahead of the first tool call."""
+        if self._prewarm is None and self.config.prewarm_connections > 0:
+            self._prewarm = asyncio.gather(
+                *(self._run(self._prewarm_sync) for _ in range(self.config.prewarm_connections)),
+                return_exceptions=True,
+            )
+
+    def _prewarm_sync(self) -> None:
+        # DNS lookup plus TCP and TLS handshakes; the connection then waits in the pool
+        self.session.head(self.config.base_url, timeout=self.config.timeout)
+
+    async def aclose(self, grace: float = 30.0) -> None:
+        """
+        Refuse new calls, give those in flight ``grace`` seconds to finish,
+        cancel any still running, then close connections and flush caches.
+        """
+        self._closing = True
+        if self._prewarm is not None:
+            self._prewarm.cancel()
+        if self._in_flight:
+            self._drained = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._drained.wait(), grace)
+            except asyncio.TimeoutError:
+                for token in list(self._in_flight):
+                    token.cancel()
+        await asyncio.get_running_loop().run_in_executor(None, self._close_sync)
+
+    def _close_sync(self) -> None:
+        self.session.close()
+        if self.entry_store is not None:
+            self.entry_store.flush()
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """run_cancellable, tracked so that aclose can wait for or cancel the call."""
+        if self._closing:
+            raise RuntimeError("The UniProt bridge is shutting down")
+        token = CancelToken()
+        self._in_flight.add(token)
+        try:
+            return await run_cancellable(fn, *args, token=token)
+        finally:
+            self._in_flight.discard(token)
+            if not self._in_flight and self._drained is not None:
+                self._drained.set()
 
     async def get_gene_info(self, gene_symbol: str) -> Dict[str, Any]:
         """Fetch detailed gene/protein information from UniProt API."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._get_gene_info_sync, gene_symbol)
+        return await self._run(self._get_gene_info_sync, gene_symbol)
+
+    def _search_entry_sync(self, gene_symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the top human UniProt entry for a gene symbol, cached per symbol."""
+        key = gene_symbol.upper()
+        entry = self._entries.get(key)
+        if entry is not None:
+            _CACHE_MEMORY_HITS.inc()
+            return entry
+        if self.entry_store is not None:
+            found = self.entry_store.get_with_age(key)
+            if found is not None:
+                entry, age = found
+                _CACHE_STORE_HITS.inc()
+                # Expire from memory when the stored copy does, not a full TTL from now
+                self._entries.put(key, entry, age)
+                self._cache_sequence(entry)
+                return entry
+        _CACHE_MISSES.inc()
 
-    def _get_gene_info_sync(self, gene_symbol: str) -> Dict[str, Any]:
         url = f"{self.config.base_url}/uniprotkb/search"
         params = {
             "query": f"gene:{gene_symbol} AND organism_id:9606",
             "format": "json"
         }
+        response = self.session.get(url, params=params, timeout=self.config.timeout)
+        response.raise_for_status()
+        results = response.json()
 
-        try:
-            response = self.session.get(url, params=params, timeout=self.config.timeout)
-            response.raise_for_status()
-            results = response.json()
+        if not results.get("results"):
+            return None
 
-            if not results.get("results"):
-                return {"error": f"No data found for gene symbol '{gene_symbol}'"}
+        entry = results["results"][0]
+        self._entries.put(key, entry)
+        if self.entry_store is not None:
+            self.entry_store.put(key, entry)
+        self._cache_sequence(entry)
+        return entry
+
+    @staticmethod
+    def _extract_go_terms(entry: Dict[str, Any]) -> List[str]:
+        go_terms = []
+        for ref in entry.get("uniProtKBCrossReferences", []):
+            if ref.get("database") == "GO":
+                go_id = ref.get("id", "")
+                for prop in ref.get("properties", []):
+                    if prop.get("key") == "GoTerm":
+                        go_terms.append(f"{go_id}: {prop['value']}")
+        return list(dict.fromkeys(go_terms))
+
+    @staticmethod
+    def _extract_locations(entry: Dict[str, Any]) -> List[str]:
+        locations = []
+        for comment in entry.get("comments", []):
+            if comment.get("commentType") == "SUBCELLULAR LOCATION":
+                for loc in comment.get("subcellularLocations", []):
+                    val = loc.get("location", {}).get("value")
+                    if val:
+                        locations.append(val)
+        return list(dict.fromkeys(locations))
 
-            entry = results["results"][0]
+    @staticmethod
+    def _extract_interactions(entry: Dict[str, Any]) -> List[str]:
+        interactions = []
+        for comment in entry.get("comments", []):
+            if comment.get("commentType") == "INTERACTION":
+                for interactor in comment.get("interactions", []):
+                    interactor_id = interactor.get("interactantTwo", {}).get("uniProtKBAccession")
+                    if interactor_id:
+                        interactions.append(interactor_id)
+        return list(dict.fromkeys(interactions))
+
+    def _get_gene_info_sync(self, gene_symbol: str) -> Dict[str, Any]:
+        try:
+            entry = self._search_entry_sync(gene_symbol)
+            if entry is None:
+                return {"error": f"No data found for gene symbol '{gene_symbol}'"}
 
             # Extract synonyms
             synonyms = []
@@ -57,35 +214,9 @@ class Bridge:
                         synonyms.append(val)
             gene_synonyms = list(dict.fromkeys(synonyms))[:10] or ["No data available"]
 
-            # Extract GO terms
-            go_terms = []
-            for ref in entry.get("uniProtKBCrossReferences", []):
-                if ref.get("database") == "GO":
-                    go_id = ref.get("id", "")
-                    for prop in ref.get("properties", []):
-                        if prop.get("key") == "GoTerm":
-                            go_terms.append(f"{go_id}: {prop['value']}")
-            go_terms = list(dict.fromkeys(go_terms))[:10] or ["No data available"]
-
-            # Extract subcellular locations
-            locations = []
-            for comment in entry.get("comments", []):
-                if comment.get("commentType") == "SUBCELLULAR LOCATION":
-                    for loc in comment.get("subcellularLocations", []):
-                        val = loc.get("location", {}).get("value")
-                        if val:
-                            locations.append(val)
-            subcellular_location = list(dict.fromkeys(locations))[:10] or ["No data available"]
-
-            # Extract interactions
-            interactions = []
-            for comment in entry.get("comments", []):
-                if comment.get("commentType") == "INTERACTION":
-                    for interactor in comment.get("interactions", []):
-                        interactor_id = interactor.get("interactantTwo", {}).get("uniProtKBAccession")
-                        if interactor_id:
-                            interactions.append(interactor_id)
-            interactions = list(dict.fromkeys(interactions))[:10] or ["No data available"]
+            go_terms = self._extract_go_terms(entry)[:10] or ["No data available"]
+            subcellular_location = self._extract_locations(entry)[:10] or ["No data available"]
+            interactions = self._extract_interactions(entry)[:10] or ["No data available"]
 
             # Extract function description
             function_text = "No data available"
@@ -114,6 +245,271 @@ class Bridge:
         except Exception as e:
             return {"error": str(e)}
 
+    def _cache_sequence(self, entry: Dict[str, Any]) -> None:
+        accession = entry.get("primaryAccession")
+        sequence = entry.get("sequence", {}).get("value")
+        if accession and sequence:
+            self.sequences.add(accession, sequence)
+
+    def _fetch_sequences_sync(self, accessions: List[str]) -> None:
+        """Fetch sequences for accessions not yet in the cache, 100 per request."""
+        missing = [acc for acc in dict.fromkeys(accessions) if acc not in self.sequences]
+        url = f"{self.config.base_url}/uniprotkb/accessions"
+        for i in range(0, len(missing), 100):
+            params = {
+                "accessions": ",".join(missing[i:i + 100]),
+                "fields": "accession,sequence",
+                "format": "json"
+            }
+            response = self.session.get(url, params=params, timeout=self.config.timeout)
+            response.raise_for_status()
+            for entry in response.json().get("results", []):
+                self._cache_sequence(entry)
+
+    def _resolve_accessions(self, accessions: Union[List[str], str]) -> Optional[List[str]]:
+        """Return None for "all_cached", else the accession list with sequences fetched."""
+        if accessions == "all_cached":
+            return None
+        targets = [accessions] if isinstance(accessions, str) else list(accessions)
+        self._fetch_sequences_sync(targets)
+        return targets
+
+    def _report_not_found(self, result: Dict[str, Any], targets: Optional[List[str]]) -> None:
+        if targets is not None:
+            not_found = [acc for acc in targets if acc not in self.sequences]
+            if not_found:
+                result["not_found"] = not_found
+
+    async def scan_motifs(
+        self,
+        pattern: str,
+        accessions: Union[List[str], str] = "all_cached",
+        syntax: str = "auto",
+        max_matches: int = 500,
+    ) -> Dict[str, Any]:
+        """Scan cached protein sequences for a PROSITE pattern or regex."""
+        return await self._run(self._scan_motifs_sync, pattern, accessions, syntax, max_matches)
+
+    def _scan_motifs_sync(
+        self,
+        pattern: str,
+        accessions: Union[List[str], str],
+        syntax: str,
+        max_matches: int,
+    ) -> Dict[str, Any]:
+        try:
+            regex, source = compile_motif(pattern, syntax)
+            targets = self._resolve_accessions(accessions)
+            matches, total, scanned = self.sequences.scan(regex, targets, max_matches)
+            result: Dict[str, Any] = {
+                "pattern": pattern,
+                "regex": source,
+                "sequences_scanned": scanned,
+                "total_matches": total,
+                "matches": matches,
+            }
+            self._report_not_found(result, targets)
+            if total > len(matches):
+                result["truncated"] = True
+            return result
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def compute_protein_properties(
+        self, accessions: Union[List[str], str] = "all_cached"
+    ) -> Dict[str, Any]:
+        """Compute pI, GRAVY, aromaticity, extinction coefficients and composition."""
+        return await self._run(self._compute_protein_properties_sync, accessions)
+
+    def _compute_protein_properties_sync(self, accessions: Union[List[str], str]) -> Dict[str, Any]:
+        try:
+            targets = self._resolve_accessions(accessions)
+            if targets is None:
+                sequences = list(self.sequences.items())
+            else:
+                sequences = self.sequences.select(targets)
+            result = compute_properties(sequences)
+            self._report_not_found(result, targets)
+            return result
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def find_similar_proteins(
+        self, query: str, top_k: int = 10, rerank: bool = True
+    ) -> Dict[str, Any]:
+        """Find cached proteins similar to an accession or raw sequence."""
+        return await self._run(self._find_similar_proteins_sync, query, top_k, rerank)
+
+    def _find_similar_proteins_sync(self, query: str, top_k: int, rerank: bool) -> Dict[str, Any]:
+        try:
+            query = query.strip()
+            exclude = None
+            if ACCESSION_RE.fullmatch(query):
+                self._fetch_sequences_sync([query])
+                sequence = self.sequences.get(query)
+                if sequence is None:
+                    return {"error": f"No sequence found for accession '{query}'"}
+                exclude = query
+            else:
+                sequence = "".join(query.split()).upper()
+            data = sequence.encode("ascii")
+
+            self.kmer_index.sync(self.sequences)
+            hits = self.kmer_index.query(data, top_k, exclude=exclude)
+            if rerank:
+                for hit, (_, target) in zip(hits, self.sequences.select(h["accession"] for h in hits)):
+                    score = banded_alignment_score(data, target)
+                    hit["alignment_score"] = score
+                    hit["normalized_score"] = round(score / (2 * max(1, min(len(data), len(target)))), 4)
+                hits.sort(key=lambda hit: hit["alignment_score"], reverse=True)
+
+            return {
+                "query": exclude or f"sequence ({len(data)} aa)",
+                "query_length": len(data),
+                "indexed_sequences": len(self.kmer_index),
+                "hits": hits,
+            }
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    async def compare_genes(self, gene_symbols: List[str]) -> Dict[str, Any]:
+        """Compare GO terms, locations and interactors across 2-20 genes."""
+        symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in gene_symbols if symbol.strip()))
+        if not 2 <= len(symbols) <= 20:
+            return {"error": f"compare_genes takes 2 to 20 distinct gene symbols, got {len(symbols)}"}
+
+        results = await asyncio.gather(
+            *(self._run(self._search_entry_sync, symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+
+        entries: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                errors[symbol] = str(result)
+            elif result is None:
+                errors[symbol] = f"No data found for gene symbol '{symbol}'"
+            else:
+                entries[symbol] = result
+
+        return self._compare_entries(entries, errors)
+
+    def _compare_entries(
+        self, entries: Dict[str, Dict[str, Any]], errors: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Set arithmetic over annotations, returned as one row per gene."""
+        fields = {
+            "go_terms": self._extract_go_terms,
+            "subcellular_location": self._extract_locations,
+            "interactions": self._extract_interactions,
+        }
+        annotations = {
+            field: {symbol: set(extract(entry)) for symbol, entry in entries.items()}
+            for field, extract in fields.items()
+        }
+
+        shared: Dict[str, List[str]] = {}
+        unique: Dict[str, Dict[str, List[str]]] = {}
+        for field, per_gene in annotations.items():
+            sets = list(per_gene.values())
+            shared[field] = sorted(set.intersection(*sets)) if sets else []
+            unique[field] = {}
+            for symbol, values in per_gene.items():
+                others = set().union(*(v for s, v in per_gene.items() if s != symbol))
+                unique[field][symbol] = sorted(values - others)
+
+        columns = ["gene", "uniprot_id", "protein_name"]
+        for field in fields:
+            columns += [f"n_{field}", f"unique_{field}"]
+        rows = []
+        for symbol, entry in entries.items():
+            row = [
+                symbol,
+                entry.get("primaryAccession", "No data available"),
+                entry.get("proteinDescription", {}).get("recommendedName", {}).get("fullName", {}).get("value", "No data available"),
+            ]
+            for field in fields:
+                row += [len(annotations[field][symbol]), unique[field][symbol]]
+            rows.append(row)
+
+        result: Dict[str, Any] = {"columns": columns, "rows": rows, "shared": shared}
+        # Interactors that are themselves among the compared genes.
+        accessions = {entry.get("primaryAccession"): symbol for symbol, entry in entries.items()}
+        pairs = sorted(
+            [symbol, accessions[acc]]
+            for symbol, values in annotations["interactions"].items()
+            for acc in values if acc in accessions
+        )
+        if pairs:
+            result["interacting_pairs"] = pairs
+        if errors:
+            result["errors"] = errors
+        return result
+
+    async def export(
+        self,
+        targets: Union[List[str], str],
+        path: str,
+        format: str = "parquet",
+        chunk_size: int = 10000,
+    ) -> Dict[str, Any]:
+        """
+        Export GO, location, interaction and scalar tables to column-oriented files.
+
+        ``targets`` is either a list of gene symbols (served from the entry cache)
+        or a UniProt query string, whose result pages are streamed straight to
+        disk without being cached. ``path`` is a directory relative to
+        ``Config.export_dir``; paths that would leave it are refused.
+        """
+        return await self._run(self._export_sync, targets, path, format, chunk_size)
+
+    def _export_sync(
+        self, targets: Union[List[str], str], path: str, format: str, chunk_size: int
+    ) -> Dict[str, Any]:
+        try:
+            not_found: List[str] = []
+            if isinstance(targets, str):
+                entries = (
+                    (gene_name(entry) or entry.get("primaryAccession"), entry)
+                    for entry in self._iter_search_sync(targets)
+                )
+            else:
+                entries = self._iter_gene_entries_sync(targets, not_found)
+            result = write_tables(entries, path, format, chunk_size, root=self.config.export_dir)
+            if not_found:
+                result["not_found"] = not_found
+            return result
+
+        except Exception as e:
+            return {"error": str(e)}
+
+    def _iter_gene_entries_sync(
+        self, gene_symbols: List[str], not_found: List[str]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        for symbol in dict.fromkeys(symbol.upper() for symbol in gene_symbols):
+            entry = self._search_entry_sync(symbol)
+            if entry is None:
+                not_found.append(symbol)
+            else:
+                yield symbol, entry
+
+    def _iter_search_sync(self, query: str, page_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Yield every entry matching a UniProt query, following pagination links."""
+        url: Optional[str] = f"{self.config.base_url}/uniprotkb/search"
+        params: Optional[Dict[str, Any]] = {"query": query, "format": "json", "size": page_size}
+        while url:
+            response = self.session.get(url, params=params, timeout=self.config.timeout)
+            response.raise_for_status()
+            yield from response.json().get("results", [])
+            url = response.links.get("next", {}).get("url")
+            params = None
+
     async def get_protein_expression(self, gene_symbol: str) -> str:
         info = await self.get_gene_info(gene_symbol)
         return info.get("function", "No data available")
@@ -124,5 +520,4 @@ class Bridge:
 
     async def fetch_uniprot_entry(self, gene_symbol: str) -> Dict[str, Any]:
         """For testing raw UniProt JSON structure."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._get_gene_info_sync, gene_symbol)
+        return await self._run(self._get_gene_info_sync, gene_symbol)
@@ -0,0 +1,223 @@
+"""
+Cancellation of blocking UniProt requests for uniPROscope MCP Client.
+
+Bridge runs ``requests`` calls in executor threads, which asyncio cannot
+interrupt: cancelling the awaiting task leaves the thread blocked on its
+socket. ``run_cancellable`` gives each executor call a CancelToken. HTTP
+connections made through CancellableAdapter register with the token of the
+thread using them, and cancelling the token shuts their sockets down, so the
+blocked read fails at once and the executor thread is freed.
+
+When the MCP server traces requests, executor calls and the HTTP requests
+they make are recorded as spans of the tool call that started them; when it
+profiles a tool call, the executor threads working for it are profiled too.
+"""
+
+import asyncio
+import contextvars
+import socket
+import threading
+import time
+from typing import Any, Callable, Optional, Set, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+try:
+    from .metrics import EXECUTOR_QUEUE_SECONDS, UPSTREAM_BYTES, UPSTREAM_REQUESTS, UPSTREAM_SECONDS
+except ImportError:  # loaded as a top-level module by mcp_server.py
+    from metrics import EXECUTOR_QUEUE_SECONDS, UPSTREAM_BYTES, UPSTREAM_REQUESTS, UPSTREAM_SECONDS
+
+try:
+    from mcp.server.fastmcp.utilities.profiling import profile_thread
+    from mcp.shared.tracing import span
+except ImportError:  # an mcp package without tracing or profiling
+
+    class _NoopSpan:
+        def set(self, **attrs: Any) -> None:
+            pass
+
+        def __enter__(self) -> "_NoopSpan":
+            return self
+
+        def __exit__(self, *exc_info: Any) -> None:
+            pass
+
+    _NOOP_SPAN = _NoopSpan()
+
+    def span(name: str, **attrs: Any) -> Any:  # type: ignore[misc]
+        return _NOOP_SPAN
+
+    def profile_thread() -> Any:  # type: ignore[misc]
+        return _NOOP_SPAN
+
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+class RequestCancelled(requests.RequestException):
+    """The call making this request was cancelled."""
+
+
+class CancelToken:
+    """Cancellation state shared by an awaiting task and its executor thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._connections: Set[Any] = set()
+        self._done = False
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Abort every request in flight for this token and any it would start."""
+        with self._lock:
+            if self.cancelled or self._done:
+                return
+            self.cancelled = True
+            connections = list(self._connections)
+        for conn in connections:
+            _shutdown(conn)
+
+    def check(self) -> None:
+        """Raise RequestCancelled if the token has been cancelled."""
+        if self.cancelled:
+            raise RequestCancelled("request cancelled")
+
+    def _track(self, conn: Any) -> None:
+        with self._lock:
+            self.check()
+            if not self._done:
+                self._connections.add(conn)
+                conn._cancel_token = self
+
+    def _untrack(self, conn: Any) -> None:
+        with self._lock:
+            self._connections.discard(conn)
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._done = True
+            for conn in self._connections:
+                conn._cancel_token = None
+            self._connections.clear()
+
+
+def current_token() -> Optional[CancelToken]:
+    """The token of the call running in this thread, if any."""
+    return getattr(_local, "token", None)
+
+
+def _shutdown(conn: Any) -> None:
+    sock = getattr(conn, "sock", None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class _CancellableConnectionMixin:
+    _cancel_token: Optional[CancelToken] = None
+
+    def connect(self) -> None:
+        super().connect()  # type: ignore[misc]
+        token = self._cancel_token
+        if token is not None and token.cancelled:
+            # Cancelled while connecting, before there was a socket to shut down.
+            _shutdown(self)
+            token.check()
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        token = current_token()
+        if token is not None:
+            token._track(self)
+        return super().request(*args, **kwargs)  # type: ignore[misc]
+
+
+class _CancellableHTTPConnection(_CancellableConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CancellableHTTPSConnection(_CancellableConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CancellablePoolMixin:
+    def _put_conn(self, conn: Any) -> None:
+        # Back in the pool the connection may serve another call's thread.
+        token = getattr(conn, "_cancel_token", None)
+        if token is not None:
+            token._untrack(conn)
+            conn._cancel_token = None
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class _CancellableHTTPConnectionPool(_CancellablePoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CancellableHTTPConnection
+
+
+class _CancellableHTTPSConnectionPool(_CancellablePoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CancellableHTTPSConnection
+
+
+class CancellableAdapter(HTTPAdapter):
+    """HTTPAdapter whose requests are aborted when the calling CancelToken is cancelled."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CancellableHTTPConnectionPool,
+            "https": _CancellableHTTPSConnectionPool,
+        }
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            with span("http.request", method=request.method, url=request.url) as http_span:
+                response = super().send(request, stream=stream, **kwargs)
+                status = str(response.status_code)
+                if not stream:
+                    # Session.send would read the body next; read it here so the timing covers it
+                    UPSTREAM_BYTES.inc(len(response.content))
+                    http_span.set(status=response.status_code, bytes=len(response.content))
+                return response
+        finally:
+            UPSTREAM_SECONDS.observe(time.perf_counter() - start)
+            UPSTREAM_REQUESTS.labels(status).inc()
+
+
+def _call(token: CancelToken, fn: Callable[..., T], args: tuple, submitted_ns: Optional[int] = None) -> T:
+    _local.token = token
+    try:
+        token.check()
+        with span("executor.run", fn=getattr(fn, "__name__", None)) as run_span:
+            if submitted_ns is not None:
+                queued_ns = time.perf_counter_ns() - submitted_ns
+                EXECUTOR_QUEUE_SECONDS.observe(queued_ns / 1e9)
+                run_span.set(queued_us=queued_ns // 1000)
+            with profile_thread():
+                return fn(*args)
+    finally:
+        _local.token = None
+        token._finish()
+
+
+async def run_cancellable(fn: Callable[..., T], *args: Any, token: Optional[CancelToken] = None) -> T:
+    """Run ``fn(*args)`` in the default executor, aborting its HTTP requests if cancelled.
+
+    Pass ``token`` to be able to cancel the call from elsewhere as well.
+    """
+    token = token or CancelToken()
+    loop = asyncio.get_running_loop()
+    # Run in a copy of this context so that spans in the thread carry the request ID
+    context = contextvars.copy_context()
+    try:
+        return await loop.run_in_executor(None, context.run, _call, token, fn, args, time.perf_counter_ns())
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
@@ -0,0 +1,140 @@
+"""
+UniProt entry caches for uniPROscope MCP Client: in-process and cross-process.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class MemoryEntryCache:
+    """
+    In-process LRU cache of UniProt entries with a size bound and a TTL.
+
+    The Bridge lives as long as the server process and is shared by every
+    session, so its entries are capped at ``max_size`` (least recently used
+    first out) and each expires ``ttl`` seconds after it was stored.
+    """
+
+    def __init__(self, max_size: int = 2048, ttl: Optional[float] = 86400.0):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for ``key``, or None if absent or expired."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def put(self, key: str, entry: Dict[str, Any], age: float = 0.0) -> None:
+        """Store ``entry``; ``age`` is how many seconds ago it was fetched, counted against the TTL."""
+        expires_at = time.monotonic() + self.ttl - age if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+class SQLiteEntryStore:
+    """
+    UniProt entries cached in a SQLite database shared by worker processes.
+
+    The database runs in WAL mode, so any number of workers read concurrently
+    while one writes, and an entry fetched by one worker is served to all the
+    others without another UniProt request. Connections are opened lazily per
+    process and thread, which keeps the store safe to create before forking.
+
+    Entries older than ``max_age`` seconds are not served, and are deleted
+    whenever an entry is stored and when the store is flushed.
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = None):
+        self.path = str(Path(path).expanduser())
+        self.max_age = max_age
+        self._local = threading.local()
+
+        # Create the schema on a throwaway connection: a connection must not be
+        # carried across fork() into worker processes.
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, entry TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_fetched_at ON entries (fetched_at)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def flush(self) -> None:
+        """Delete expired entries and checkpoint the write-ahead log into the database file."""
+        conn = sqlite3.connect(self.path, timeout=30.0)
+        try:
+            self._prune(conn)
+            conn.commit()
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        if self.max_age is not None:
+            conn.execute("DELETE FROM entries WHERE fetched_at < ?", (time.time() - self.max_age,))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, or None if absent or expired."""
+        found = self.get_with_age(key)
+        return found[0] if found is not None else None
+
+    def get_with_age(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Return the cached entry for ``key`` and its age in seconds, or None if absent or expired."""
+        row = self._connection().execute(
+            "SELECT entry, fetched_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        age = max(time.time() - row[1], 0.0)
+        if self.max_age is not None and age > self.max_age:
+            return None
+        return json.loads(row[0]), age
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, entry, fetched_at) VALUES (?, ?, ?)",
+            (key, json.dumps(entry, separators=(",", ":")), time.time()),
+        )
+        self._prune(conn)
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,199 @@
+"""
+Columnar bulk export of UniProt entries for uniPROscope MCP Client.
+"""
+
+import csv
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Long-format tables: (column name, arrow type name) per table.
+TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "scalars": [
+        ("gene", "string"), ("uniprot_id", "string"), ("entry_name", "string"),
+        ("protein_name", "string"), ("organism", "string"),
+        ("sequence_length", "int64"), ("mass", "int64"),
+    ],
+    "go": [("gene", "string"), ("uniprot_id", "string"), ("go_id", "string"), ("go_term", "string")],
+    "locations": [("gene", "string"), ("uniprot_id", "string"), ("location", "string")],
+    "interactions": [("gene", "string"), ("uniprot_id", "string"), ("interactor", "string")],
+}
+
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "tsv": ".tsv"}
+
+
+def entry_rows(gene: str, entry: Dict[str, Any]) -> Dict[str, List[tuple]]:
+    """Flatten one UniProt entry into rows for every export table."""
+    accession = entry.get("primaryAccession")
+    sequence = entry.get("sequence", {})
+    rows: Dict[str, List[tuple]] = {
+        "scalars": [(
+            gene,
+            accession,
+            entry.get("uniProtkbId"),
+            entry.get("proteinDescription", {}).get("recommendedName", {}).get("fullName", {}).get("value"),
+            entry.get("organism", {}).get("scientificName"),
+            sequence.get("length"),
+            sequence.get("mass"),
+        )],
+        "go": [],
+        "locations": [],
+        "interactions": [],
+    }
+    for ref in entry.get("uniProtKBCrossReferences", []):
+        if ref.get("database") == "GO":
+            for prop in ref.get("properties", []):
+                if prop.get("key") == "GoTerm":
+                    rows["go"].append((gene, accession, ref.get("id"), prop.get("value")))
+    for comment in entry.get("comments", []):
+        if comment.get("commentType") == "SUBCELLULAR LOCATION":
+            for loc in comment.get("subcellularLocations", []):
+                val = loc.get("location", {}).get("value")
+                if val:
+                    rows["locations"].append((gene, accession, val))
+        elif comment.get("commentType") == "INTERACTION":
+            for interactor in comment.get("interactions", []):
+                interactor_id = interactor.get("interactantTwo", {}).get("uniProtKBAccession")
+                if interactor_id:
+                    rows["interactions"].append((gene, accession, interactor_id))
+    return rows
+
+
+class _TableWriter:
+    """Buffers rows for one table and writes them out every ``chunk_size`` rows."""
+
+    def __init__(self, name: str, path: Path, fmt: str, chunk_size: int):
+        self.name = name
+        self.path = path
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.columns = TABLES[name]
+        self.rows = 0
+        self._buffer: List[tuple] = []
+
+        if fmt == "tsv":
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._file, delimiter="\t", lineterminator="\n")
+            self._csv.writerow([column for column, _ in self.columns])
+        else:
+            import pyarrow as pa
+            import pyarrow.ipc
+            import pyarrow.parquet
+
+            self._schema = pa.schema([(column, getattr(pa, kind)()) for column, kind in self.columns])
+            if fmt == "parquet":
+                self._writer = pyarrow.parquet.ParquetWriter(str(path), self._schema)
+            else:
+                self._writer = pyarrow.ipc.new_file(str(path), self._schema)
+
+    def append(self, rows: Iterable[tuple]) -> None:
+        self._buffer.extend(rows)
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        if self.fmt == "tsv":
+            self._csv.writerows(self._buffer)
+        else:
+            import pyarrow as pa
+
+            columns = {column: list(values) for (column, _), values in zip(self.columns, zip(*self._buffer))}
+            self._writer.write_table(pa.Table.from_pydict(columns, schema=self._schema))
+        self.rows += len(self._buffer)
+        self._buffer = []
+
+    def close(self) -> None:
+        self.flush()
+        if self.fmt == "tsv":
+            self._file.close()
+        else:
+            self._writer.close()
+
+
+def export_directory(root: str, path: str) -> Path:
+    """
+    Resolve ``path`` as a directory under the export root ``root``.
+
+    Raises ValueError for absolute paths, ``~`` or ``..`` components, and
+    paths that leave the root through a symlink.
+    """
+    base = Path(root).expanduser().resolve()
+    relative = Path(path)
+    if relative.is_absolute() or relative.drive or ".." in relative.parts or path.startswith("~"):
+        raise ValueError(f"Export path '{path}' must be a relative path under the export directory")
+    directory = (base / relative).resolve()
+    if directory != base and base not in directory.parents:
+        raise ValueError(f"Export path '{path}' leaves the export directory")
+    return directory
+
+
+def write_tables(
+    entries: Iterable[Tuple[str, Dict[str, Any]]],
+    path: str,
+    fmt: str = "parquet",
+    chunk_size: int = 10000,
+    root: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Stream ``(gene, entry)`` pairs into one column-oriented file per table
+    under the directory ``path``. At most ``chunk_size`` rows per table are
+    held in memory at a time. Returns file locations and row counts only.
+
+    With ``root`` set, ``path`` is confined to that directory (see
+    export_directory) and existing symlinks are not written through.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'; expected one of {sorted(FORMATS)}")
+    if fmt != "tsv":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                f"Exporting to {fmt} requires pyarrow: pip install 'Uniport_MCP_Client[export]'"
+            ) from None
+
+    if root is None:
+        directory = Path(path).expanduser().resolve()
+    else:
+        directory = export_directory(root, path)
+    os.makedirs(directory, exist_ok=True)
+    files = {name: directory / f"{name}{FORMATS[fmt]}" for name in TABLES}
+    if root is not None:
+        linked = [file.name for file in files.values() if file.is_symlink()]
+        if linked:
+            raise ValueError(f"Refusing to export through symlinks: {', '.join(linked)}")
+
+    writers: Dict[str, _TableWriter] = {}
+    n_entries = 0
+    with ExitStack() as stack:
+        # Writers already opened are closed if a later one fails to open
+        for name, file in files.items():
+            writers[name] = _TableWriter(name, file, fmt, chunk_size)
+            stack.callback(writers[name].close)
+        for gene, entry in entries:
+            n_entries += 1
+            for name, rows in entry_rows(gene, entry).items():
+                writers[name].append(rows)
+
+    return {
+        "path": str(directory),
+        "uri": directory.as_uri(),
+        "format": fmt,
+        "entries": n_entries,
+        "tables": {
+            name: {"file": writer.path.name, "rows": writer.rows}
+            for name, writer in writers.items()
+        },
+    }
+
+
+def gene_name(entry: Dict[str, Any]) -> Optional[str]:
+    """Primary gene name of an entry, if any."""
+    for gene in entry.get("genes", []):
+        value = gene.get("geneName", {}).get("value")
+        if value:
+            return value
+    return None
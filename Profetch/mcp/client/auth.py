@@ -20,6 +20,7 @@ import httpx
 from pydantic import BaseModel, Field, ValidationError
 
 from mcp.client.streamable_http import MCP_PROTOCOL_VERSION
+from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
 from mcp.shared.auth import (
     OAuthClientInformationFull,
     OAuthClientMetadata,
@@ -103,6 +104,10 @@ class OAuthContext:
     # Token management
     current_tokens: OAuthToken | None = None
     token_expiry_time: float | None = None
+    token_refresh_time: float | None = None
+
+    # Refresh up to this many seconds (at most a tenth of the lifetime) before expiry
+    refresh_margin: float = 60.0
 
     # State
     lock: anyio.Lock = field(default_factory=anyio.Lock)
@@ -120,8 +125,10 @@ class OAuthContext:
         """Update token expiry time."""
         if token.expires_in:
             self.token_expiry_time = time.time() + token.expires_in
+            self.token_refresh_time = self.token_expiry_time - min(self.refresh_margin, token.expires_in / 10)
         else:
             self.token_expiry_time = None
+            self.token_refresh_time = None
 
     def is_token_valid(self) -> bool:
         """Check if current token is valid."""
@@ -131,6 +138,10 @@ class OAuthContext:
             and (not self.token_expiry_time or time.time() <= self.token_expiry_time)
         )
 
+    def is_token_current(self) -> bool:
+        """Check if current token is valid and not yet due for refresh."""
+        return self.is_token_valid() and (not self.token_refresh_time or time.time() < self.token_refresh_time)
+
     def can_refresh_token(self) -> bool:
         """Check if token can be refreshed."""
         return bool(self.current_tokens and self.current_tokens.refresh_token and self.client_info)
@@ -139,6 +150,7 @@ class OAuthContext:
         """Clear current tokens."""
         self.current_tokens = None
         self.token_expiry_time = None
+        self.token_refresh_time = None
 
     def get_resource_url(self) -> str:
         """Get resource URL for RFC 8707.
@@ -191,8 +203,15 @@ class OAuthClientProvider(httpx.Auth):
         redirect_handler: Callable[[str], Awaitable[None]],
         callback_handler: Callable[[], Awaitable[tuple[str, str | None]]],
         timeout: float = 300.0,
+        refresh_margin: float = 60.0,
+        httpx_client_factory: McpHttpClientFactory = create_mcp_http_client,
     ):
-        """Initialize OAuth2 authentication."""
+        """Initialize OAuth2 authentication.
+
+        Tokens are refreshed refresh_margin seconds before they expire, using
+        a client from httpx_client_factory, so a failed early refresh leaves
+        the request it ran for to go ahead with the current token.
+        """
         self.context = OAuthContext(
             server_url=server_url,
             client_metadata=client_metadata,
@@ -200,7 +219,9 @@ class OAuthClientProvider(httpx.Auth):
             redirect_handler=redirect_handler,
             callback_handler=callback_handler,
             timeout=timeout,
+            refresh_margin=refresh_margin,
         )
+        self._httpx_client_factory = httpx_client_factory
         self._initialized = False
 
     async def _discover_protected_resource(self) -> httpx.Request:
@@ -469,6 +490,48 @@ class OAuthClientProvider(httpx.Auth):
             self.context.clear_tokens()
             return False
 
+    async def _refresh_token_early(self) -> None:
+        """Refresh a token that is due for refresh but has not expired yet.
+
+        The refresh is sent on its own client rather than yielded, so that a
+        network error does not fail the request it runs for. Unless the token
+        endpoint rejects the client with a 401, a failed refresh keeps the
+        current token, and the next attempt waits half its remaining lifetime.
+        """
+        refresh_request = await self._refresh_token()
+        try:
+            async with self._httpx_client_factory() as client:
+                response = await client.send(refresh_request)
+                content = await response.aread()
+        except httpx.HTTPError as e:
+            logger.warning(f"Early token refresh failed: {e!r}")
+            self._defer_token_refresh()
+            return
+
+        if response.status_code == 401:
+            logger.warning("Early token refresh rejected: 401")
+            self.context.clear_tokens()
+            return
+        if response.status_code != 200:
+            logger.warning(f"Early token refresh failed: {response.status_code}")
+            self._defer_token_refresh()
+            return
+        try:
+            token_response = OAuthToken.model_validate_json(content)
+        except ValidationError:
+            logger.exception("Invalid refresh response")
+            self._defer_token_refresh()
+            return
+
+        self.context.current_tokens = token_response
+        self.context.update_token_expiry(token_response)
+        await self.context.storage.set_tokens(token_response)
+
+    def _defer_token_refresh(self) -> None:
+        if self.context.token_expiry_time is not None:
+            now = time.time()
+            self.context.token_refresh_time = now + max(self.context.token_expiry_time - now, 0) / 2
+
     async def _initialize(self) -> None:
         """Load stored tokens and client info."""
         self.context.current_tokens = await self.context.storage.get_tokens()
@@ -481,100 +544,130 @@ class OAuthClientProvider(httpx.Auth):
             request.headers["Authorization"] = f"Bearer {self.context.current_tokens.access_token}"
 
     async def async_auth_flow(self, request: httpx.Request) -> AsyncGenerator[httpx.Request, httpx.Response]:
-        """HTTPX auth flow integration."""
-        async with self.context.lock:
-            if not self._initialized:
-                await self._initialize()
-
-            # Capture protocol version from request headers
-            self.context.protocol_version = request.headers.get(MCP_PROTOCOL_VERSION)
-
-            # Perform OAuth flow if not authenticated
-            if not self.context.is_token_valid():
-                try:
-                    # OAuth flow must be inline due to generator constraints
-                    # Step 1: Discover protected resource metadata (spec revision 2025-06-18)
-                    discovery_request = await self._discover_protected_resource()
-                    discovery_response = yield discovery_request
-                    await self._handle_protected_resource_response(discovery_response)
-
-                    # Step 2: Discover OAuth metadata (with fallback for legacy servers)
-                    oauth_request = await self._discover_oauth_metadata()
-                    oauth_response = yield oauth_request
-                    handled = await self._handle_oauth_metadata_response(oauth_response, is_fallback=False)
-
-                    # If path-aware discovery failed with 404, try fallback to root
-                    if not handled:
-                        fallback_request = await self._discover_oauth_metadata_fallback()
-                        fallback_response = yield fallback_request
-                        await self._handle_oauth_metadata_response(fallback_response, is_fallback=True)
-
-                    # Step 3: Register client if needed
-                    registration_request = await self._register_client()
-                    if registration_request:
-                        registration_response = yield registration_request
-                        await self._handle_registration_response(registration_response)
-
-                    # Step 4: Perform authorization
-                    auth_code, code_verifier = await self._perform_authorization()
-
-                    # Step 5: Exchange authorization code for tokens
-                    token_request = await self._exchange_token(auth_code, code_verifier)
-                    token_response = yield token_request
-                    await self._handle_token_response(token_response)
-                except Exception:
-                    logger.exception("OAuth flow error")
-                    raise
-
-            # Add authorization header and make request
-            self._add_auth_header(request)
-            response = yield request
-
-            # Handle 401 responses
-            if response.status_code == 401 and self.context.can_refresh_token():
-                # Try to refresh token
-                refresh_request = await self._refresh_token()
-                refresh_response = yield refresh_request
-
-                if await self._handle_refresh_response(refresh_response):
-                    # Retry original request with new token
-                    self._add_auth_header(request)
-                    yield request
-                else:
-                    # Refresh failed, need full re-authentication
-                    self._initialized = False
-
-                    # OAuth flow must be inline due to generator constraints
-                    # Step 1: Discover protected resource metadata (spec revision 2025-06-18)
-                    discovery_request = await self._discover_protected_resource()
-                    discovery_response = yield discovery_request
-                    await self._handle_protected_resource_response(discovery_response)
-
-                    # Step 2: Discover OAuth metadata (with fallback for legacy servers)
-                    oauth_request = await self._discover_oauth_metadata()
-                    oauth_response = yield oauth_request
-                    handled = await self._handle_oauth_metadata_response(oauth_response, is_fallback=False)
-
-                    # If path-aware discovery failed with 404, try fallback to root
-                    if not handled:
-                        fallback_request = await self._discover_oauth_metadata_fallback()
-                        fallback_response = yield fallback_request
-                        await self._handle_oauth_metadata_response(fallback_response, is_fallback=True)
-
-                    # Step 3: Register client if needed
-                    registration_request = await self._register_client()
-                    if registration_request:
-                        registration_response = yield registration_request
-                        await self._handle_registration_response(registration_response)
-
-                    # Step 4: Perform authorization
-                    auth_code, code_verifier = await self._perform_authorization()
-
-                    # Step 5: Exchange authorization code for tokens
-                    token_request = await self._exchange_token(auth_code, code_verifier)
-                    token_response = yield token_request
-                    await self._handle_token_response(token_response)
-
-                    # Retry with new tokens
-                    self._add_auth_header(request)
-                    yield request
+        """HTTPX auth flow integration.
+
+        The lock is only held to load, refresh or obtain tokens, so requests
+        made with a current token run concurrently. A caller that finds the
+        token due for refresh refreshes it; others keep using the token until
+        it expires, or wait on the lock and then reuse the new one, so
+        concurrent callers share one refresh. Tokens are only cleared when a
+        refresh fails after they expired or is rejected with a 401.
+        """
+        # Capture protocol version from request headers
+        self.context.protocol_version = request.headers.get(MCP_PROTOCOL_VERSION)
+
+        # While another caller refreshes, a token that has not expired yet is still usable
+        refreshing = self._initialized and self.context.lock.locked() and self.context.is_token_valid()
+        if not refreshing and (not self._initialized or not self.context.is_token_current()):
+            async with self.context.lock:
+                if not self._initialized:
+                    await self._initialize()
+
+                # Refresh shortly before expiry, unless a caller we waited on already has
+                if not self.context.is_token_current() and self.context.can_refresh_token():
+                    if self.context.is_token_valid():
+                        await self._refresh_token_early()
+                    else:
+                        refresh_request = await self._refresh_token()
+                        refresh_response = yield refresh_request
+                        await self._handle_refresh_response(refresh_response)
+
+                # Perform OAuth flow if not authenticated
+                if not self.context.is_token_valid():
+                    try:
+                        # OAuth flow must be inline due to generator constraints
+                        # Step 1: Discover protected resource metadata (spec revision 2025-06-18)
+                        discovery_request = await self._discover_protected_resource()
+                        discovery_response = yield discovery_request
+                        await self._handle_protected_resource_response(discovery_response)
+
+                        # Step 2: Discover OAuth metadata (with fallback for legacy servers)
+                        oauth_request = await self._discover_oauth_metadata()
+                        oauth_response = yield oauth_request
+                        handled = await self._handle_oauth_metadata_response(oauth_response, is_fallback=False)
+
+                        # If path-aware discovery failed with 404, try fallback to root
+                        if not handled:
+                            fallback_request = await self._discover_oauth_metadata_fallback()
+                            fallback_response = yield fallback_request
+                            await self._handle_oauth_metadata_response(fallback_response, is_fallback=True)
+
+                        # Step 3: Register client if needed
+                        registration_request = await self._register_client()
+                        if registration_request:
+                            registration_response = yield registration_request
+                            await self._handle_registration_response(registration_response)
+
+                        # Step 4: Perform authorization
+                        auth_code, code_verifier = await self._perform_authorization()
+
+                        # Step 5: Exchange authorization code for tokens
+                        token_request = await self._exchange_token(auth_code, code_verifier)
+                        token_response = yield token_request
+                        await self._handle_token_response(token_response)
+                    except Exception:
+                        logger.exception("OAuth flow error")
+                        raise
+
+        # Add authorization header and make request
+        self._add_auth_header(request)
+        response = yield request
+
+        # Handle 401 responses
+        if response.status_code == 401:
+            async with self.context.lock:
+                rejected_authorization = request.headers.get("Authorization")
+                self._add_auth_header(request)
+                # Another request may have replaced the rejected token while we waited
+                retry = self.context.is_token_valid() and request.headers.get("Authorization") != rejected_authorization
+                if not retry and self.context.can_refresh_token():
+                    # Try to refresh token
+                    refresh_request = await self._refresh_token()
+                    refresh_response = yield refresh_request
+
+                    if await self._handle_refresh_response(refresh_response):
+                        # Retry original request with new token
+                        self._add_auth_header(request)
+                        retry = True
+                    else:
+                        # Refresh failed, need full re-authentication
+                        self._initialized = False
+
+                        # OAuth flow must be inline due to generator constraints
+                        # Step 1: Discover protected resource metadata (spec revision 2025-06-18)
+                        discovery_request = await self._discover_protected_resource()
+                        discovery_response = yield discovery_request
+                        await self._handle_protected_resource_response(discovery_response)
+
+                        # Step 2: Discover OAuth metadata (with fallback for legacy servers)
+                        oauth_request = await self._discover_oauth_metadata()
+                        oauth_response = yield oauth_request
+                        handled = await self._handle_oauth_metadata_response(oauth_response, is_fallback=False)
+
+                        # If path-aware discovery failed with 404, try fallback to root
+                        if not handled:
+                            fallback_request = await self._discover_oauth_metadata_fallback()
+                            fallback_response = yield fallback_request
+                            await self._handle_oauth_metadata_response(fallback_response, is_fallback=True)
+
+                        # Step 3: Register client if needed
+                        registration_request = await self._register_client()
+                        if registration_request:
+                            registration_response = yield registration_request
+                            await self._handle_registration_response(registration_response)
+
+                        # Step 4: Perform authorization
+                        auth_code, code_verifier = await self._perform_authorization()
+
+                        # Step 5: Exchange authorization code for tokens
+                        token_request = await self._exchange_token(auth_code, code_verifier)
+                        token_response = yield token_request
+                        await self._handle_token_response(token_response)
+
+                        # Retry with new tokens
+                        self._add_auth_header(request)
+                        retry = True
+
+            # Retry outside the lock so concurrent retries are not serialized
+            if retry:
+                yield request
@@ -0,0 +1,142 @@
+"""
+Client-side cache of tool call results.
+
+A ToolResultCache may be shared by many ClientSessions, so repeated calls
+with the same arguments are answered locally instead of crossing the
+transport. Entries are keyed by (server namespace, tool name, canonical
+arguments) and only tools whose annotations declare them read-only are
+cached; an idempotent tool may still change state on its first call.
+Entries expire after a TTL and are evicted least recently used once the
+entry or byte bounds are reached. Sessions drop a server's entries when it
+reports changed tools or resources.
+
+The namespace must identify the server itself, such as its URL or command
+line; a server's name and version are not unique across deployments.
+
+Example:
+    cache = ToolResultCache(ttl=600, max_entries=10_000)
+    async with ClientSession(read, write, result_cache=cache, result_cache_namespace=url) as session:
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import mcp.types as types
+
+
+def is_cacheable(tool: types.Tool) -> bool:
+    """Whether a tool's annotations allow its results to be reused."""
+    annotations = tool.annotations
+    return annotations is not None and bool(annotations.readOnlyHint)
+
+
+def canonical_arguments(arguments: dict[str, Any] | None) -> str:
+    """Serialize arguments so that equal argument dicts produce equal keys."""
+    return json.dumps(arguments or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+@dataclass
+class _Entry:
+    result: types.CallToolResult
+    expires_at: float
+    nbytes: int
+
+
+@dataclass
+class ResultCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class ToolResultCache:
+    """LRU cache of CallToolResults with a TTL and entry and byte bounds.
+
+    Cached results are returned as-is, not copied, so callers must not
+    modify them.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 1024, max_bytes: int | None = 64 << 20):
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = ResultCacheStats()
+        self._entries: OrderedDict[tuple[str, str, str], _Entry] = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def get(self, namespace: str, tool: str, arguments: dict[str, Any] | None) -> types.CallToolResult | None:
+        key = (namespace, tool, canonical_arguments(arguments))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.result
+
+    def put(
+        self,
+        namespace: str,
+        tool: str,
+        arguments: dict[str, Any] | None,
+        result: types.CallToolResult,
+    ) -> None:
+        if result.isError:
+            return
+        nbytes = len(result.model_dump_json(by_alias=True, exclude_none=True))
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        key = (namespace, tool, canonical_arguments(arguments))
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(result, time.monotonic() + self.ttl, nbytes)
+        self._nbytes += nbytes
+        self.stats.stores += 1
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._nbytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self.stats.evictions += 1
+
+    def invalidate(self, namespace: str | None = None, tool: str | None = None) -> int:
+        """Drop entries for a server namespace, optionally only one tool; all if no namespace."""
+        if namespace is None:
+            keys = list(self._entries)
+        else:
+            keys = [key for key in self._entries if key[0] == namespace and (tool is None or key[1] == tool)]
+        for key in keys:
+            self._remove(key)
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _remove(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._nbytes -= entry.nbytes
@@ -1,13 +1,19 @@
 import logging
+import random
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any, Protocol
 
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from jsonschema import SchemaError, ValidationError, validate
+from jsonschema import SchemaError, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from pydantic import AnyUrl, TypeAdapter
 
 import mcp.types as types
+from mcp.client.result_cache import ToolResultCache, is_cacheable
 from mcp.shared.context import RequestContext
 from mcp.shared.message import SessionMessage
 from mcp.shared.session import BaseSession, ProgressFnT, RequestResponder
@@ -118,7 +124,14 @@ class ClientSession(
         logging_callback: LoggingFnT | None = None,
         message_handler: MessageHandlerFnT | None = None,
         client_info: types.Implementation | None = None,
+        validation_sample_rate: float = 1.0,
+        result_cache: ToolResultCache | None = None,
+        result_cache_namespace: str | None = None,
     ) -> None:
+        if not 0.0 <= validation_sample_rate <= 1.0:
+            raise ValueError(f"validation_sample_rate must be between 0 and 1, got {validation_sample_rate}")
+        if result_cache is not None and not result_cache_namespace:
+            raise ValueError("result_cache requires a result_cache_namespace identifying the server")
         super().__init__(
             read_stream,
             write_stream,
@@ -133,6 +146,18 @@ class ClientSession(
         self._logging_callback = logging_callback or _default_logging_callback
         self._message_handler = message_handler or _default_message_handler
         self._tool_output_schemas: dict[str, dict[str, Any] | None] = {}
+        # Compiled once per tool in list_tools; a SchemaError is kept so that
+        # calls to that tool report it.
+        self._tool_validators: dict[str, Validator | SchemaError] = {}
+        # Fraction of structured tool results checked against their output schema;
+        # below 1.0 trades validation coverage for throughput on busy clients.
+        self._validation_sample_rate = validation_sample_rate
+        # Results of read-only tools are served from result_cache, which may
+        # be shared by sessions to the same server. The namespace keys this
+        # server's entries, so it must name its endpoint, not its serverInfo.
+        self._result_cache = result_cache
+        self._result_cache_namespace = result_cache_namespace or ""
+        self._cacheable_tools: set[str] = set()
 
     async def initialize(self) -> types.InitializeResult:
         sampling = types.SamplingCapability() if self._sampling_callback is not _default_sampling_callback else None
@@ -288,7 +313,14 @@ class ClientSession(
         read_timeout_seconds: timedelta | None = None,
         progress_callback: ProgressFnT | None = None,
     ) -> types.CallToolResult:
-        """Send a tools/call request with optional progress callback support."""
+        """Send a tools/call request with optional progress callback support.
+
+        Results of read-only tools come from the result cache
+        when one was given and holds an unexpired result for these arguments.
+        """
+        cached = self._cached_tool_result(name, arguments)
+        if cached is not None:
+            return cached
 
         result = await self.send_request(
             types.ClientRequest(
@@ -307,9 +339,59 @@ class ClientSession(
 
         if not result.isError:
             await self._validate_tool_result(name, result)
+            self._cache_tool_result(name, arguments, result)
 
         return result
 
+    async def call_tools_batch(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any] | None]],
+        read_timeout_seconds: timedelta | None = None,
+    ) -> list[types.CallToolResult | types.ErrorData]:
+        """Send several tools/call requests as one JSON-RPC batch.
+
+        ``calls`` holds ``(name, arguments)`` pairs. Results come back in the
+        same order; a call the server rejected yields its ErrorData. Calls
+        answered by the result cache are left out of the batch.
+        """
+        results: list[types.CallToolResult | types.ErrorData | None] = [
+            self._cached_tool_result(name, arguments) for name, arguments in calls
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            fetched = await self.send_request_batch(
+                [
+                    types.ClientRequest(
+                        types.CallToolRequest(
+                            method="tools/call",
+                            params=types.CallToolRequestParams(name=calls[i][0], arguments=calls[i][1]),
+                        )
+                    )
+                    for i in pending
+                ],
+                types.CallToolResult,
+                request_read_timeout_seconds=read_timeout_seconds,
+            )
+            for i, result in zip(pending, fetched):
+                name, arguments = calls[i]
+                if isinstance(result, types.CallToolResult) and not result.isError:
+                    await self._validate_tool_result(name, result)
+                    self._cache_tool_result(name, arguments, result)
+                results[i] = result
+
+        return [result for result in results if result is not None]
+
+    def _cached_tool_result(self, name: str, arguments: dict[str, Any] | None) -> types.CallToolResult | None:
+        if self._result_cache is None or name not in self._cacheable_tools:
+            return None
+        return self._result_cache.get(self._result_cache_namespace, name, arguments)
+
+    def _cache_tool_result(self, name: str, arguments: dict[str, Any] | None, result: types.CallToolResult) -> None:
+        # Checked after validation, which may have just listed the tools.
+        if self._result_cache is None or name not in self._cacheable_tools:
+            return
+        self._result_cache.put(self._result_cache_namespace, name, arguments, result)
+
     async def _validate_tool_result(self, name: str, result: types.CallToolResult) -> None:
         """Validate the structured content of a tool result against its output schema."""
         if name not in self._tool_output_schemas:
@@ -325,12 +407,16 @@ class ClientSession(
         if output_schema is not None:
             if result.structuredContent is None:
                 raise RuntimeError(f"Tool {name} has an output schema but did not return structured content")
-            try:
-                validate(result.structuredContent, output_schema)
-            except ValidationError as e:
-                raise RuntimeError(f"Invalid structured content returned by tool {name}: {e}")
-            except SchemaError as e:
-                raise RuntimeError(f"Invalid schema for tool {name}: {e}")
+            if self._validation_sample_rate < 1.0 and random.random() >= self._validation_sample_rate:
+                return
+            validator = self._tool_validators.get(name)
+            if validator is None:
+                validator = self._tool_validators[name] = _compile_validator(output_schema)
+            if isinstance(validator, SchemaError):
+                raise RuntimeError(f"Invalid schema for tool {name}: {validator}")
+            if not validator.is_valid(result.structuredContent):
+                error: ValidationError | None = best_match(validator.iter_errors(result.structuredContent))
+                raise RuntimeError(f"Invalid structured content returned by tool {name}: {error}")
 
     async def list_prompts(self, cursor: str | None = None) -> types.ListPromptsResult:
         """Send a prompts/list request."""
@@ -396,7 +482,17 @@ class ClientSession(
         # Cache tool output schemas for future validation
         # Note: don't clear the cache, as we may be using a cursor
         for tool in result.tools:
-            self._tool_output_schemas[tool.name] = tool.outputSchema
+            schema = tool.outputSchema
+            if schema is None:
+                self._tool_validators.pop(tool.name, None)
+            elif tool.name not in self._tool_validators or self._tool_output_schemas.get(tool.name) != schema:
+                # Relisting a tool whose schema is unchanged keeps its compiled validator
+                self._tool_validators[tool.name] = _compile_validator(schema)
+            self._tool_output_schemas[tool.name] = schema
+            if is_cacheable(tool):
+                self._cacheable_tools.add(tool.name)
+            else:
+                self._cacheable_tools.discard(tool.name)
 
         return result
 
@@ -441,6 +537,10 @@ class ClientSession(
                 with responder:
                     return await responder.respond(types.ClientResult(root=types.EmptyResult()))
 
+    def _invalidate_result_cache(self) -> None:
+        if self._result_cache is not None:
+            self._result_cache.invalidate(self._result_cache_namespace)
+
     async def _handle_incoming(
         self,
         req: RequestResponder[types.ServerRequest, types.ClientResult] | types.ServerNotification | Exception,
@@ -454,5 +554,24 @@ class ClientSession(
         match notification.root:
             case types.LoggingMessageNotification(params=params):
                 await self._logging_callback(params)
+            case types.ToolListChangedNotification():
+                # Output schemas and annotations may have changed; the next call re-lists tools.
+                self._tool_output_schemas.clear()
+                self._tool_validators.clear()
+                self._cacheable_tools.clear()
+                self._invalidate_result_cache()
+            case types.ResourceUpdatedNotification() | types.ResourceListChangedNotification():
+                # Cached tool results may have been derived from the changed resources.
+                self._invalidate_result_cache()
             case _:
                 pass
+
+
+def _compile_validator(schema: dict[str, Any]) -> Validator | SchemaError:
+    """Build a reusable validator for an output schema, as jsonschema.validate would."""
+    cls = validator_for(schema)
+    try:
+        cls.check_schema(schema)
+    except SchemaError as e:
+        return e
+    return cls(schema)
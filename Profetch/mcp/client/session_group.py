@@ -10,17 +10,19 @@ hook.
 
 import contextlib
 import logging
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import timedelta
 from types import TracebackType
 from typing import Any, TypeAlias
 
 import anyio
+from anyio.abc import TaskGroup, TaskStatus
 from pydantic import BaseModel
 from typing_extensions import Self
 
 import mcp
 from mcp import types
+from mcp.client.result_cache import ToolResultCache
 from mcp.client.sse import sse_client
 from mcp.client.stdio import StdioServerParameters
 from mcp.client.streamable_http import streamablehttp_client
@@ -81,6 +83,10 @@ class ClientSessionGroup:
                 await group.connect_to_server(server_param)
             ...
 
+        # Or connect to every server concurrently, giving each 10 seconds:
+        async with ClientSessionGroup() as group:
+            sessions = await group.connect_all(server_params, timeout=10)
+
     """
 
     class _ComponentNames(BaseModel):
@@ -101,16 +107,25 @@ class ClientSessionGroup:
     _exit_stack: contextlib.AsyncExitStack
     _session_exit_stacks: dict[mcp.ClientSession, contextlib.AsyncExitStack]
 
+    # Runs the sessions opened by connect_all. Transports must be closed by the
+    # task that opened them, so each of those sessions lives in its own task.
+    _task_group: TaskGroup | None
+
     # Optional fn consuming (component_name, serverInfo) for custom names.
     # This is provide a means to mitigate naming conflicts across servers.
     # Example: (tool_name, serverInfo) => "{result.serverInfo.name}.{tool_name}"
     _ComponentNameHook: TypeAlias = Callable[[str, types.Implementation], str]
     _component_name_hook: _ComponentNameHook | None
 
+    # Optional cache of read-only tool results, shared by every
+    # session the group connects, keyed per server endpoint.
+    _result_cache: ToolResultCache | None
+
     def __init__(
         self,
         exit_stack: contextlib.AsyncExitStack | None = None,
         component_name_hook: _ComponentNameHook | None = None,
+        result_cache: ToolResultCache | None = None,
     ) -> None:
         """Initializes the MCP client."""
 
@@ -127,12 +142,17 @@ class ClientSessionGroup:
             self._exit_stack = exit_stack
             self._owns_exit_stack = False
         self._session_exit_stacks = {}
+        self._task_group = None
         self._component_name_hook = component_name_hook
+        self._result_cache = result_cache
 
     async def __aenter__(self) -> Self:
         # Enter the exit stack only if we created it ourselves
         if self._owns_exit_stack:
             await self._exit_stack.__aenter__()
+        # Entered here rather than in connect_all, so that a cancel scope the
+        # caller puts around connect_all is not left with a task group open in it.
+        self._task_group = await self._exit_stack.enter_async_context(anyio.create_task_group())
         return self
 
     async def __aexit__(
@@ -230,6 +250,77 @@ class ClientSessionGroup:
         server_info, session = await self._establish_session(server_params)
         return await self.connect_with_session(server_info, session)
 
+    async def connect_all(
+        self,
+        server_params: Sequence[ServerParameters],
+        timeout: float | None = None,
+    ) -> list[mcp.ClientSession | Exception]:
+        """Connects to several MCP servers concurrently.
+
+        Each server gets ``timeout`` seconds to connect and list its components.
+        A server that fails or times out does not hold up or break the others:
+        its slot in the returned list, which follows ``server_params``, holds
+        the exception instead of a session.
+
+        The group must have been entered with ``async with``.
+        """
+        task_group = self._task_group
+        if task_group is None:
+            raise RuntimeError("connect_all requires entering the ClientSessionGroup with 'async with'")
+        results: list[mcp.ClientSession | Exception | None] = [None] * len(server_params)
+
+        async def connect(index: int, params: ServerParameters) -> None:
+            session: mcp.ClientSession | None = None
+            try:
+                with anyio.fail_after(timeout):
+                    server_info, session = await task_group.start(self._run_session, params)
+                    await self.connect_with_session(server_info, session)
+                results[index] = session
+            except Exception as err:
+                logging.warning(f"Could not connect to MCP server {_endpoint(params)}: {err!r}")
+                if session is not None and session in self._session_exit_stacks:
+                    await self.disconnect_from_server(session)
+                results[index] = err
+
+        async with anyio.create_task_group() as tg:
+            for index, params in enumerate(server_params):
+                tg.start_soon(connect, index, params)
+
+        return [result for result in results if result is not None]
+
+    async def _run_session(
+        self,
+        server_params: ServerParameters,
+        *,
+        task_status: TaskStatus[tuple[types.Implementation, mcp.ClientSession]],
+    ) -> None:
+        """Hold a session open in its own task until its exit stack is closed."""
+        stop = anyio.Event()
+        done = anyio.Event()
+
+        async def close() -> None:
+            stop.set()
+            await done.wait()
+
+        started = False
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                server_info, session = await self._open_session(stack, server_params)
+                session_stack = contextlib.AsyncExitStack()
+                session_stack.push_async_callback(close)
+                self._session_exit_stacks[session] = session_stack
+                await self._exit_stack.enter_async_context(session_stack)
+                started = True
+                task_status.started((server_info, session))
+                await stop.wait()
+        except Exception:
+            if not started:
+                raise
+            # Not propagated: that would tear down the whole group.
+            logging.exception(f"MCP server connection {_endpoint(server_params)} failed")
+        finally:
+            done.set()
+
     async def _establish_session(
         self, server_params: ServerParameters
     ) -> tuple[types.Implementation, mcp.ClientSession]:
@@ -237,30 +328,7 @@ class ClientSessionGroup:
 
         session_stack = contextlib.AsyncExitStack()
         try:
-            # Create read and write streams that facilitate io with the server.
-            if isinstance(server_params, StdioServerParameters):
-                client = mcp.stdio_client(server_params)
-                read, write = await session_stack.enter_async_context(client)
-            elif isinstance(server_params, SseServerParameters):
-                client = sse_client(
-                    url=server_params.url,
-                    headers=server_params.headers,
-                    timeout=server_params.timeout,
-                    sse_read_timeout=server_params.sse_read_timeout,
-                )
-                read, write = await session_stack.enter_async_context(client)
-            else:
-                client = streamablehttp_client(
-                    url=server_params.url,
-                    headers=server_params.headers,
-                    timeout=server_params.timeout,
-                    sse_read_timeout=server_params.sse_read_timeout,
-                    terminate_on_close=server_params.terminate_on_close,
-                )
-                read, write, _ = await session_stack.enter_async_context(client)
-
-            session = await session_stack.enter_async_context(mcp.ClientSession(read, write))
-            result = await session.initialize()
+            server_info, session = await self._open_session(session_stack, server_params)
 
             # Session successfully initialized.
             # Store its stack and register the stack with the main group stack.
@@ -269,13 +337,50 @@ class ClientSessionGroup:
             # main _exit_stack.
             await self._exit_stack.enter_async_context(session_stack)
 
-            return result.serverInfo, session
+            return server_info, session
         except Exception:
             # If anything during this setup fails, ensure the session-specific
             # stack is closed.
             await session_stack.aclose()
             raise
 
+    async def _open_session(
+        self, session_stack: contextlib.AsyncExitStack, server_params: ServerParameters
+    ) -> tuple[types.Implementation, mcp.ClientSession]:
+        """Open the transport and an initialized session on ``session_stack``."""
+        # Create read and write streams that facilitate io with the server.
+        if isinstance(server_params, StdioServerParameters):
+            client = mcp.stdio_client(server_params)
+            read, write = await session_stack.enter_async_context(client)
+        elif isinstance(server_params, SseServerParameters):
+            client = sse_client(
+                url=server_params.url,
+                headers=server_params.headers,
+                timeout=server_params.timeout,
+                sse_read_timeout=server_params.sse_read_timeout,
+            )
+            read, write = await session_stack.enter_async_context(client)
+        else:
+            client = streamablehttp_client(
+                url=server_params.url,
+                headers=server_params.headers,
+                timeout=server_params.timeout,
+                sse_read_timeout=server_params.sse_read_timeout,
+                terminate_on_close=server_params.terminate_on_close,
+            )
+            read, write, _ = await session_stack.enter_async_context(client)
+
+        session = await session_stack.enter_async_context(
+            mcp.ClientSession(
+                read,
+                write,
+                result_cache=self._result_cache,
+                result_cache_namespace=_endpoint(server_params),
+            )
+        )
+        result = await session.initialize()
+        return result.serverInfo, session
+
     async def _aggregate_components(self, server_info: types.Implementation, session: mcp.ClientSession) -> None:
         """Aggregates prompts, resources, and tools from a given session."""
 
@@ -291,36 +396,31 @@ class ClientSessionGroup:
         tools_temp: dict[str, types.Tool] = {}
         tool_to_session_temp: dict[str, mcp.ClientSession] = {}
 
-        # Query the server for its prompts and aggregate to list.
-        try:
-            prompts = (await session.list_prompts()).prompts
-            for prompt in prompts:
-                name = self._component_name(prompt.name, server_info)
-                prompts_temp[name] = prompt
-                component_names.prompts.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch prompts: {err}")
-
-        # Query the server for its resources and aggregate to list.
-        try:
-            resources = (await session.list_resources()).resources
-            for resource in resources:
-                name = self._component_name(resource.name, server_info)
-                resources_temp[name] = resource
-                component_names.resources.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch resources: {err}")
-
-        # Query the server for its tools and aggregate to list.
-        try:
-            tools = (await session.list_tools()).tools
-            for tool in tools:
-                name = self._component_name(tool.name, server_info)
-                tools_temp[name] = tool
-                tool_to_session_temp[name] = session
-                component_names.tools.add(name)
-        except McpError as err:
-            logging.warning(f"Could not fetch tools: {err}")
+        # Query the server for its prompts, resources and tools concurrently,
+        # following pagination cursors to the end.
+        prompts: list[types.Prompt] = []
+        resources: list[types.Resource] = []
+        tools: list[types.Tool] = []
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(_fetch_all, "prompts", session.list_prompts, prompts)
+            tg.start_soon(_fetch_all, "resources", session.list_resources, resources)
+            tg.start_soon(_fetch_all, "tools", session.list_tools, tools)
+
+        for prompt in prompts:
+            name = self._component_name(prompt.name, server_info)
+            prompts_temp[name] = prompt
+            component_names.prompts.add(name)
+
+        for resource in resources:
+            name = self._component_name(resource.name, server_info)
+            resources_temp[name] = resource
+            component_names.resources.add(name)
+
+        for tool in tools:
+            name = self._component_name(tool.name, server_info)
+            tools_temp[name] = tool
+            tool_to_session_temp[name] = session
+            component_names.tools.add(name)
 
         # Clean up exit stack for session if we couldn't retrieve anything
         # from the server.
@@ -364,3 +464,26 @@ class ClientSessionGroup:
         if self._component_name_hook:
             return self._component_name_hook(name, server_info)
         return name
+
+
+async def _fetch_all(kind: str, list_page: Callable[[str | None], Awaitable[Any]], items: list[Any]) -> None:
+    """Append every page of a list_* call to ``items``; log and stop on McpError."""
+    cursor: str | None = None
+    seen: set[str] = set()
+    try:
+        while True:
+            result = await list_page(cursor)
+            items.extend(getattr(result, kind))
+            cursor = result.nextCursor
+            if cursor is None or cursor in seen:
+                return
+            seen.add(cursor)
+    except McpError as err:
+        logging.warning(f"Could not fetch {kind}: {err}")
+
+
+def _endpoint(server_params: ServerParameters) -> str:
+    """Identify a server by how it is reached, for keying cached tool results."""
+    if isinstance(server_params, StdioServerParameters):
+        return " ".join([server_params.command, *server_params.args])
+    return server_params.url
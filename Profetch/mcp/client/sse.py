@@ -9,8 +9,8 @@ from anyio.abc import TaskStatus
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 from httpx_sse import aconnect_sse
 
-import mcp.types as types
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.batch import parse_messages
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -92,17 +92,15 @@ async def sse_client(
 
                                     case "message":
                                         try:
-                                            message = types.JSONRPCMessage.model_validate_json(  # noqa: E501
-                                                sse.data
-                                            )
-                                            logger.debug(f"Received server message: {message}")
+                                            messages = parse_messages(sse.data)
+                                            logger.debug(f"Received server messages: {messages}")
                                         except Exception as exc:
                                             logger.exception("Error parsing server message")
                                             await read_stream_writer.send(exc)
                                             continue
 
-                                        session_message = SessionMessage(message)
-                                        await read_stream_writer.send(session_message)
+                                        for message in messages:
+                                            await read_stream_writer.send(SessionMessage(message))
                                     case _:
                                         logger.warning(f"Unknown SSE event: {sse.event}")
                         except Exception as exc:
@@ -1,3 +1,4 @@
+import codecs
 import logging
 import os
 import sys
@@ -9,10 +10,8 @@ import anyio
 import anyio.lowlevel
 from anyio.abc import Process
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from anyio.streams.text import TextReceiveStream
 from pydantic import BaseModel, Field
 
-import mcp.types as types
 from mcp.os.posix.utilities import terminate_posix_process_tree
 from mcp.os.win32.utilities import (
     FallbackProcess,
@@ -20,6 +19,8 @@ from mcp.os.win32.utilities import (
     get_windows_executable_command,
     terminate_windows_process_tree,
 )
+from mcp.shared.batch import parse_messages
+from mcp.shared.framing import LineSplitter, drain_ready, encode_messages
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -135,29 +136,41 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
         await write_stream_reader.aclose()
         raise
 
+    # Lines are split as UTF-8 bytes and handed to pydantic as-is; any other
+    # encoding is transcoded chunk by chunk first.
+    is_utf8 = codecs.lookup(server.encoding).name == "utf-8" and server.encoding_error_handler == "strict"
+
     async def stdout_reader():
         assert process.stdout, "Opened process is missing stdout"
 
+        async def deliver(lines: list[bytes]) -> None:
+            for line in lines:
+                try:
+                    messages = parse_messages(line)
+                except Exception as exc:
+                    await read_stream_writer.send(exc)
+                    continue
+
+                for message in messages:
+                    await read_stream_writer.send(SessionMessage(message))
+
         try:
             async with read_stream_writer:
-                buffer = ""
-                async for chunk in TextReceiveStream(
-                    process.stdout,
-                    encoding=server.encoding,
-                    errors=server.encoding_error_handler,
-                ):
-                    lines = (buffer + chunk).split("\n")
-                    buffer = lines.pop()
-
-                    for line in lines:
-                        try:
-                            message = types.JSONRPCMessage.model_validate_json(line)
-                        except Exception as exc:
-                            await read_stream_writer.send(exc)
-                            continue
-
-                        session_message = SessionMessage(message)
-                        await read_stream_writer.send(session_message)
+                splitter = LineSplitter()
+                decoder = (
+                    None
+                    if is_utf8
+                    else codecs.getincrementaldecoder(server.encoding)(errors=server.encoding_error_handler)
+                )
+                async for chunk in process.stdout:
+                    if decoder is not None:
+                        chunk = decoder.decode(chunk).encode()
+                    await deliver(splitter.feed(chunk))
+                # A last message the server did not terminate with a newline
+                if decoder is not None:
+                    await deliver(splitter.feed(decoder.decode(b"", final=True).encode()))
+                if (tail := splitter.flush()) is not None:
+                    await deliver([tail])
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
@@ -167,13 +180,13 @@ async def stdio_client(server: StdioServerParameters, errlog: TextIO = sys.stder
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await process.stdin.send(
-                        (json + "\n").encode(
+                    data = encode_messages(drain_ready(write_stream_reader, session_message))
+                    if not is_utf8:
+                        data = data.decode().encode(
                             encoding=server.encoding,
                             errors=server.encoding_error_handler,
                         )
-                    )
+                    await process.stdin.send(data)
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
@@ -19,10 +19,12 @@ from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStre
 from httpx_sse import EventSource, ServerSentEvent, aconnect_sse
 
 from mcp.shared._httpx_utils import McpHttpClientFactory, create_mcp_http_client
+from mcp.shared.batch import parse_messages, request_ids
 from mcp.shared.message import ClientMessageMetadata, SessionMessage
 from mcp.types import (
     ErrorData,
     InitializeResult,
+    JSONRPCBatch,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCNotification,
@@ -115,11 +117,11 @@ class StreamableHTTPTransport:
             headers[MCP_PROTOCOL_VERSION] = self.protocol_version
         return headers
 
-    def _is_initialization_request(self, message: JSONRPCMessage) -> bool:
+    def _is_initialization_request(self, message: JSONRPCMessage | JSONRPCBatch) -> bool:
         """Check if the message is an initialization request."""
         return isinstance(message.root, JSONRPCRequest) and message.root.method == "initialize"
 
-    def _is_initialized_notification(self, message: JSONRPCMessage) -> bool:
+    def _is_initialized_notification(self, message: JSONRPCMessage | JSONRPCBatch) -> bool:
         """Check if the message is an initialized notification."""
         return isinstance(message.root, JSONRPCNotification) and message.root.method == "notifications/initialized"
 
@@ -156,30 +158,38 @@ class StreamableHTTPTransport:
         resumption_callback: Callable[[str], Awaitable[None]] | None = None,
         is_initialization: bool = False,
     ) -> bool:
-        """Handle an SSE event, returning True if the response is complete."""
+        """Handle an SSE event, returning True if the response is complete.
+
+        A batched POST is answered with a single event holding every response
+        of the batch, which also completes the stream.
+        """
         if sse.event == "message":
             try:
-                message = JSONRPCMessage.model_validate_json(sse.data)
-                logger.debug(f"SSE message: {message}")
+                messages = parse_messages(sse.data)
+                logger.debug(f"SSE messages: {messages}")
 
-                # Extract protocol version from initialization response
-                if is_initialization:
-                    self._maybe_extract_protocol_version_from_message(message)
+                is_complete = False
+                for message in messages:
+                    # Extract protocol version from initialization response
+                    if is_initialization:
+                        self._maybe_extract_protocol_version_from_message(message)
 
-                # If this is a response and we have original_request_id, replace it
-                if original_request_id is not None and isinstance(message.root, JSONRPCResponse | JSONRPCError):
-                    message.root.id = original_request_id
+                    is_response = isinstance(message.root, JSONRPCResponse | JSONRPCError)
+                    # If this is a response and we have original_request_id, replace it
+                    if original_request_id is not None and is_response:
+                        message.root.id = original_request_id
 
-                session_message = SessionMessage(message)
-                await read_stream_writer.send(session_message)
+                    session_message = SessionMessage(message)
+                    await read_stream_writer.send(session_message)
+                    is_complete = is_complete or is_response
 
                 # Call resumption token callback if we have an ID
                 if sse.id and resumption_callback:
                     await resumption_callback(sse.id)
 
-                # If this is a response or error return True indicating completion
+                # If this carried a response or error return True indicating completion
                 # Otherwise, return False to continue listening
-                return isinstance(message.root, JSONRPCResponse | JSONRPCError)
+                return is_complete
 
             except Exception as exc:
                 logger.exception("Error parsing SSE message")
@@ -267,10 +277,11 @@ class StreamableHTTPTransport:
                 return
 
             if response.status_code == 404:
-                if isinstance(message.root, JSONRPCRequest):
+                messages = message.root if isinstance(message, JSONRPCBatch) else [message]
+                for request_id in request_ids(messages):
                     await self._send_session_terminated_error(
                         ctx.read_stream_writer,
-                        message.root.id,
+                        request_id,
                     )
                 return
 
@@ -299,14 +310,13 @@ class StreamableHTTPTransport:
         """Handle JSON response from the server."""
         try:
             content = await response.aread()
-            message = JSONRPCMessage.model_validate_json(content)
-
-            # Extract protocol version from initialization response
-            if is_initialization:
-                self._maybe_extract_protocol_version_from_message(message)
+            for message in parse_messages(content):
+                # Extract protocol version from initialization response
+                if is_initialization:
+                    self._maybe_extract_protocol_version_from_message(message)
 
-            session_message = SessionMessage(message)
-            await read_stream_writer.send(session_message)
+                session_message = SessionMessage(message)
+                await read_stream_writer.send(session_message)
         except Exception as exc:
             logger.exception("Error parsing JSON response")
             await read_stream_writer.send(exc)
@@ -404,8 +414,8 @@ class StreamableHTTPTransport:
                         else:
                             await self._handle_post_request(ctx)
 
-                    # If this is a request, start a new task to handle it
-                    if isinstance(message.root, JSONRPCRequest):
+                    # If this is a request or a batch, start a new task to handle it
+                    if isinstance(message, JSONRPCBatch) or isinstance(message.root, JSONRPCRequest):
                         tg.start_soon(handle_request_async)
                     else:
                         await handle_request_async()
@@ -9,7 +9,7 @@ from pydantic import ValidationError
 from websockets.asyncio.client import connect as ws_connect
 from websockets.typing import Subprotocol
 
-import mcp.types as types
+from mcp.shared.batch import parse_messages
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -56,9 +56,8 @@ async def websocket_client(
             async with read_stream_writer:
                 async for raw_text in ws:
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(raw_text)
-                        session_message = SessionMessage(message)
-                        await read_stream_writer.send(session_message)
+                        for message in parse_messages(raw_text):
+                            await read_stream_writer.send(SessionMessage(message))
                     except ValidationError as exc:
                         # If JSON parse or model validation fails, send the exception
                         await read_stream_writer.send(exc)
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from functools import partial
 from typing import Any, Literal
@@ -34,6 +35,7 @@ class RevocationErrorResponse(BaseModel):
 class RevocationHandler:
     provider: OAuthAuthorizationServerProvider[Any, Any, Any]
     client_authenticator: ClientAuthenticator
+    on_revoke: Callable[[AccessToken | RefreshToken], None] | None = None
 
     async def handle(self, request: Request) -> Response:
         """
@@ -83,6 +85,8 @@ class RevocationHandler:
             # Revoke token; provider is not meant to be able to do validation
             # at this point that would result in an error
             await self.provider.revoke_token(token)
+            if self.on_revoke is not None:
+                self.on_revoke(token)
 
         # Return successful empty response
         return Response(
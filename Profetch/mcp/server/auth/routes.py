@@ -14,7 +14,7 @@ from mcp.server.auth.handlers.register import RegistrationHandler
 from mcp.server.auth.handlers.revoke import RevocationHandler
 from mcp.server.auth.handlers.token import TokenHandler
 from mcp.server.auth.middleware.client_auth import ClientAuthenticator
-from mcp.server.auth.provider import OAuthAuthorizationServerProvider
+from mcp.server.auth.provider import AccessToken, OAuthAuthorizationServerProvider, RefreshToken
 from mcp.server.auth.settings import ClientRegistrationOptions, RevocationOptions
 from mcp.server.streamable_http import MCP_PROTOCOL_VERSION_HEADER
 from mcp.shared.auth import OAuthMetadata
@@ -71,6 +71,7 @@ def create_auth_routes(
     service_documentation_url: AnyHttpUrl | None = None,
     client_registration_options: ClientRegistrationOptions | None = None,
     revocation_options: RevocationOptions | None = None,
+    on_token_revoked: Callable[[AccessToken | RefreshToken], None] | None = None,
 ) -> list[Route]:
     validate_issuer_url(issuer_url)
 
@@ -131,7 +132,7 @@ def create_auth_routes(
         )
 
     if revocation_options.enabled:
-        revocation_handler = RevocationHandler(provider, client_authenticator)
+        revocation_handler = RevocationHandler(provider, client_authenticator, on_token_revoked)
         routes.append(
             Route(
                 REVOCATION_PATH,
@@ -12,6 +12,13 @@ class RevocationOptions(BaseModel):
     enabled: bool = False
 
 
+class TokenCacheOptions(BaseModel):
+    enabled: bool = False
+    ttl_seconds: float = 60.0  # Never longer than the token's own expires_at
+    negative_ttl_seconds: float = 5.0  # How long an invalid token is remembered; 0 disables
+    max_entries: int = 10_000
+
+
 class AuthSettings(BaseModel):
     issuer_url: AnyHttpUrl = Field(
         ...,
@@ -20,6 +27,7 @@ class AuthSettings(BaseModel):
     service_documentation_url: AnyHttpUrl | None = None
     client_registration_options: ClientRegistrationOptions | None = None
     revocation_options: RevocationOptions | None = None
+    token_cache_options: TokenCacheOptions | None = None
     required_scopes: list[str] | None = None
 
     # Resource Server settings (when operating as RS only)
@@ -0,0 +1,143 @@
+"""
+Caching wrapper for token verifiers.
+
+BearerAuthBackend verifies the bearer token of every HTTP request, and a
+verifier that introspects tokens makes a network round trip each time.
+CachingTokenVerifier remembers verification results, keyed by a hash of the
+token so raw tokens are not kept in memory. Valid tokens are cached for a
+TTL, but never past their own expires_at; invalid tokens are cached for a
+shorter negative TTL. Entries are evicted least recently used.
+
+A token revoked through the revocation endpoint is dropped from the cache,
+along with every other token of the same client. In a process that did not
+serve the revocation, such as another pre-forked worker, a revoked token
+stays valid until its entry expires, so keep the TTL short.
+
+Example:
+    verifier = CachingTokenVerifier(IntrospectionTokenVerifier(...), ttl=60)
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from mcp.server.auth.provider import AccessToken, RefreshToken, TokenVerifier
+
+
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    revocations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache, valid or invalid."""
+        lookups = self.hits + self.negative_hits + self.misses
+        return (self.hits + self.negative_hits) / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    access_token: AccessToken | None
+    expires_at: float  # time.monotonic() deadline
+
+
+class CachingTokenVerifier(TokenVerifier):
+    """TokenVerifier that caches the results of another verifier.
+
+    Cached AccessTokens are returned as-is, not copied, so callers must not
+    modify them.
+    """
+
+    def __init__(
+        self,
+        verifier: TokenVerifier,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        max_entries: int = 10_000,
+    ):
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if negative_ttl < 0:
+            raise ValueError(f"negative_ttl must not be negative, got {negative_ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self.verifier = verifier
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.stats = TokenCacheStats()
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                if entry.access_token is None:
+                    self.stats.negative_hits += 1
+                else:
+                    self.stats.hits += 1
+                return entry.access_token
+            del self._entries[key]
+            self.stats.expirations += 1
+        self.stats.misses += 1
+
+        access_token = await self.verifier.verify_token(token)
+        self._store(key, access_token)
+        return access_token
+
+    def invalidate(self, token: str) -> None:
+        """Drop the cached result for one token."""
+        if self._entries.pop(_token_key(token), None) is not None:
+            self.stats.revocations += 1
+
+    def invalidate_client(self, client_id: str) -> None:
+        """Drop the cached access tokens of one client."""
+        keys = [
+            key
+            for key, entry in self._entries.items()
+            if entry.access_token is not None and entry.access_token.client_id == client_id
+        ]
+        for key in keys:
+            del self._entries[key]
+        self.stats.revocations += len(keys)
+
+    def token_revoked(self, token: AccessToken | RefreshToken) -> None:
+        """Revocation hook: providers may revoke a client's related tokens too."""
+        self.invalidate(token.token)
+        self.invalidate_client(token.client_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _store(self, key: bytes, access_token: AccessToken | None) -> None:
+        now = time.monotonic()
+        if access_token is None:
+            if not self.negative_ttl:
+                return
+            expires_at = now + self.negative_ttl
+        else:
+            expires_at = now + self.ttl
+            if access_token.expires_at is not None:
+                expires_at = min(expires_at, now + access_token.expires_at - time.time())
+            if expires_at <= now:
+                return
+        self._entries[key] = _Entry(access_token, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
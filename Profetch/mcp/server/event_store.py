@@ -0,0 +1,517 @@
+"""
+EventStore implementations for resumable Streamable HTTP.
+
+``InMemoryEventStore`` keeps a bounded ring buffer of serialized events per
+stream, capped by event count and bytes per stream and by total bytes across
+streams. ``FileEventStore`` appends events to segment files on disk from a
+writer thread, keeps an in-memory index of where each stream's events live,
+expires whole segments after a TTL and rewrites mostly-dead segments during
+compaction.
+
+Both stores issue event IDs of the form ``"<sequence>:<stream_id>"`` so that
+``replay_events_after`` can find the stream and position of the last event a
+client saw without a global lookup table.
+
+Example usage:
+```
+    event_store = FileEventStore("/var/lib/profetch/events", ttl=timedelta(hours=1))
+    mcp = FastMCP("UniPROscope MCP", event_store=event_store)
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import anyio
+import anyio.to_thread
+
+from mcp.server.streamable_http import EventCallback, EventId, EventMessage, EventStore, StreamId
+from mcp.types import JSONRPCMessage
+
+logger = logging.getLogger(__name__)
+
+
+def _format_event_id(stream_id: StreamId, seq: int) -> EventId:
+    return f"{seq}:{stream_id}"
+
+
+def _parse_event_id(event_id: EventId) -> tuple[StreamId, int] | None:
+    seq, sep, stream_id = event_id.partition(":")
+    if not sep or not seq.isdigit():
+        return None
+    return stream_id, int(seq)
+
+
+def _serialize(message: JSONRPCMessage) -> bytes:
+    return message.model_dump_json(by_alias=True, exclude_none=True).encode()
+
+
+class InMemoryEventStore(EventStore):
+    """Bounded per-stream ring buffers of serialized events.
+
+    Each stream keeps at most ``max_events_per_stream`` events and
+    ``max_bytes_per_stream`` bytes of payload, dropping its oldest events
+    first. When the store as a whole exceeds ``max_bytes``, events are dropped
+    from the stream that was written to least recently.
+    """
+
+    def __init__(
+        self,
+        max_events_per_stream: int = 1024,
+        max_bytes_per_stream: int = 1 << 20,
+        max_bytes: int = 64 << 20,
+    ) -> None:
+        self.max_events_per_stream = max_events_per_stream
+        self.max_bytes_per_stream = max_bytes_per_stream
+        self.max_bytes = max_bytes
+        # Ordered by last write, least recent first
+        self._streams: OrderedDict[StreamId, deque[tuple[int, bytes]]] = OrderedDict()
+        self._stream_bytes: dict[StreamId, int] = {}
+        self._bytes = 0
+        self._seq = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total payload bytes currently held."""
+        return self._bytes
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        payload = _serialize(message)
+        self._seq += 1
+
+        events = self._streams.get(stream_id)
+        if events is None:
+            events = self._streams[stream_id] = deque()
+            self._stream_bytes[stream_id] = 0
+        else:
+            self._streams.move_to_end(stream_id)
+        events.append((self._seq, payload))
+        self._stream_bytes[stream_id] += len(payload)
+        self._bytes += len(payload)
+
+        # Always keep the newest event, even if it alone exceeds the byte cap
+        while len(events) > 1 and (
+            len(events) > self.max_events_per_stream or self._stream_bytes[stream_id] > self.max_bytes_per_stream
+        ):
+            self._drop_oldest(stream_id, events)
+
+        while self._bytes > self.max_bytes and self._streams:
+            oldest_id, oldest = next(iter(self._streams.items()))
+            self._drop_oldest(oldest_id, oldest)
+
+        return _format_event_id(stream_id, self._seq)
+
+    def _drop_oldest(self, stream_id: StreamId, events: deque[tuple[int, bytes]]) -> None:
+        _, payload = events.popleft()
+        self._stream_bytes[stream_id] -= len(payload)
+        self._bytes -= len(payload)
+        if not events:
+            del self._streams[stream_id]
+            del self._stream_bytes[stream_id]
+
+    async def replay_events_after(
+        self,
+        last_event_id: EventId,
+        send_callback: EventCallback,
+    ) -> StreamId | None:
+        parsed = _parse_event_id(last_event_id)
+        if parsed is None:
+            logger.warning(f"Malformed event ID for replay: {last_event_id}")
+            return None
+        stream_id, last_seq = parsed
+        events = self._streams.get(stream_id)
+        if events is None:
+            logger.warning(f"No stored events for stream {stream_id}")
+            return None
+
+        # Snapshot first: the buffer can change while send_callback awaits
+        pending = [(seq, payload) for seq, payload in events if seq > last_seq]
+        for seq, payload in pending:
+            message = JSONRPCMessage.model_validate_json(payload)
+            await send_callback(EventMessage(message, _format_event_id(stream_id, seq)))
+        return stream_id
+
+
+# Record header: sequence, timestamp, stream ID length, payload length
+_RECORD = struct.Struct("<QdII")
+_SEGMENT_SUFFIX = ".log"
+# store_event waits for the writer thread once this many bytes are queued
+_MAX_BACKLOG = 8 << 20
+
+
+@dataclass
+class _Segment:
+    number: int
+    path: Path
+    size: int = 0
+    dead: int = 0
+    newest: float = 0.0
+
+
+@dataclass
+class _Batch:
+    """Records appended since the last write, written by one writer-thread task."""
+
+    records: list[bytes]
+    future: Future[None] | None = None
+    taken: bool = False
+
+
+@dataclass
+class _Entry:
+    seq: int
+    segment: int
+    offset: int
+    size: int
+    timestamp: float
+
+
+class FileEventStore(EventStore):
+    """Append-only, segmented on-disk event log.
+
+    Events are appended to the active segment file under ``directory`` until
+    it reaches ``segment_bytes``, at which point a new segment is started and
+    maintenance runs:
+
+    - segments whose newest event is older than ``ttl`` are deleted;
+    - the oldest segments are deleted while the log exceeds ``max_bytes``;
+    - segments in which at least ``compact_ratio`` of the bytes belong to
+      expired or evicted events are compacted by copying their live events
+      to the active segment and deleting the old file.
+
+    Each stream keeps at most ``max_events_per_stream`` live events. The
+    position of every live event is indexed in memory, so replaying a stream
+    reads only that stream's records. The index is rebuilt from the segment
+    files when the store is opened, and a partially written trailing record
+    is truncated. Records that a compaction copied but whose old segment
+    survived a crash are read once, from their copy.
+
+    The index is kept on the event loop, but file I/O runs on one writer
+    thread, in the order it was issued, so a disk flush never blocks other
+    sessions. ``store_event`` returns once its record is queued; pass
+    ``fsync=True`` to wait until it has been forced to disk instead.
+    Replays are queued behind the writes before them, so they always see
+    every event already stored.
+
+    All methods must be called from the event loop that owns the store.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        segment_bytes: int = 4 << 20,
+        ttl: timedelta | None = timedelta(hours=1),
+        max_events_per_stream: int = 1024,
+        max_bytes: int | None = None,
+        compact_ratio: float = 0.5,
+        fsync: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.segment_bytes = segment_bytes
+        self.ttl = ttl
+        self.max_events_per_stream = max_events_per_stream
+        self.max_bytes = max_bytes
+        self.compact_ratio = compact_ratio
+        self.fsync = fsync
+
+        self._segments: dict[int, _Segment] = {}
+        self._index: dict[StreamId, deque[_Entry]] = {}
+        self._seq = 0
+        # One worker, so file operations run in submission order
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="event-store")
+        # Records not yet taken by the writer thread; guarded by _lock
+        self._batch: _Batch | None = None
+        self._backlog = 0
+        self._lock = threading.Lock()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        self._active = self._new_segment()
+        self._file: BinaryIO = open(self._active.path, "ab")
+        self.compact()
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of all segment files."""
+        return sum(segment.size for segment in self._segments.values())
+
+    def close(self) -> None:
+        """Finish queued file operations and close the active segment."""
+        self._submit(self._file.close)
+        self._io.shutdown(wait=True)
+
+    # -- file operations, run on the writer thread -------------------------
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        # Records appended after this operation must not be written before it
+        with self._lock:
+            self._batch = None
+        future = self._io.submit(fn, *args)
+        future.add_done_callback(_log_io_failure)
+        return future
+
+    async def _wait(self, future: Future[Any]) -> Any:
+        return await anyio.to_thread.run_sync(future.result)
+
+    def _write_io(self, batch: _Batch) -> None:
+        with self._lock:
+            batch.taken = True
+            records = batch.records
+            self._backlog -= sum(len(record) for record in records)
+        self._file.write(b"".join(records))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _open_io(self, path: Path) -> None:
+        self._file.close()
+        self._file = open(path, "ab")
+
+    def _copy_io(self, source: Path, spans: list[tuple[int, int]]) -> None:
+        with open(source, "rb") as f:
+            for offset, size in spans:
+                f.seek(offset)
+                self._file.write(f.read(size))
+        self._file.flush()
+        # The copies must be on disk before the only other copy is deleted
+        os.fsync(self._file.fileno())
+        source.unlink(missing_ok=True)
+
+    def _unlink_io(self, paths: list[Path]) -> None:
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    # -- writing ---------------------------------------------------------
+
+    async def store_event(self, stream_id: StreamId, message: JSONRPCMessage) -> EventId:
+        self._seq += 1
+        now = time.time()
+        key = stream_id.encode()
+        payload = _serialize(message)
+        record = _RECORD.pack(self._seq, now, len(key), len(payload)) + key + payload
+
+        if self._active.size and self._active.size + len(record) > self.segment_bytes:
+            self._rotate()
+        future = self._append(
+            stream_id, _Entry(self._seq, self._active.number, self._active.size, len(record), now), record
+        )
+        if self.fsync or self._backlog > _MAX_BACKLOG:
+            await self._wait(future)
+        return _format_event_id(stream_id, self._seq)
+
+    def _append(self, stream_id: StreamId, entry: _Entry, record: bytes) -> Future[None]:
+        # Records appended while a write is queued join it, so a burst of
+        # events costs one writer-thread task and one flush.
+        with self._lock:
+            batch = self._batch
+            if batch is None or batch.taken:
+                batch = self._batch = _Batch([])
+            batch.records.append(record)
+            self._backlog += len(record)
+        if batch.future is None:
+            batch.future = self._io.submit(self._write_io, batch)
+            batch.future.add_done_callback(_log_io_failure)
+        future = batch.future
+        self._active.size += len(record)
+        self._active.newest = max(self._active.newest, entry.timestamp)
+
+        entries = self._index.setdefault(stream_id, deque())
+        entries.append(entry)
+        while len(entries) > self.max_events_per_stream:
+            self._kill(entries.popleft())
+        return future
+
+    def _kill(self, entry: _Entry) -> None:
+        segment = self._segments.get(entry.segment)
+        if segment is not None:
+            segment.dead += entry.size
+
+    def _new_segment(self) -> _Segment:
+        number = max(self._segments, default=0) + 1
+        segment = self._segments[number] = _Segment(number, self.directory / f"{number:010d}{_SEGMENT_SUFFIX}")
+        return segment
+
+    def _rotate(self) -> None:
+        self._active = self._new_segment()
+        self._submit(self._open_io, self._active.path)
+        self.compact()
+
+    # -- maintenance -----------------------------------------------------
+
+    def compact(self) -> None:
+        """Expire old events, enforce ``max_bytes`` and compact sparse segments.
+
+        The index is updated at once; the file operations are queued.
+        """
+        self._expire()
+
+        sealed = sorted(number for number in self._segments if number != self._active.number)
+        if self.max_bytes is not None:
+            for number in sealed:
+                if self.nbytes <= self.max_bytes:
+                    break
+                self._drop_segments({number})
+
+        for number in sealed:
+            segment = self._segments.get(number)
+            if segment is not None and segment.size and segment.dead / segment.size >= self.compact_ratio:
+                self._compact_segment(segment)
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        cutoff = time.time() - self.ttl.total_seconds()
+        # Timestamps grow with sequence numbers, so expired events are a prefix
+        for stream_id, entries in list(self._index.items()):
+            while entries and entries[0].timestamp < cutoff:
+                self._kill(entries.popleft())
+            if not entries:
+                del self._index[stream_id]
+        self._drop_segments(
+            {
+                number
+                for number, segment in self._segments.items()
+                if number != self._active.number and segment.newest < cutoff
+            }
+        )
+
+    def _drop_segments(self, numbers: set[int]) -> None:
+        if not numbers:
+            return
+        for stream_id, entries in list(self._index.items()):
+            if any(entry.segment in numbers for entry in entries):
+                kept = deque(entry for entry in entries if entry.segment not in numbers)
+                if kept:
+                    self._index[stream_id] = kept
+                else:
+                    del self._index[stream_id]
+        self._submit(self._unlink_io, [self._segments.pop(number).path for number in numbers])
+
+    def _compact_segment(self, segment: _Segment) -> None:
+        live = sorted(
+            (
+                (entry.offset, stream_id, i, entry)
+                for stream_id, entries in self._index.items()
+                for i, entry in enumerate(entries)
+                if entry.segment == segment.number
+            ),
+            key=lambda item: item[0],
+        )
+        for _, stream_id, i, entry in live:
+            self._index[stream_id][i] = _Entry(
+                entry.seq, self._active.number, self._active.size, entry.size, entry.timestamp
+            )
+            self._active.size += entry.size
+            self._active.newest = max(self._active.newest, entry.timestamp)
+        del self._segments[segment.number]
+        spans = [(entry.offset, entry.size) for _, _, _, entry in live]
+        self._submit(self._copy_io, segment.path, spans)
+        logger.debug(f"Compacting segment {segment.number}: moving {len(live)} live events")
+
+    def _recover(self) -> None:
+        entries_by_seq: dict[int, tuple[StreamId, _Entry]] = {}
+        paths = sorted(self.directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        for path in paths:
+            try:
+                number = int(path.stem)
+            except ValueError:
+                continue
+            segment = self._segments[number] = _Segment(number, path)
+            with open(path, "rb") as f:
+                data = f.read()
+            offset = 0
+            while offset + _RECORD.size <= len(data):
+                seq, timestamp, key_len, payload_len = _RECORD.unpack_from(data, offset)
+                size = _RECORD.size + key_len + payload_len
+                if offset + size > len(data):
+                    break
+                stream_id = data[offset + _RECORD.size : offset + _RECORD.size + key_len].decode()
+                # Segments are read in order, so a record a compaction copied
+                # before a crash kept its old segment is replaced by its copy.
+                entries_by_seq[seq] = (stream_id, _Entry(seq, number, offset, size, timestamp))
+                segment.newest = max(segment.newest, timestamp)
+                self._seq = max(self._seq, seq)
+                offset += size
+            if offset < len(data):
+                logger.warning(f"Truncating {len(data) - offset} trailing bytes of {path}")
+                with open(path, "r+b") as f:
+                    f.truncate(offset)
+            segment.size = offset
+
+        # Compaction moves records between segments, so restore sequence order
+        for seq in sorted(entries_by_seq):
+            stream_id, entry = entries_by_seq[seq]
+            self._index.setdefault(stream_id, deque()).append(entry)
+        live = dict.fromkeys(self._segments, 0)
+        for entries in self._index.values():
+            while len(entries) > self.max_events_per_stream:
+                entries.popleft()
+            for entry in entries:
+                live[entry.segment] += entry.size
+        # Everything not indexed is dead, including records already copied elsewhere
+        for number, segment in self._segments.items():
+            segment.dead = segment.size - live[number]
+
+    # -- replay ----------------------------------------------------------
+
+    async def replay_events_after(
+        self,
+        last_event_id: EventId,
+        send_callback: EventCallback,
+    ) -> StreamId | None:
+        parsed = _parse_event_id(last_event_id)
+        if parsed is None:
+            logger.warning(f"Malformed event ID for replay: {last_event_id}")
+            return None
+        stream_id, last_seq = parsed
+        entries = self._index.get(stream_id)
+        if entries is None:
+            logger.warning(f"No stored events for stream {stream_id}")
+            return None
+
+        cutoff = time.time() - self.ttl.total_seconds() if self.ttl is not None else 0.0
+        pending = [entry for entry in entries if entry.seq > last_seq and entry.timestamp >= cutoff]
+        # The read is queued behind every write so far and ahead of any
+        # maintenance triggered by later writes, so the records it reads
+        # exist and no segment it needs is deleted before it runs.
+        spans = [(self._segments[entry.segment].path, entry.offset, entry.size) for entry in pending]
+        payloads = await self._wait(self._submit(_read_io, spans))
+        for entry, payload in zip(pending, payloads):
+            message = JSONRPCMessage.model_validate_json(payload)
+            await send_callback(EventMessage(message, _format_event_id(stream_id, entry.seq)))
+        return stream_id
+
+
+def _read_io(spans: list[tuple[Path, int, int]]) -> list[bytes]:
+    files: dict[Path, BinaryIO] = {}
+    payloads: list[bytes] = []
+    try:
+        for path, offset, size in spans:
+            f = files.get(path)
+            if f is None:
+                f = files[path] = open(path, "rb")
+            f.seek(offset)
+            record = f.read(size)
+            _, _, key_len, _ = _RECORD.unpack_from(record)
+            payloads.append(record[_RECORD.size + key_len :])
+    finally:
+        for f in files.values():
+            f.close()
+    return payloads
+
+
+def _log_io_failure(future: Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Event store file operation failed", exc_info=future.exception())
@@ -6,6 +6,7 @@ from typing import Any
 from pydantic import AnyUrl
 
 from mcp.server.fastmcp.resources.base import Resource
+from mcp.server.fastmcp.resources.router import TemplateRouter
 from mcp.server.fastmcp.resources.templates import ResourceTemplate
 from mcp.server.fastmcp.utilities.logging import get_logger
 
@@ -18,6 +19,7 @@ class ResourceManager:
     def __init__(self, warn_on_duplicate_resources: bool = True):
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
+        self._router = TemplateRouter()
         self.warn_on_duplicate_resources = warn_on_duplicate_resources
 
     def add_resource(self, resource: Resource) -> Resource:
@@ -65,6 +67,7 @@ class ResourceManager:
             mime_type=mime_type,
         )
         self._templates[template.uri_template] = template
+        self._router.add(template)
         return template
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource | None:
@@ -77,12 +80,12 @@ class ResourceManager:
             return resource
 
         # Then check templates
-        for template in self._templates.values():
-            if params := template.matches(uri_str):
-                try:
-                    return await template.create_resource(uri_str, params)
-                except Exception as e:
-                    raise ValueError(f"Error creating resource from template: {e}")
+        if match := self._router.match(uri_str):
+            template, params = match
+            try:
+                return await template.create_resource(uri_str, params)
+            except Exception as e:
+                raise ValueError(f"Error creating resource from template: {e}")
 
         raise ValueError(f"Unknown resource: {uri}")
 
@@ -0,0 +1,110 @@
+"""Segment trie for resolving URIs against resource templates."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from mcp.server.fastmcp.resources.templates import ResourceTemplate
+
+_PARAM = re.compile(r"\{(\w+)\}")
+
+
+@lru_cache(maxsize=None)
+def compile_segment(segment: str) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    """Compile a template segment with embedded parameters (e.g. ``{name}.txt``)."""
+    names: list[str] = []
+    parts: list[str] = []
+    last = 0
+    for m in _PARAM.finditer(segment):
+        parts.append(re.escape(segment[last : m.start()]))
+        parts.append("([^/]+)")
+        names.append(m.group(1))
+        last = m.end()
+    parts.append(re.escape(segment[last:]))
+    return re.compile("".join(parts)), tuple(names)
+
+
+@dataclass
+class _Node:
+    literals: dict[str, _Node] = field(default_factory=dict)
+    param: _Node | None = None
+    patterns: dict[re.Pattern[str], _Node] = field(default_factory=dict)
+    # (registration order, uri_template, parameter names in capture order)
+    entries: list[tuple[int, str, tuple[str, ...]]] = field(default_factory=list)
+
+
+class TemplateRouter:
+    """Resolves URIs to resource templates in O(path length).
+
+    Templates are split on ``/`` into a trie once, at registration. Literal
+    segments are dict lookups, ``{param}`` segments are a single wildcard edge,
+    and segments mixing text and parameters are matched with a per-segment
+    compiled regex. When several templates match a URI, the one registered
+    first wins, as with a linear scan.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._templates: dict[str, ResourceTemplate] = {}
+        self._order: dict[str, int] = {}
+
+    def add(self, template: ResourceTemplate) -> None:
+        """Register a template, replacing any template with the same URI template."""
+        key = template.uri_template
+        self._templates[key] = template
+        if key in self._order:
+            return
+        self._order[key] = len(self._order)
+
+        node = self._root
+        names: list[str] = []
+        for segment in key.split("/"):
+            if "{" not in segment:
+                node = node.literals.setdefault(segment, _Node())
+            elif (m := _PARAM.fullmatch(segment)) is not None:
+                names.append(m.group(1))
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                pattern, segment_names = compile_segment(segment)
+                names.extend(segment_names)
+                node = node.patterns.setdefault(pattern, _Node())
+        node.entries.append((self._order[key], key, tuple(names)))
+
+    def match(self, uri: str) -> tuple[ResourceTemplate, dict[str, Any]] | None:
+        """Return the matching template and its extracted parameters, if any."""
+        found: list[tuple[tuple[int, str, tuple[str, ...]], list[str]]] = []
+        self._walk(self._root, uri.split("/"), 0, [], found)
+        if not found:
+            return None
+        (_, key, names), captures = min(found, key=lambda item: item[0][0])
+        return self._templates[key], dict(zip(names, captures))
+
+    def _walk(
+        self,
+        node: _Node,
+        segments: list[str],
+        i: int,
+        captures: list[str],
+        found: list[tuple[tuple[int, str, tuple[str, ...]], list[str]]],
+    ) -> None:
+        if i == len(segments):
+            found.extend((entry, list(captures)) for entry in node.entries)
+            return
+        segment = segments[i]
+        if (child := node.literals.get(segment)) is not None:
+            self._walk(child, segments, i + 1, captures, found)
+        if segment and node.param is not None:
+            captures.append(segment)
+            self._walk(node.param, segments, i + 1, captures, found)
+            captures.pop()
+        for pattern, child in node.patterns.items():
+            if (m := pattern.fullmatch(segment)) is not None:
+                groups = m.groups()
+                captures.extend(groups)
+                self._walk(child, segments, i + 1, captures, found)
+                del captures[len(captures) - len(groups) :]
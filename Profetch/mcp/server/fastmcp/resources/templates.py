@@ -5,6 +5,7 @@ from __future__ import annotations
 import inspect
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, TypeAdapter, validate_call
@@ -12,6 +13,15 @@ from pydantic import BaseModel, Field, TypeAdapter, validate_call
 from mcp.server.fastmcp.resources.types import FunctionResource, Resource
 
 
+@lru_cache(maxsize=None)
+def _compile_uri_template(uri_template: str) -> re.Pattern[str]:
+    parts = re.split(r"\{(\w+)\}", uri_template)
+    pattern = "".join(
+        f"(?P<{part}>[^/]+)" if i % 2 else re.escape(part) for i, part in enumerate(parts)
+    )
+    return re.compile(pattern)
+
+
 class ResourceTemplate(BaseModel):
     """A template for dynamically creating resources."""
 
@@ -56,9 +66,7 @@ class ResourceTemplate(BaseModel):
 
     def matches(self, uri: str) -> dict[str, Any] | None:
         """Check if URI matches template and extract parameters."""
-        # Convert template to regex pattern
-        pattern = self.uri_template.replace("{", "(?P<").replace("}", ">[^/]+)")
-        match = re.match(f"^{pattern}$", uri)
+        match = _compile_uri_template(self.uri_template).fullmatch(uri)
         if match:
             return match.groupdict()
         return None
@@ -4,9 +4,11 @@ from __future__ import annotations as _annotations
 
 import inspect
 import re
+import socket
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
 from contextlib import (
     AbstractAsyncContextManager,
+    AsyncExitStack,
     asynccontextmanager,
 )
 from typing import Any, Generic, Literal
@@ -31,12 +33,15 @@ from mcp.server.auth.middleware.bearer_auth import (
 )
 from mcp.server.auth.provider import OAuthAuthorizationServerProvider, ProviderTokenVerifier, TokenVerifier
 from mcp.server.auth.settings import AuthSettings
+from mcp.server.auth.token_cache import CachingTokenVerifier
 from mcp.server.elicitation import ElicitationResult, ElicitSchemaModelT, elicit_with_validation
 from mcp.server.fastmcp.exceptions import ResourceError
 from mcp.server.fastmcp.prompts import Prompt, PromptManager
-from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager
+from mcp.server.fastmcp.resources import FunctionResource, Resource, ResourceManager, ResourceTemplate
 from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.utilities.listing import Listing
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
+from mcp.server.fastmcp.utilities.profiling import ProfileMode, ToolProfiler
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
@@ -47,11 +52,17 @@ from mcp.server.stdio import stdio_server
 from mcp.server.streamable_http import EventStore
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.server.transport_security import TransportSecuritySettings
+from mcp.shared import tracing
 from mcp.shared.context import LifespanContextT, RequestContext, RequestT
+from mcp.shared.session import PreparedResult
 from mcp.types import (
     AnyFunction,
     ContentBlock,
     GetPromptResult,
+    ListPromptsRequest,
+    ListResourcesRequest,
+    ListResourceTemplatesRequest,
+    ListToolsRequest,
     ToolAnnotations,
 )
 from mcp.types import Prompt as MCPPrompt
@@ -93,6 +104,27 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     # StreamableHTTP settings
     json_response: bool = False
     stateless_http: bool = False  # If True, uses true stateless mode (new transport per request)
+    session_idle_timeout: float | None = None  # Seconds before an idle session is closed
+    max_sessions: int | None = None  # Live sessions before the least recently used idle one is evicted
+    workers: int = 1  # Pre-forked worker processes; more than one requires stateless_http
+
+    # Concurrency settings: requests beyond a limit queue, then get SERVER_BUSY
+    max_concurrent_requests: int | None = None  # Across all sessions
+    max_queued_requests: int = 64
+    max_concurrent_requests_per_session: int | None = None
+    max_queued_requests_per_session: int = 16
+
+    # Entries per list_tools/list_resources/list_prompts page; None sends them all at once
+    list_page_size: int | None = None
+
+    # Write request tracing spans here: Chrome trace format if it ends in .json, else JSON lines
+    trace_file: str | None = None
+
+    # Profiling settings: profiles of sampled tool calls are written to profile_dir
+    profile_dir: str | None = None
+    profile_mode: ProfileMode = "deterministic"  # cProfile, or "statistical" stack sampling
+    profile_sample_rate: float = 1.0
+    profile_tools: dict[str, float] | None = None  # Per-tool sample rates; only these tools are profiled
 
     # resource settings
     warn_on_duplicate_resources: bool = True
@@ -109,7 +141,11 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     )
 
     lifespan: Callable[[FastMCP], AbstractAsyncContextManager[LifespanResultT]] | None = Field(
-        None, description="Lifespan context manager"
+        None,
+        description=(
+            "Lifespan context manager. It is entered once and shared by every session that overlaps it, "
+            "not once per session, so what it yields must be safe to use from concurrent sessions"
+        ),
     )
 
     auth: AuthSettings | None = None
@@ -118,16 +154,111 @@ class Settings(BaseSettings, Generic[LifespanResultT]):
     transport_security: TransportSecuritySettings | None = None
 
 
+class SharedLifespan(Generic[LifespanResultT]):
+    """The app lifespan, entered once and shared by every run it overlaps.
+
+    The lowlevel server enters its lifespan for each session, and stateless
+    HTTP serves every request as a session of its own. Sharing one context
+    keeps what the lifespan sets up alive across them, and the HTTP apps hold
+    it open for as long as they run. The first user enters the lifespan and
+    the last one exits it, so a lifespan that opens task groups must only be
+    shared by runs nested inside the first, as the HTTP apps arrange.
+
+    Unlike the lowlevel server's per-session lifespan, this runs the
+    lifespan once per FastMCP instance however many sessions overlap, so
+    whatever it yields is used concurrently by all of them.
+    """
+
+    def __init__(self, app: FastMCP, lifespan: Callable[[FastMCP], AbstractAsyncContextManager[LifespanResultT]]):
+        self._app = app
+        self._lifespan = lifespan
+        self._lock = anyio.Lock()
+        self._users = 0
+        self._stack: AsyncExitStack | None = None
+        self._context: LifespanResultT | None = None
+
+    @property
+    def context(self) -> LifespanResultT | None:
+        """What the lifespan yielded, while any run holds it open; None otherwise."""
+        return self._context
+
+    @asynccontextmanager
+    async def __call__(self, server: MCPServer[LifespanResultT, Request]) -> AsyncIterator[object]:
+        async with self._lock:
+            if self._users == 0:
+                stack = AsyncExitStack()
+                self._context = await stack.enter_async_context(self._lifespan(self._app))
+                self._stack = stack
+            self._users += 1
+            context = self._context
+        try:
+            yield context
+        finally:
+            # Shielded so that a cancelled run still releases its use. The lock
+            # is held while the last user exits the lifespan, so a new user
+            # waits for that to finish and then enters it afresh.
+            with anyio.CancelScope(shield=True):
+                await self._lock.acquire()
+            try:
+                self._users -= 1
+                if self._users == 0 and self._stack is not None:
+                    stack, self._stack, self._context = self._stack, None, None
+                    await stack.aclose()
+            finally:
+                self._lock.release()
+
+
 def lifespan_wrapper(
     app: FastMCP,
     lifespan: Callable[[FastMCP], AbstractAsyncContextManager[LifespanResultT]],
 ) -> Callable[[MCPServer[LifespanResultT, Request]], AbstractAsyncContextManager[object]]:
-    @asynccontextmanager
-    async def wrap(s: MCPServer[LifespanResultT, Request]) -> AsyncIterator[object]:
-        async with lifespan(app) as context:
-            yield context
+    return SharedLifespan(app, lifespan)
+
+
+def _mcp_tool(info: Tool) -> MCPTool:
+    return MCPTool(
+        name=info.name,
+        title=info.title,
+        description=info.description,
+        inputSchema=info.parameters,
+        outputSchema=info.output_schema,
+        annotations=info.annotations,
+    )
+
 
-    return wrap
+def _mcp_resource(resource: Resource) -> MCPResource:
+    return MCPResource(
+        uri=resource.uri,
+        name=resource.name or "",
+        title=resource.title,
+        description=resource.description,
+        mimeType=resource.mime_type,
+    )
+
+
+def _mcp_resource_template(template: ResourceTemplate) -> MCPResourceTemplate:
+    return MCPResourceTemplate(
+        uriTemplate=template.uri_template,
+        name=template.name,
+        title=template.title,
+        description=template.description,
+    )
+
+
+def _mcp_prompt(prompt: Prompt) -> MCPPrompt:
+    return MCPPrompt(
+        name=prompt.name,
+        title=prompt.title,
+        description=prompt.description,
+        arguments=[
+            MCPPromptArgument(
+                name=arg.name,
+                description=arg.description,
+                required=arg.required,
+            )
+            for arg in (prompt.arguments or [])
+        ],
+    )
 
 
 class FastMCP:
@@ -143,15 +274,41 @@ class FastMCP:
         **settings: Any,
     ):
         self.settings = Settings(**settings)
+        if self.settings.trace_file:
+            tracing.configure(self.settings.trace_file)
 
         self._mcp_server = MCPServer(
             name=name or "FastMCP",
             instructions=instructions,
             lifespan=(lifespan_wrapper(self, self.settings.lifespan) if self.settings.lifespan else default_lifespan),
+            max_concurrent_requests=self.settings.max_concurrent_requests,
+            max_queued_requests=self.settings.max_queued_requests,
+            max_concurrent_requests_per_session=self.settings.max_concurrent_requests_per_session,
+            max_queued_requests_per_session=self.settings.max_queued_requests_per_session,
         )
         self._tool_manager = ToolManager(tools=tools, warn_on_duplicate_tools=self.settings.warn_on_duplicate_tools)
         self._resource_manager = ResourceManager(warn_on_duplicate_resources=self.settings.warn_on_duplicate_resources)
         self._prompt_manager = PromptManager(warn_on_duplicate_prompts=self.settings.warn_on_duplicate_prompts)
+        self._tool_listing = Listing("tools", self._tool_manager.list_tools, _mcp_tool, self._cache_tool_definition)
+        self._resource_listing = Listing("resources", self._resource_manager.list_resources, _mcp_resource)
+        self._resource_template_listing = Listing(
+            "resourceTemplates", self._resource_manager.list_templates, _mcp_resource_template
+        )
+        self._prompt_listing = Listing("prompts", self._prompt_manager.list_prompts, _mcp_prompt)
+        if self.settings.profile_dir:
+            profiler = ToolProfiler(
+                self.settings.profile_dir,
+                mode=self.settings.profile_mode,
+                sample_rate=self.settings.profile_sample_rate,
+                tools=self.settings.profile_tools,
+            )
+            self._tool_manager.profiler = profiler
+
+            def tool_profiles() -> dict[str, Any]:
+                """Recent profiled tool calls and the functions that took most of their time."""
+                return profiler.summary()
+
+            self.resource("profile://tools", mime_type="application/json")(tool_profiles)
         # Validate auth configuration
         if self.settings.auth is not None:
             if auth_server_provider and token_verifier:
@@ -168,6 +325,18 @@ class FastMCP:
         # Create token verifier from provider if needed (backwards compatibility)
         if auth_server_provider and not token_verifier:
             self._token_verifier = ProviderTokenVerifier(auth_server_provider)
+
+        # Cache verification results so every request need not re-verify its token
+        self._token_cache: CachingTokenVerifier | None = None
+        cache_options = self.settings.auth.token_cache_options if self.settings.auth else None
+        if self._token_verifier and cache_options and cache_options.enabled:
+            self._token_cache = CachingTokenVerifier(
+                self._token_verifier,
+                ttl=cache_options.ttl_seconds,
+                negative_ttl=cache_options.negative_ttl_seconds,
+                max_entries=cache_options.max_entries,
+            )
+            self._token_verifier = self._token_cache
         self._event_store = event_store
         self._custom_starlette_routes: list[Route] = []
         self.dependencies = self.settings.dependencies
@@ -187,6 +356,11 @@ class FastMCP:
     def instructions(self) -> str | None:
         return self._mcp_server.instructions
 
+    @property
+    def token_cache(self) -> CachingTokenVerifier | None:
+        """The bearer-token verification cache, if auth.token_cache_options enables it."""
+        return self._token_cache
+
     @property
     def session_manager(self) -> StreamableHTTPSessionManager:
         """Get the StreamableHTTP session manager.
@@ -227,35 +401,41 @@ class FastMCP:
             case "sse":
                 anyio.run(lambda: self.run_sse_async(mount_path))
             case "streamable-http":
-                anyio.run(self.run_streamable_http_async)
+                if self.settings.workers > 1:
+                    self._run_streamable_http_workers()
+                else:
+                    anyio.run(self.run_streamable_http_async)
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self.list_tools)
+        # The list handlers answer from prebuilt listings, extended as components are added
+        handlers = self._mcp_server.request_handlers
+        handlers[ListToolsRequest] = self._list_handler(self._tool_listing)
+        handlers[ListResourcesRequest] = self._list_handler(self._resource_listing)
+        handlers[ListResourceTemplatesRequest] = self._list_handler(self._resource_template_listing)
+        handlers[ListPromptsRequest] = self._list_handler(self._prompt_listing)
         # Note: we disable the lowlevel server's input validation.
         # FastMCP does ad hoc conversion of incoming data before validating -
         # for now we preserve this for backwards compatibility.
         self._mcp_server.call_tool(validate_input=False)(self.call_tool)
-        self._mcp_server.list_resources()(self.list_resources)
         self._mcp_server.read_resource()(self.read_resource)
-        self._mcp_server.list_prompts()(self.list_prompts)
         self._mcp_server.get_prompt()(self.get_prompt)
-        self._mcp_server.list_resource_templates()(self.list_resource_templates)
+
+    def _list_handler(self, listing: Listing[Any, Any]) -> Callable[[Any], Awaitable[Any]]:
+        async def handler(req: Any) -> PreparedResult:
+            # The lowlevel server calls the tools handler with None to refresh its cache
+            cursor = req.params.cursor if req is not None and req.params is not None else None
+            return listing.page(cursor, self.settings.list_page_size)
+
+        return handler
+
+    def _cache_tool_definition(self, tool: MCPTool) -> None:
+        # The lowlevel server validates structured output against listed tools
+        self._mcp_server._tool_cache[tool.name] = tool  # type: ignore[reportPrivateUsage]
 
     async def list_tools(self) -> list[MCPTool]:
         """List all available tools."""
-        tools = self._tool_manager.list_tools()
-        return [
-            MCPTool(
-                name=info.name,
-                title=info.title,
-                description=info.description,
-                inputSchema=info.parameters,
-                outputSchema=info.output_schema,
-                annotations=info.annotations,
-            )
-            for info in tools
-        ]
+        return [model.model_copy(deep=True) for model in self._tool_listing.refresh()]
 
     def get_context(self) -> Context[ServerSession, object, Request]:
         """
@@ -275,30 +455,10 @@ class FastMCP:
 
     async def list_resources(self) -> list[MCPResource]:
         """List all available resources."""
-
-        resources = self._resource_manager.list_resources()
-        return [
-            MCPResource(
-                uri=resource.uri,
-                name=resource.name or "",
-                title=resource.title,
-                description=resource.description,
-                mimeType=resource.mime_type,
-            )
-            for resource in resources
-        ]
+        return [model.model_copy(deep=True) for model in self._resource_listing.refresh()]
 
     async def list_resource_templates(self) -> list[MCPResourceTemplate]:
-        templates = self._resource_manager.list_templates()
-        return [
-            MCPResourceTemplate(
-                uriTemplate=template.uri_template,
-                name=template.name,
-                title=template.title,
-                description=template.description,
-            )
-            for template in templates
-        ]
+        return [model.model_copy(deep=True) for model in self._resource_template_listing.refresh()]
 
     async def read_resource(self, uri: AnyUrl | str) -> Iterable[ReadResourceContents]:
         """Read a resource by URI."""
@@ -322,6 +482,7 @@ class FastMCP:
         description: str | None = None,
         annotations: ToolAnnotations | None = None,
         structured_output: bool | None = None,
+        timeout: float | None = None,
     ) -> None:
         """Add a tool to the server.
 
@@ -338,6 +499,8 @@ class FastMCP:
                 - If None, auto-detects based on the function's return type annotation
                 - If True, unconditionally creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            timeout: Optional seconds after which a call is cancelled and reported as a
+                tool error. Only async tools can be interrupted.
         """
         self._tool_manager.add_tool(
             fn,
@@ -346,6 +509,7 @@ class FastMCP:
             description=description,
             annotations=annotations,
             structured_output=structured_output,
+            timeout=timeout,
         )
 
     def tool(
@@ -355,6 +519,7 @@ class FastMCP:
         description: str | None = None,
         annotations: ToolAnnotations | None = None,
         structured_output: bool | None = None,
+        timeout: float | None = None,
     ) -> Callable[[AnyFunction], AnyFunction]:
         """Decorator to register a tool.
 
@@ -371,6 +536,8 @@ class FastMCP:
                 - If None, auto-detects based on the function's return type annotation
                 - If True, unconditionally creates a structured tool (return type annotation permitting)
                 - If False, unconditionally creates an unstructured tool
+            timeout: Optional seconds after which a call is cancelled and reported as a
+                tool error. Only async tools can be interrupted.
 
         Example:
             @server.tool()
@@ -401,6 +568,7 @@ class FastMCP:
                 description=description,
                 annotations=annotations,
                 structured_output=structured_output,
+                timeout=timeout,
             )
             return fn
 
@@ -651,8 +819,13 @@ class FastMCP:
         server = uvicorn.Server(config)
         await server.serve()
 
-    async def run_streamable_http_async(self) -> None:
-        """Run the server using StreamableHTTP transport."""
+    async def run_streamable_http_async(self, sockets: list[socket.socket] | None = None) -> None:
+        """Run the server using StreamableHTTP transport.
+
+        Args:
+            sockets: Already bound listening sockets to serve on instead of
+                binding host and port, as pre-forked workers do
+        """
         import uvicorn
 
         starlette_app = self.streamable_http_app()
@@ -664,7 +837,24 @@ class FastMCP:
             log_level=self.settings.log_level.lower(),
         )
         server = uvicorn.Server(config)
-        await server.serve()
+        await server.serve(sockets=sockets)
+
+    def _run_streamable_http_workers(self) -> None:
+        """Serve StreamableHTTP from several pre-forked worker processes sharing one socket."""
+        if not self.settings.stateless_http:
+            raise ValueError(
+                "Running more than one worker requires stateless_http=True: "
+                "sessions live in a single process and cannot be shared between workers"
+            )
+        from mcp.server.prefork import run_prefork
+
+        logger.info(f"Starting {self.settings.workers} StreamableHTTP workers")
+        run_prefork(
+            lambda sock: anyio.run(self.run_streamable_http_async, [sock]),
+            self.settings.host,
+            self.settings.port,
+            self.settings.workers,
+        )
 
     def _normalize_path(self, mount_path: str, endpoint: str) -> str:
         """
@@ -759,6 +949,7 @@ class FastMCP:
                         service_documentation_url=self.settings.auth.service_documentation_url,
                         client_registration_options=self.settings.auth.client_registration_options,
                         revocation_options=self.settings.auth.revocation_options,
+                        on_token_revoked=self._token_cache.token_revoked if self._token_cache else None,
                     )
                 )
 
@@ -823,7 +1014,24 @@ class FastMCP:
         routes.extend(self._custom_starlette_routes)
 
         # Create Starlette app with routes and middleware
-        return Starlette(debug=self.settings.debug, routes=routes, middleware=middleware)
+        return Starlette(
+            debug=self.settings.debug,
+            routes=routes,
+            middleware=middleware,
+            lifespan=lambda app: self._app_lifespan(),
+        )
+
+    @asynccontextmanager
+    async def _app_lifespan(self, session_manager: StreamableHTTPSessionManager | None = None) -> AsyncIterator[None]:
+        """Starlette lifespan of the HTTP apps, holding the app lifespan open while they run."""
+        async with AsyncExitStack() as stack:
+            if session_manager is not None:
+                await stack.enter_async_context(session_manager.run())
+            # Entered after the session manager, so it is released first on shutdown
+            # while sessions can still finish the work they have in flight
+            if isinstance(self._mcp_server.lifespan, SharedLifespan):
+                await stack.enter_async_context(self._mcp_server.lifespan(self._mcp_server))
+            yield
 
     def streamable_http_app(self) -> Starlette:
         """Return an instance of the StreamableHTTP server app."""
@@ -838,6 +1046,8 @@ class FastMCP:
                 json_response=self.settings.json_response,
                 stateless=self.settings.stateless_http,  # Use the stateless setting
                 security_settings=self.settings.transport_security,
+                session_idle_timeout=self.settings.session_idle_timeout,
+                max_sessions=self.settings.max_sessions,
             )
 
         # Create the ASGI handler
@@ -874,6 +1084,7 @@ class FastMCP:
                         service_documentation_url=self.settings.auth.service_documentation_url,
                         client_registration_options=self.settings.auth.client_registration_options,
                         revocation_options=self.settings.auth.revocation_options,
+                        on_token_revoked=self._token_cache.token_revoked if self._token_cache else None,
                     )
                 )
 
@@ -931,28 +1142,12 @@ class FastMCP:
             debug=self.settings.debug,
             routes=routes,
             middleware=middleware,
-            lifespan=lambda app: self.session_manager.run(),
+            lifespan=lambda app: self._app_lifespan(self.session_manager),
         )
 
     async def list_prompts(self) -> list[MCPPrompt]:
         """List all available prompts."""
-        prompts = self._prompt_manager.list_prompts()
-        return [
-            MCPPrompt(
-                name=prompt.name,
-                title=prompt.title,
-                description=prompt.description,
-                arguments=[
-                    MCPPromptArgument(
-                        name=arg.name,
-                        description=arg.description,
-                        required=arg.required,
-                    )
-                    for arg in (prompt.arguments or [])
-                ],
-            )
-            for prompt in prompts
-        ]
+        return [model.model_copy(deep=True) for model in self._prompt_listing.refresh()]
 
     async def get_prompt(self, name: str, arguments: dict[str, Any] | None = None) -> GetPromptResult:
         """Get a prompt by name with arguments."""
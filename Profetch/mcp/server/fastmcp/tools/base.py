@@ -6,10 +6,12 @@ from collections.abc import Callable
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, get_origin
 
+import anyio
 from pydantic import BaseModel, Field
 
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.utilities.func_metadata import FuncMetadata, func_metadata
+from mcp.shared import tracing
 from mcp.types import ToolAnnotations
 
 if TYPE_CHECKING:
@@ -32,6 +34,7 @@ class Tool(BaseModel):
     is_async: bool = Field(description="Whether the tool is async")
     context_kwarg: str | None = Field(None, description="Name of the kwarg that should receive context")
     annotations: ToolAnnotations | None = Field(None, description="Optional annotations for the tool")
+    timeout: float | None = Field(None, description="Seconds the tool may run before it is cancelled")
 
     @cached_property
     def output_schema(self) -> dict[str, Any] | None:
@@ -47,6 +50,7 @@ class Tool(BaseModel):
         context_kwarg: str | None = None,
         annotations: ToolAnnotations | None = None,
         structured_output: bool | None = None,
+        timeout: float | None = None,
     ) -> Tool:
         """Create a Tool from a function."""
         from mcp.server.fastmcp.server import Context
@@ -85,6 +89,7 @@ class Tool(BaseModel):
             is_async=is_async,
             context_kwarg=context_kwarg,
             annotations=annotations,
+            timeout=timeout,
         )
 
     async def run(
@@ -92,22 +97,33 @@ class Tool(BaseModel):
         arguments: dict[str, Any],
         context: Context[ServerSessionT, LifespanContextT, RequestT] | None = None,
         convert_result: bool = False,
+        timeout: float | None = None,
     ) -> Any:
-        """Run the tool with arguments."""
-        try:
-            result = await self.fn_metadata.call_fn_with_arg_validation(
-                self.fn,
-                self.is_async,
-                arguments,
-                {self.context_kwarg: context} if self.context_kwarg is not None else None,
-            )
-
-            if convert_result:
-                result = self.fn_metadata.convert_result(result)
-
-            return result
-        except Exception as e:
-            raise ToolError(f"Error executing tool {self.name}: {e}") from e
+        """Run the tool with arguments.
+
+        Args:
+            timeout: Seconds before the tool is cancelled, overriding the tool's own
+                timeout. Only async tools can be interrupted; a sync tool blocks
+                the event loop until it returns.
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        with anyio.move_on_after(timeout):
+            try:
+                result = await self.fn_metadata.call_fn_with_arg_validation(
+                    self.fn,
+                    self.is_async,
+                    arguments,
+                    {self.context_kwarg: context} if self.context_kwarg is not None else None,
+                )
+
+                if convert_result:
+                    with tracing.span("tool.convert_result", tool=self.name):
+                        result = self.fn_metadata.convert_result(result)
+
+                return result
+            except Exception as e:
+                raise ToolError(f"Error executing tool {self.name}: {e}") from e
+        raise ToolError(f"Tool {self.name} timed out after {timeout} seconds")
 
 
 def _is_async_callable(obj: Any) -> bool:
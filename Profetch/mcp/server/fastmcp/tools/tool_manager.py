@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from mcp.server.fastmcp.exceptions import ToolError
 from mcp.server.fastmcp.tools.base import Tool
 from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.server.fastmcp.utilities.profiling import ToolProfiler
 from mcp.shared.context import LifespanContextT, RequestT
 from mcp.types import ToolAnnotations
 
@@ -33,6 +34,8 @@ class ToolManager:
                 self._tools[tool.name] = tool
 
         self.warn_on_duplicate_tools = warn_on_duplicate_tools
+        # Profiles a sample of tool calls when set
+        self.profiler: ToolProfiler | None = None
 
     def get_tool(self, name: str) -> Tool | None:
         """Get tool by name."""
@@ -50,6 +53,7 @@ class ToolManager:
         description: str | None = None,
         annotations: ToolAnnotations | None = None,
         structured_output: bool | None = None,
+        timeout: float | None = None,
     ) -> Tool:
         """Add a tool to the server."""
         tool = Tool.from_function(
@@ -59,6 +63,7 @@ class ToolManager:
             description=description,
             annotations=annotations,
             structured_output=structured_output,
+            timeout=timeout,
         )
         existing = self._tools.get(tool.name)
         if existing:
@@ -80,4 +85,8 @@ class ToolManager:
         if not tool:
             raise ToolError(f"Unknown tool: {name}")
 
+        profiler = self.profiler
+        if profiler is not None and profiler.should_profile(name):
+            with profiler.profile(name):
+                return await tool.run(arguments, context=context, convert_result=convert_result)
         return await tool.run(arguments, context=context, convert_result=convert_result)
@@ -1,15 +1,18 @@
+import enum
 import inspect
 import json
+import types
 from collections.abc import Awaitable, Callable, Sequence
 from itertools import chain
 from types import GenericAlias
-from typing import Annotated, Any, ForwardRef, cast, get_args, get_origin, get_type_hints
+from typing import Annotated, Any, ForwardRef, Literal, Union, cast, get_args, get_origin, get_type_hints
 
 import pydantic_core
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     RootModel,
     WithJsonSchema,
     create_model,
@@ -22,6 +25,7 @@ from pydantic_core import PydanticUndefined
 from mcp.server.fastmcp.exceptions import InvalidSignature
 from mcp.server.fastmcp.utilities.logging import get_logger
 from mcp.server.fastmcp.utilities.types import Image
+from mcp.shared import tracing
 from mcp.types import ContentBlock, TextContent
 
 logger = get_logger(__name__)
@@ -62,6 +66,15 @@ class FuncMetadata(BaseModel):
     output_model: Annotated[type[BaseModel], WithJsonSchema(None)] | None = None
     wrap_output: bool = False
 
+    # Fields whose annotation can hold a list, dict or model, i.e. the only ones
+    # where a JSON-encoded string argument is worth pre-parsing.
+    _pre_parse_fields: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        self._pre_parse_fields = tuple(
+            name for name, field in self.arg_model.model_fields.items() if _accepts_structured(field.annotation)
+        )
+
     async def call_fn_with_arg_validation(
         self,
         fn: Callable[..., Any | Awaitable[Any]],
@@ -74,16 +87,19 @@ class FuncMetadata(BaseModel):
         Arguments are first attempted to be parsed from JSON, then validated against
         the argument model, before being passed to the function.
         """
-        arguments_pre_parsed = self.pre_parse_json(arguments_to_validate)
-        arguments_parsed_model = self.arg_model.model_validate(arguments_pre_parsed)
-        arguments_parsed_dict = arguments_parsed_model.model_dump_one_level()
+        with tracing.span("tool.validate_arguments"):
+            if self._pre_parse_fields:
+                arguments_to_validate = self.pre_parse_json(arguments_to_validate)
+            arguments_parsed_model = self.arg_model.__pydantic_validator__.validate_python(arguments_to_validate)
+            arguments_parsed_dict = arguments_parsed_model.model_dump_one_level()
 
         arguments_parsed_dict |= arguments_to_pass_directly or {}
 
-        if fn_is_async:
-            return await fn(**arguments_parsed_dict)
-        else:
-            return fn(**arguments_parsed_dict)
+        with tracing.span("tool.call", fn=getattr(fn, "__name__", None)):
+            if fn_is_async:
+                return await fn(**arguments_parsed_dict)
+            else:
+                return fn(**arguments_parsed_dict)
 
     def convert_result(self, result: Any) -> Any:
         """
@@ -125,9 +141,12 @@ class FuncMetadata(BaseModel):
         a string rather than an actual list. Claude desktop is prone to this - in fact
         it seems incapable of NOT doing this. For sub-models, it tends to pass
         dicts (JSON objects) as JSON strings, which can be pre-parsed here.
+
+        Only fields whose type can hold a structured value are considered, so a
+        `str` argument that happens to look like JSON is passed through as-is.
         """
         new_data = data.copy()  # Shallow copy
-        for field_name in self.arg_model.model_fields.keys():
+        for field_name in self._pre_parse_fields:
             if field_name not in data.keys():
                 continue
             if isinstance(data[field_name], str):
@@ -149,6 +168,26 @@ class FuncMetadata(BaseModel):
     )
 
 
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _accepts_structured(annotation: Any) -> bool:
+    """Whether a field of this type could accept a list, dict or model value.
+
+    Unknown types are assumed to, which keeps JSON pre-parsing enabled for them.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _accepts_structured(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        return any(_accepts_structured(arg) for arg in get_args(annotation))
+    if origin is Literal:
+        return False
+    if isinstance(annotation, type) and (annotation in _SCALAR_TYPES or issubclass(annotation, enum.Enum)):
+        return False
+    return annotation is not None
+
+
 def func_metadata(
     func: Callable[..., Any],
     skip_names: Sequence[str] = (),
@@ -0,0 +1,79 @@
+"""Prebuilt, paginated list_* responses for FastMCP."""
+
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel
+
+from mcp.shared.exceptions import McpError
+from mcp.shared.session import PreparedResult
+from mcp.types import INVALID_PARAMS, ErrorData
+
+EntryT = TypeVar("EntryT")
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class Listing(Generic[EntryT, ModelT]):
+    """The protocol models for one kind of component, kept serialized.
+
+    FastMCP's managers mostly append components, so instead of rebuilding
+    every model on each list request the listing keeps the entries it
+    converted and checks them by identity against the manager's: models
+    are rebuilt from the first entry that was replaced or removed (as
+    ``add_template`` does for an existing URI template), and otherwise only
+    the newly added entries are converted and dumped. Pages are slices of
+    the dumped entries, and cursors are offsets into them, which stay valid
+    as more components are added.
+
+    The models returned by ``refresh`` are shared with later list requests
+    and must not be modified; FastMCP's public list methods return copies.
+    """
+
+    def __init__(
+        self,
+        field: str,
+        source: Callable[[], list[EntryT]],
+        convert: Callable[[EntryT], ModelT],
+        on_add: Callable[[ModelT], None] | None = None,
+    ):
+        self.field = field
+        self._source = source
+        self._convert = convert
+        self._on_add = on_add
+        self._entries: list[EntryT] = []
+        self._models: list[ModelT] = []
+        self._items: list[dict[str, Any]] = []
+
+    def refresh(self) -> list[ModelT]:
+        """Convert any entries added or replaced since the last refresh and return all models."""
+        entries = self._source()
+        start = 0
+        for start, (entry, known) in enumerate(zip(entries, self._entries)):
+            if entry is not known:
+                break
+        else:
+            start = min(len(entries), len(self._entries))
+        if start < len(self._entries):
+            del self._entries[start:], self._models[start:], self._items[start:]
+        for entry in entries[start:]:
+            model = self._convert(entry)
+            self._entries.append(entry)
+            self._models.append(model)
+            self._items.append(model.model_dump(by_alias=True, mode="json", exclude_none=True))
+            if self._on_add is not None:
+                self._on_add(model)
+        return self._models
+
+    def page(self, cursor: str | None, page_size: int | None) -> PreparedResult:
+        """The list result starting at cursor, with a nextCursor if more remain."""
+        self.refresh()
+        start = 0
+        if cursor is not None:
+            if not cursor.isdigit() or int(cursor) > len(self._items):
+                raise McpError(ErrorData(code=INVALID_PARAMS, message=f"Invalid cursor: {cursor!r}"))
+            start = int(cursor)
+        end = len(self._items) if page_size is None else min(start + page_size, len(self._items))
+        data: dict[str, Any] = {self.field: self._items[start:end]}
+        if end < len(self._items):
+            data["nextCursor"] = str(end)
+        return PreparedResult(data)
@@ -0,0 +1,311 @@
+"""Opt-in profiling of sampled FastMCP tool calls.
+
+A ToolProfiler picks tool calls by tool name and sample rate, profiles each
+one, and writes the profile to a file named after the call:
+
+- "deterministic" runs cProfile and writes ``<call_id>.prof`` (pstats; open
+  it with ``python -m pstats`` or snakeviz).
+- "statistical" samples the call's thread stacks every ``interval`` seconds
+  and writes ``<call_id>.folded``, collapsed stacks for flamegraph.pl or
+  speedscope. Overhead is bounded by the interval.
+
+Only one call is profiled at a time: calls overlapping a profiled call run
+unprofiled. The profiled call runs on the event loop thread, so anything
+else the loop runs while the tool awaits is profiled with it. Work a tool
+hands to other threads is included when those threads run it inside
+profile_thread(), which reads the call from a context variable that
+contextvars.copy_context() carries into the thread.
+
+Profiles are written by a writer thread, so a profiled call returns without
+waiting on the file, and summary() lists a call once its profile is written.
+
+With no profiler configured, a tool call pays one attribute check.
+"""
+
+import cProfile
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from types import FrameType, TracebackType
+from typing import Any, Literal
+
+from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.shared import tracing
+
+logger = get_logger(__name__)
+
+ProfileMode = Literal["deterministic", "statistical"]
+
+_NULL_CONTEXT = nullcontext()
+
+
+class ProfiledCall:
+    """One tool call being profiled, and then its summary."""
+
+    def __init__(self, profiler: "ToolProfiler", tool: str, call_id: str):
+        self.profiler = profiler
+        self.tool = tool
+        self.call_id = call_id
+        self.path = ""
+        self.duration = 0.0
+        self.top: list[dict[str, Any]] = []
+        self._profiles: list[cProfile.Profile] = []
+        self._stacks: Counter[str] = Counter()
+        self._threads: set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._thread_profile: _ThreadProfile | None = None
+        self._start = 0.0
+
+    def __enter__(self) -> "ProfiledCall":
+        self._token = _current_call.set(self)
+        self._start = time.perf_counter()
+        if self.profiler.mode == "statistical":
+            self._sampler = threading.Thread(target=self._sample, name=f"profiler-{self.call_id}", daemon=True)
+            self._sampler.start()
+        self._thread_profile = _ThreadProfile(self)
+        self._thread_profile.__enter__()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        try:
+            assert self._thread_profile is not None
+            self._thread_profile.__exit__(exc_type, exc, tb)
+            if self._sampler is not None:
+                # Joined by the writer thread, so the loop does not wait out an interval
+                self._stop.set()
+            self.duration = time.perf_counter() - self._start
+            self.profiler._finish(self)  # type: ignore[reportPrivateUsage]
+        finally:
+            _current_call.reset(self._token)
+
+    def thread(self) -> AbstractContextManager[Any]:
+        """Profile the current thread as part of this call until the block exits."""
+        return _ThreadProfile(self)
+
+    def _enable(self, profile: cProfile.Profile) -> bool:
+        try:
+            profile.enable()
+        except ValueError:  # Python 3.12+: one profiler at a time, already covering every thread
+            return False
+        with self._lock:
+            self._profiles.append(profile)
+        return True
+
+    def _sample(self) -> None:
+        interval = self.profiler.interval
+        while not self._stop.wait(interval):
+            frames = sys._current_frames()  # type: ignore[reportPrivateUsage]
+            with self._lock:
+                threads = list(self._threads)
+            for ident in threads:
+                frame = frames.get(ident)
+                if frame is not None:
+                    self._stacks[_collapse(frame)] += 1
+
+    def _write(self, directory: Path, limit: int) -> None:
+        if self._sampler is not None:
+            self._sampler.join()
+        if self.profiler.mode == "statistical":
+            self.path = str(directory / f"{self.call_id}.folded")
+            with open(self.path, "w") as f:
+                f.writelines(f"{stack} {count}\n" for stack, count in self._stacks.most_common())
+            self.top = _top_sampled(self._stacks, limit)
+        elif self._profiles:
+            self.path = str(directory / f"{self.call_id}.prof")
+            stats = pstats.Stats(*self._profiles)
+            stats.dump_stats(self.path)
+            self.top = _top_profiled(stats, limit)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "call_id": self.call_id,
+            "tool": self.tool,
+            "duration": self.duration,
+            "path": self.path,
+            "top": self.top,
+        }
+
+
+class _ThreadProfile:
+    def __init__(self, call: ProfiledCall):
+        self._call = call
+        self._profile: cProfile.Profile | None = None
+
+    def __enter__(self) -> None:
+        call = self._call
+        if call.profiler.mode == "statistical":
+            with call._lock:  # type: ignore[reportPrivateUsage]
+                call._threads.add(threading.get_ident())  # type: ignore[reportPrivateUsage]
+        else:
+            profile = cProfile.Profile()
+            if call._enable(profile):  # type: ignore[reportPrivateUsage]
+                self._profile = profile
+
+    def __exit__(self, *exc_info: Any) -> None:
+        call = self._call
+        if call.profiler.mode == "statistical":
+            with call._lock:  # type: ignore[reportPrivateUsage]
+                call._threads.discard(threading.get_ident())  # type: ignore[reportPrivateUsage]
+        elif self._profile is not None:
+            self._profile.disable()
+
+
+# The call being profiled in this context, for profile_thread()
+_current_call: ContextVar[ProfiledCall | None] = ContextVar("mcp_profiled_call", default=None)
+
+
+def profile_thread() -> AbstractContextManager[Any]:
+    """Include the current thread in the profiled call that started this work, if any.
+
+    Use it around work run in another thread on behalf of a tool call, in a
+    copy of the caller's context.
+    """
+    call = _current_call.get()
+    if call is None:
+        return _NULL_CONTEXT
+    return call.thread()
+
+
+class ToolProfiler:
+    """Profiles a sample of tool calls and keeps summaries of the latest ones.
+
+    Args:
+        directory: Where profiles are written, created if missing.
+        mode: "deterministic" (cProfile) or "statistical" (stack sampling).
+        sample_rate: Fraction of calls profiled, when ``tools`` is not given.
+        tools: Per-tool sample rates. When given, only these tools are profiled.
+        interval: Seconds between stack samples in statistical mode.
+        keep: Number of recent call summaries kept for summary().
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        mode: ProfileMode = "deterministic",
+        sample_rate: float = 1.0,
+        tools: dict[str, float] | None = None,
+        interval: float = 0.001,
+        keep: int = 100,
+    ):
+        if mode not in ("deterministic", "statistical"):
+            raise ValueError(f"Unknown profile mode: {mode}")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.mode: ProfileMode = mode
+        self.sample_rate = sample_rate
+        self.tools = tools
+        self.interval = interval
+        self.calls: deque[ProfiledCall] = deque(maxlen=keep)
+        self._calls_lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+        self._active = False
+        self._seq = 0
+
+    def should_profile(self, tool: str) -> bool:
+        if self._active:
+            return False
+        rate = self.sample_rate if self.tools is None else self.tools.get(tool, 0.0)
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def profile(self, tool: str) -> ProfiledCall:
+        """Profile the block as a call to ``tool``."""
+        self._active = True
+        self._seq += 1
+        request_id = tracing.request_id.get()
+        call_id = "-".join(
+            [time.strftime("%Y%m%dT%H%M%S"), str(os.getpid()), str(self._seq), tool]
+            + ([str(request_id)] if request_id is not None else [])
+        )
+        return ProfiledCall(self, tool, re.sub(r"[^\w.-]", "_", call_id))
+
+    def _finish(self, call: ProfiledCall) -> None:
+        self._active = False
+        self._writer.submit(self._write, call)
+
+    def _write(self, call: ProfiledCall) -> None:
+        try:
+            call._write(self.directory, limit=10)  # type: ignore[reportPrivateUsage]
+        except Exception:
+            logger.exception(f"Failed to write the profile of {call.call_id}")
+            return
+        with self._calls_lock:
+            self.calls.append(call)
+
+    def flush(self) -> None:
+        """Wait until the profiles of calls that have finished are written."""
+        self._writer.submit(lambda: None).result()
+
+    def summary(self, limit: int = 20) -> dict[str, Any]:
+        """The recent profiled calls and the functions that took most of their time.
+
+        ``self`` and ``total`` are seconds in deterministic mode and sample
+        counts in statistical mode.
+        """
+        with self._calls_lock:
+            calls = list(self.calls)
+        totals: dict[str, dict[str, float]] = {}
+        for call in calls:
+            for entry in call.top:
+                total = totals.setdefault(entry["function"], {"self": 0, "total": 0, "profiles": 0})
+                total["self"] += entry["self"]
+                total["total"] += entry["total"]
+                total["profiles"] += 1
+        top = sorted(totals.items(), key=lambda item: item[1]["self"], reverse=True)[:limit]
+        return {
+            "mode": self.mode,
+            "directory": str(self.directory),
+            "top_functions": [{"function": function, **values} for function, values in top],
+            "calls": [call.summary() for call in reversed(calls)],
+        }
+
+
+def _describe(code: Any) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _collapse(frame: FrameType) -> str:
+    names: list[str] = []
+    current: FrameType | None = frame
+    while current is not None:
+        names.append(_describe(current.f_code).replace(";", ":"))
+        current = current.f_back
+    return ";".join(reversed(names))
+
+
+def _top_sampled(stacks: Counter[str], limit: int) -> list[dict[str, Any]]:
+    own: Counter[str] = Counter()
+    total: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        functions = stack.split(";")
+        own[functions[-1]] += count
+        for function in set(functions):
+            total[function] += count
+    return [{"function": function, "self": n, "total": total[function]} for function, n in own.most_common(limit)]
+
+
+def _top_profiled(stats: pstats.Stats, limit: int) -> list[dict[str, Any]]:
+    entries = stats.stats.items()  # type: ignore[attr-defined]
+    top = sorted(entries, key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{name} ({os.path.basename(filename)}:{line})",
+            "self": tottime,
+            "total": cumtime,
+        }
+        for (filename, line, name), (_, _, tottime, cumtime, _) in top
+    ]
@@ -0,0 +1,226 @@
+"""
+Admission control for requests handled by the lowlevel Server.
+
+A ConcurrencyLimiter runs at most ``max_concurrent`` requests at once and
+parks up to ``max_queued`` more in a priority queue. Anything beyond that is
+rejected straight away with a SERVER_BUSY error, so an overloaded server
+sheds load instead of piling up work. Cheap requests (ping, list_*) queue
+ahead of tool calls and, when the queue is full, displace the newest queued
+tool call, so health checks and discovery stay responsive while tool calls
+saturate the server.
+
+Example:
+    limiter = ConcurrencyLimiter(max_concurrent=8, max_queued=32)
+    slot = await limiter.acquire(request_priority(request))
+    try:
+        ...
+    finally:
+        slot.release()
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+
+import mcp.types as types
+from mcp.shared.exceptions import McpError
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+_CHEAP_REQUESTS = (
+    types.PingRequest,
+    types.ListToolsRequest,
+    types.ListPromptsRequest,
+    types.ListResourcesRequest,
+    types.ListResourceTemplatesRequest,
+    types.SetLevelRequest,
+)
+
+
+def request_priority(request: Any) -> int:
+    """Queue priority of a request: cheap protocol requests go before tool calls."""
+    return PRIORITY_HIGH if isinstance(request, _CHEAP_REQUESTS) else PRIORITY_NORMAL
+
+
+@dataclass
+class LimiterStats:
+    """Counters for one concurrency limit. Several limiters may share one instance."""
+
+    in_flight: int = 0
+    queued: int = 0
+    admitted: int = 0
+    waited: int = 0  # admitted after queueing
+    rejected: int = 0
+    abandoned: int = 0  # cancelled while queued
+    wait_seconds: float = 0.0
+    peak_in_flight: int = 0
+    peak_queued: int = 0
+
+
+class Reservation:
+    """A running slot, or a place in the queue waiting for one."""
+
+    def __init__(self, limiter: ConcurrencyLimiter, granted: bool):
+        self._limiter = limiter
+        self._event = None if granted else anyio.Event()
+        self._queued_at = time.monotonic()
+        self.granted = granted
+        self.released = False
+        self.abandoned = False
+        self._error: types.ErrorData | None = None
+
+    async def wait(self) -> None:
+        """Wait until the slot is granted. Leaves the queue if cancelled.
+
+        Raises:
+            McpError: SERVER_BUSY if a higher priority request displaced this one
+        """
+        if self._event is None:
+            return
+        try:
+            await self._event.wait()
+        except BaseException:
+            self._limiter._abandon(self)  # type: ignore[reportPrivateUsage]
+            raise
+        if self._error is not None:
+            raise McpError(self._error)
+
+    def release(self) -> None:
+        """Give the slot to the next queued request. Safe to call more than once."""
+        self._limiter._release(self)  # type: ignore[reportPrivateUsage]
+
+    def _grant(self) -> float:
+        assert self._event is not None
+        self.granted = True
+        self._event.set()
+        return time.monotonic() - self._queued_at
+
+    def _reject(self, error: types.ErrorData) -> None:
+        assert self._event is not None
+        self.abandoned = True
+        self._error = error
+        self._event.set()
+
+
+class ConcurrencyLimiter:
+    """Caps concurrent requests, with a bounded priority queue for the overflow."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int = 0,
+        name: str = "server",
+        stats: LimiterStats | None = None,
+    ):
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        if max_queued < 0:
+            raise ValueError(f"max_queued must not be negative, got {max_queued}")
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.name = name
+        self.stats = stats or LimiterStats()
+        self._in_flight = 0
+        self._queued = 0
+        self._queue: list[tuple[int, int, Reservation]] = []
+        self._counter = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def reserve(self, priority: int = PRIORITY_NORMAL) -> Reservation:
+        """Take a slot or a queue position without waiting.
+
+        Raises:
+            McpError: SERVER_BUSY when every slot and queue position is taken
+        """
+        stats = self.stats
+        if self._in_flight < self.max_concurrent and not self._queued:
+            self._in_flight += 1
+            stats.in_flight += 1
+            stats.admitted += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            return Reservation(self, granted=True)
+        if self._queued >= self.max_queued and not self._displace(priority):
+            stats.rejected += 1
+            raise McpError(self._busy_error())
+        reservation = Reservation(self, granted=False)
+        heapq.heappush(self._queue, (priority, next(self._counter), reservation))
+        self._queued += 1
+        stats.queued += 1
+        stats.peak_queued = max(stats.peak_queued, stats.queued)
+        return reservation
+
+    def _busy_error(self) -> types.ErrorData:
+        return types.ErrorData(
+            code=types.SERVER_BUSY,
+            message=f"Server busy: {self.name} limit of {self.max_concurrent} concurrent requests reached",
+            data={"limit": self.name, "inFlight": self._in_flight, "queued": self._queued},
+        )
+
+    def _displace(self, priority: int) -> bool:
+        """Reject the newest queued request of lower priority to make room."""
+        victim = max(
+            (entry for entry in self._queue if not entry[2].abandoned and entry[0] > priority),
+            default=None,
+        )
+        if victim is None:
+            return False
+        self._queued -= 1
+        self.stats.queued -= 1
+        self.stats.rejected += 1
+        victim[2]._reject(self._busy_error())  # type: ignore[reportPrivateUsage]
+        return True
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> Reservation:
+        """Reserve a slot and wait for it to be granted."""
+        reservation = self.reserve(priority)
+        await reservation.wait()
+        return reservation
+
+    def _release(self, reservation: Reservation) -> None:
+        if not reservation.granted or reservation.released:
+            return
+        reservation.released = True
+        stats = self.stats
+        while self._queue:
+            _, _, waiter = heapq.heappop(self._queue)
+            if waiter.abandoned:
+                continue
+            # Hand the slot straight to the next waiter; in_flight is unchanged.
+            self._queued -= 1
+            stats.queued -= 1
+            stats.admitted += 1
+            stats.waited += 1
+            stats.wait_seconds += waiter._grant()  # type: ignore[reportPrivateUsage]
+            return
+        self._in_flight -= 1
+        stats.in_flight -= 1
+
+    def _abandon(self, reservation: Reservation) -> None:
+        if reservation.granted:
+            # Granted just as the waiter was cancelled: pass the slot on.
+            self._release(reservation)
+            return
+        if reservation.abandoned:
+            return
+        reservation.abandoned = True
+        self._queued -= 1
+        self.stats.queued -= 1
+        self.stats.abandoned += 1
+        if len(self._queue) > 2 * (self._queued + 1):
+            # Drop abandoned entries so a flood of cancellations cannot grow the heap.
+            self._queue = [entry for entry in self._queue if not entry[2].abandoned]
+            heapq.heapify(self._queue)
@@ -68,6 +68,7 @@ messages from the client.
 from __future__ import annotations as _annotations
 
 import contextvars
+import dataclasses
 import json
 import logging
 import warnings
@@ -82,10 +83,12 @@ from pydantic import AnyUrl
 from typing_extensions import TypeVar
 
 import mcp.types as types
+from mcp.server.lowlevel.concurrency import ConcurrencyLimiter, LimiterStats, Reservation, request_priority
 from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.server.models import InitializationOptions
 from mcp.server.session import ServerSession
 from mcp.server.stdio import stdio_server as stdio_server
+from mcp.shared import tracing
 from mcp.shared.context import RequestContext
 from mcp.shared.exceptions import McpError
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
@@ -140,11 +143,26 @@ class Server(Generic[LifespanResultT, RequestT]):
             [Server[LifespanResultT, RequestT]],
             AbstractAsyncContextManager[LifespanResultT],
         ] = lifespan,
+        max_concurrent_requests: int | None = None,
+        max_queued_requests: int = 64,
+        max_concurrent_requests_per_session: int | None = None,
+        max_queued_requests_per_session: int = 16,
     ):
         self.name = name
         self.version = version
         self.instructions = instructions
         self.lifespan = lifespan
+        # Requests beyond the concurrency limits wait in a bounded queue; once
+        # that is full they are rejected with SERVER_BUSY. Notifications are
+        # never limited, so cancellations always get through.
+        self._request_limiter = (
+            ConcurrencyLimiter(max_concurrent_requests, max_queued_requests, name="server")
+            if max_concurrent_requests is not None
+            else None
+        )
+        self.max_concurrent_requests_per_session = max_concurrent_requests_per_session
+        self.max_queued_requests_per_session = max_queued_requests_per_session
+        self._session_limiter_stats = LimiterStats()
         self.request_handlers: dict[type, Callable[..., Awaitable[types.ServerResult]]] = {
             types.PingRequest: _ping_handler,
         }
@@ -153,6 +171,19 @@ class Server(Generic[LifespanResultT, RequestT]):
         self._tool_cache: dict[str, types.Tool] = {}
         logger.debug("Initializing server %r", name)
 
+    def concurrency_stats(self) -> dict[str, dict[str, Any]]:
+        """Counters for each configured concurrency limit.
+
+        The "session" entry aggregates the per-session limiters of every
+        session this server has run.
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        if self._request_limiter is not None:
+            stats["server"] = dataclasses.asdict(self._request_limiter.stats)
+        if self.max_concurrent_requests_per_session is not None:
+            stats["session"] = dataclasses.asdict(self._session_limiter_stats)
+        return stats
+
     def create_initialization_options(
         self,
         notification_options: NotificationOptions | None = None,
@@ -583,16 +614,39 @@ class Server(Generic[LifespanResultT, RequestT]):
                 )
             )
 
+            session_limiter = (
+                ConcurrencyLimiter(
+                    self.max_concurrent_requests_per_session,
+                    self.max_queued_requests_per_session,
+                    name="session",
+                    stats=self._session_limiter_stats,
+                )
+                if self.max_concurrent_requests_per_session is not None
+                else None
+            )
+
             async with anyio.create_task_group() as tg:
                 async for message in session.incoming_messages:
                     logger.debug("Received message: %s", message)
 
+                    reservation = None
+                    if session_limiter is not None and isinstance(message, RequestResponder):
+                        # Reserve before spawning a task, so a flooding client is
+                        # turned away here instead of piling up parked tasks.
+                        try:
+                            reservation = session_limiter.reserve(request_priority(message.request.root))
+                        except McpError as err:
+                            with message:
+                                await message.respond(err.error)
+                            continue
+
                     tg.start_soon(
                         self._handle_message,
                         message,
                         session,
                         lifespan_context,
                         raise_exceptions,
+                        reservation,
                     )
 
     async def _handle_message(
@@ -601,19 +655,48 @@ class Server(Generic[LifespanResultT, RequestT]):
         session: ServerSession,
         lifespan_context: LifespanResultT,
         raise_exceptions: bool = False,
+        reservation: Reservation | None = None,
     ):
         with warnings.catch_warnings(record=True) as w:
             # TODO(Marcelo): We should be checking if message is Exception here.
             match message:  # type: ignore[reportMatchNotExhaustive]
                 case RequestResponder(request=types.ClientRequest(root=req)) as responder:
                     with responder:
-                        await self._handle_request(message, req, session, lifespan_context, raise_exceptions)
+                        try:
+                            slots = await self._acquire_slots(req, reservation)
+                        except McpError as err:
+                            await responder.respond(err.error)
+                        else:
+                            try:
+                                await self._handle_request(message, req, session, lifespan_context, raise_exceptions)
+                            finally:
+                                for slot in slots:
+                                    slot.release()
                 case types.ClientNotification(root=notify):
                     await self._handle_notification(notify)
 
             for warning in w:
                 logger.info("Warning: %s: %s", warning.category.__name__, warning.message)
 
+    async def _acquire_slots(self, req: Any, reservation: Reservation | None) -> list[Reservation]:
+        """Wait for the session slot, then take a server-wide one.
+
+        Raises:
+            McpError: SERVER_BUSY when the server-wide queue is full
+        """
+        slots: list[Reservation] = []
+        try:
+            if reservation is not None:
+                await reservation.wait()
+                slots.append(reservation)
+            if self._request_limiter is not None:
+                slots.append(await self._request_limiter.acquire(request_priority(req)))
+        except BaseException:
+            for slot in slots:
+                slot.release()
+            raise
+        return slots
+
     async def _handle_request(
         self,
         message: RequestResponder[types.ClientRequest, types.ServerResult],
@@ -627,6 +710,7 @@ class Server(Generic[LifespanResultT, RequestT]):
             logger.debug("Dispatching request of type %s", type(req).__name__)
 
             token = None
+            trace_token = tracing.request_id.set(message.request_id)
             try:
                 # Extract request context from message metadata
                 request_data = None
@@ -644,7 +728,8 @@ class Server(Generic[LifespanResultT, RequestT]):
                         request=request_data,
                     )
                 )
-                response = await handler(req)
+                with tracing.span("server.handle", method=getattr(req, "method", type(req).__name__)):
+                    response = await handler(req)
             except McpError as err:
                 response = err.error
             except Exception as err:
@@ -656,7 +741,10 @@ class Server(Generic[LifespanResultT, RequestT]):
                 if token is not None:
                     request_ctx.reset(token)
 
-            await message.respond(response)
+            try:
+                await message.respond(response)
+            finally:
+                tracing.request_id.reset(trace_token)
         else:
             await message.respond(
                 types.ErrorData(
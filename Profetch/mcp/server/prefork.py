@@ -0,0 +1,109 @@
+"""
+Pre-fork supervisor for serving one listening socket from several processes.
+
+The parent binds the socket once and forks the workers, which all accept
+connections from it; the kernel spreads connections across them. Workers that
+exit unexpectedly are restarted. SIGINT and SIGTERM are forwarded to every
+worker, and the supervisor returns once they have all exited.
+
+Only stateless servers can be served this way: each worker is a separate
+process, so nothing held in one worker's memory is visible to the others.
+
+Example:
+    run_prefork(lambda sock: anyio.run(serve, [sock]), "127.0.0.1", 8000, workers=4)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from collections.abc import Callable
+from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Bind a listening TCP socket to be shared by forked workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.create_server((host, port), family=family, backlog=backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_prefork(
+    worker: Callable[[socket.socket], None],
+    host: str,
+    port: int,
+    workers: int,
+    restart_delay: float = 1.0,
+) -> None:
+    """Run ``worker(sock)`` in ``workers`` forked processes until signalled.
+
+    Args:
+        worker: Serves connections from the shared socket until told to stop
+        host: Address to bind
+        port: Port to bind
+        workers: Number of worker processes
+        restart_delay: Seconds to wait before replacing a crashed worker
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Running multiple workers requires os.fork(), which this platform does not provide")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    sock = bind_socket(host, port)
+    children: dict[int, int] = {}  # pid -> worker slot
+    stopping = False
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            status = 0
+            try:
+                worker(sock)
+            except BaseException:
+                logger.exception(f"Worker {os.getpid()} failed")
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+        children[pid] = slot
+        logger.info(f"Started worker {pid}")
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {signum: signal.signal(signum, stop) for signum in (signal.SIGINT, signal.SIGTERM)}
+    try:
+        for slot in range(workers):
+            spawn(slot)
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            slot = children.pop(pid, None)
+            if slot is None or stopping:
+                continue
+            logger.warning(f"Worker {pid} exited with code {os.waitstatus_to_exitcode(status)}; restarting")
+            time.sleep(restart_delay)
+            if not stopping:
+                spawn(slot)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+        sock.close()
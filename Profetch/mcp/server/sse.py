@@ -51,11 +51,11 @@ from starlette.requests import Request
 from starlette.responses import Response
 from starlette.types import Receive, Scope, Send
 
-import mcp.types as types
 from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared.batch import BatchCollector, is_batch, parse_messages
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -75,6 +75,7 @@ class SseServerTransport:
 
     _endpoint: str
     _read_stream_writers: dict[UUID, MemoryObjectSendStream[SessionMessage | Exception]]
+    _batch_collectors: dict[UUID, BatchCollector]
     _security: TransportSecurityMiddleware
 
     def __init__(self, endpoint: str, security_settings: TransportSecuritySettings | None = None) -> None:
@@ -115,6 +116,7 @@ class SseServerTransport:
 
         self._endpoint = endpoint
         self._read_stream_writers = {}
+        self._batch_collectors = {}
         self._security = TransportSecurityMiddleware(security_settings)
         logger.debug(f"SseServerTransport initialized with endpoint: {endpoint}")
 
@@ -143,6 +145,7 @@ class SseServerTransport:
 
         session_id = uuid4()
         self._read_stream_writers[session_id] = read_stream_writer
+        batches = self._batch_collectors[session_id] = BatchCollector()
         logger.debug(f"Created new session with ID: {session_id}")
 
         # Determine the full path for the message endpoint to be sent to the client.
@@ -168,14 +171,17 @@ class SseServerTransport:
                 await sse_stream_writer.send({"event": "endpoint", "data": client_post_uri_data})
                 logger.debug(f"Sent endpoint event: {client_post_uri_data}")
 
-                async for session_message in write_stream_reader:
-                    logger.debug(f"Sending message via SSE: {session_message}")
-                    await sse_stream_writer.send(
-                        {
-                            "event": "message",
-                            "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
-                        }
-                    )
+                async for outgoing in write_stream_reader:
+                    # Responses to a batched request are sent together once the
+                    # whole batch has been answered.
+                    for session_message in batches.collect([outgoing]):
+                        logger.debug(f"Sending message via SSE: {session_message}")
+                        await sse_stream_writer.send(
+                            {
+                                "event": "message",
+                                "data": session_message.message.model_dump_json(by_alias=True, exclude_none=True),
+                            }
+                        )
 
         async with anyio.create_task_group() as tg:
 
@@ -190,6 +196,7 @@ class SseServerTransport:
                 )
                 await read_stream_writer.aclose()
                 await write_stream_reader.aclose()
+                self._batch_collectors.pop(session_id, None)
                 logging.debug(f"Client session disconnected {session_id}")
 
             logger.debug("Starting SSE response task")
@@ -231,8 +238,8 @@ class SseServerTransport:
         logger.debug(f"Received JSON: {body}")
 
         try:
-            message = types.JSONRPCMessage.model_validate_json(body)
-            logger.debug(f"Validated client message: {message}")
+            messages = parse_messages(body)
+            logger.debug(f"Validated client messages: {messages}")
         except ValidationError as err:
             logger.exception("Failed to parse message")
             response = Response("Could not parse message", status_code=400)
@@ -240,10 +247,14 @@ class SseServerTransport:
             await writer.send(err)
             return
 
+        if is_batch(body) and (batches := self._batch_collectors.get(session_id)) is not None:
+            batches.register(messages)
+
         # Pass the ASGI scope for framework-agnostic access to request data
         metadata = ServerMessageMetadata(request_context=request)
-        session_message = SessionMessage(message, metadata=metadata)
-        logger.debug(f"Sending session message to writer: {session_message}")
         response = Response("Accepted", status_code=202)
         await response(scope, receive, send)
-        await writer.send(session_message)
+        for message in messages:
+            session_message = SessionMessage(message, metadata=metadata)
+            logger.debug(f"Sending session message to writer: {session_message}")
+            await writer.send(session_message)
@@ -18,35 +18,61 @@ Example usage:
 ```
 """
 
+import io
 import sys
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from io import TextIOWrapper
+from typing import Any
 
 import anyio
 import anyio.lowlevel
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
-import mcp.types as types
+from mcp.shared import tracing
+from mcp.shared.batch import BatchCollector, is_batch, parse_messages
+from mcp.shared.framing import READ_CHUNK_SIZE, LineSplitter, drain_ready, encode_messages
 from mcp.shared.message import SessionMessage
+from mcp.types import JSONRPCRequest
+
+
+async def _read_lines(stdin: anyio.AsyncFile[Any]) -> AsyncIterator[str | bytes]:
+    if isinstance(stdin.wrapped, io.TextIOBase):
+        async for line in stdin:
+            if line.strip():
+                yield line
+        return
+
+    splitter = LineSplitter()
+    while chunk := await stdin.read1(READ_CHUNK_SIZE):
+        for line in splitter.feed(chunk):
+            yield line
+    if (tail := splitter.flush()) is not None:
+        yield tail
 
 
 @asynccontextmanager
 async def stdio_server(
-    stdin: anyio.AsyncFile[str] | None = None,
-    stdout: anyio.AsyncFile[str] | None = None,
+    stdin: anyio.AsyncFile[str] | anyio.AsyncFile[bytes] | None = None,
+    stdout: anyio.AsyncFile[str] | anyio.AsyncFile[bytes] | None = None,
 ):
     """
     Server transport for stdio: this communicates with an MCP client by reading
     from the current process' stdin and writing to stdout.
+
+    By default the process' binary stdin/stdout buffers are used directly:
+    input is read in large chunks and split on newlines as bytes, and all
+    messages ready to be sent are written and flushed together. Text files
+    passed in explicitly are still supported. A line holding a JSON-RPC batch
+    is answered with a single line holding the array of its responses.
     """
     # Purposely not using context managers for these, as we don't want to close
-    # standard process handles. Encoding of stdin/stdout as text streams on
-    # python is platform-dependent (Windows is particularly problematic), so we
-    # re-wrap the underlying binary stream to ensure UTF-8.
+    # standard process handles. Messages are framed as UTF-8 bytes ourselves, so
+    # the platform-dependent text encoding of stdin/stdout never comes into play.
     if not stdin:
-        stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8"))
+        stdin = anyio.wrap_file(sys.stdin.buffer)
     if not stdout:
-        stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+        stdout = anyio.wrap_file(sys.stdout.buffer)
+    stdout_is_text = isinstance(stdout.wrapped, io.TextIOBase)
 
     read_stream: MemoryObjectReceiveStream[SessionMessage | Exception]
     read_stream_writer: MemoryObjectSendStream[SessionMessage | Exception]
@@ -56,19 +82,27 @@ async def stdio_server(
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batches = BatchCollector()
 
     async def stdin_reader():
         try:
             async with read_stream_writer:
-                async for line in stdin:
+                async for line in _read_lines(stdin):
                     try:
-                        message = types.JSONRPCMessage.model_validate_json(line)
+                        with tracing.span("transport.parse", transport="stdio", bytes=len(line)) as span:
+                            messages = parse_messages(line)
+                            if len(messages) > 1:
+                                span.set(batch_size=len(messages))
+                            elif isinstance(messages[0].root, JSONRPCRequest):
+                                span.set(request_id=messages[0].root.id)
                     except Exception as exc:
                         await read_stream_writer.send(exc)
                         continue
 
-                    session_message = SessionMessage(message)
-                    await read_stream_writer.send(session_message)
+                    if is_batch(line):
+                        batches.register(messages)
+                    for message in messages:
+                        await read_stream_writer.send(SessionMessage(message))
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
@@ -76,9 +110,14 @@ async def stdio_server(
         try:
             async with write_stream_reader:
                 async for session_message in write_stream_reader:
-                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await stdout.write(json + "\n")
-                    await stdout.flush()
+                    ready = batches.collect(drain_ready(write_stream_reader, session_message))
+                    if not ready:
+                        continue
+                    with tracing.span("transport.write", transport="stdio", messages=len(ready)) as span:
+                        data = encode_messages(ready)
+                        await stdout.write(data.decode() if stdout_is_text else data)
+                        await stdout.flush()
+                        span.set(bytes=len(data))
         except anyio.ClosedResourceError:
             await anyio.lowlevel.checkpoint()
 
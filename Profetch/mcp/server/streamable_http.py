@@ -28,6 +28,8 @@ from mcp.server.transport_security import (
     TransportSecurityMiddleware,
     TransportSecuritySettings,
 )
+from mcp.shared import tracing
+from mcp.shared.batch import BatchCollector, request_ids
 from mcp.shared.message import ServerMessageMetadata, SessionMessage
 from mcp.shared.version import SUPPORTED_PROTOCOL_VERSIONS
 from mcp.types import (
@@ -37,6 +39,7 @@ from mcp.types import (
     INVALID_REQUEST,
     PARSE_ERROR,
     ErrorData,
+    JSONRPCBatch,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCRequest,
@@ -74,7 +77,7 @@ class EventMessage:
     A JSONRPCMessage with an optional event ID for stream resumability.
     """
 
-    message: JSONRPCMessage
+    message: JSONRPCMessage | JSONRPCBatch
     event_id: str | None = None
 
 
@@ -211,7 +214,7 @@ class StreamableHTTPServerTransport:
 
     def _create_json_response(
         self,
-        response_message: JSONRPCMessage | None,
+        response_message: JSONRPCMessage | JSONRPCBatch | None,
         status_code: HTTPStatus = HTTPStatus.OK,
         headers: dict[str, str] | None = None,
     ) -> Response:
@@ -335,14 +338,22 @@ class StreamableHTTPServerTransport:
             body = await request.body()
 
             try:
-                raw_message = json.loads(body)
+                with tracing.span("transport.parse", transport="streamable_http", bytes=len(body)):
+                    raw_message = json.loads(body)
             except json.JSONDecodeError as e:
                 response = self._create_error_response(f"Parse error: {str(e)}", HTTPStatus.BAD_REQUEST, PARSE_ERROR)
                 await response(scope, receive, send)
                 return
 
+            if isinstance(raw_message, list):
+                await self._handle_batch_post_request(scope, request, receive, send, raw_message)
+                return
+
             try:
-                message = JSONRPCMessage.model_validate(raw_message)
+                with tracing.span("transport.validate", transport="streamable_http") as span:
+                    message = JSONRPCMessage.model_validate(raw_message)
+                    if isinstance(message.root, JSONRPCRequest):
+                        span.set(request_id=message.root.id)
             except ValidationError as e:
                 response = self._create_error_response(
                     f"Validation error: {str(e)}",
@@ -505,6 +516,147 @@ class StreamableHTTPServerTransport:
                 await writer.send(Exception(err))
             return
 
+    async def _handle_batch_post_request(
+        self,
+        scope: Scope,
+        request: Request,
+        receive: Receive,
+        send: Send,
+        raw_messages: list[object],
+    ) -> None:
+        """Handle a POST whose body is a JSON-RPC batch array.
+
+        Each message is handed to the session individually. A single request
+        stream is registered under the ID of every request in the batch, and
+        the POST is answered with one array of responses once all of them have
+        arrived: as the JSON body, or as the final SSE event after any
+        notifications related to the batched requests.
+        """
+        writer = self._read_stream_writer
+        assert writer is not None
+
+        try:
+            with tracing.span("transport.validate", transport="streamable_http", batch_size=len(raw_messages)):
+                messages = JSONRPCBatch.model_validate(raw_messages).root
+        except ValidationError as e:
+            response = self._create_error_response(
+                f"Validation error: {str(e)}",
+                HTTPStatus.BAD_REQUEST,
+                INVALID_PARAMS,
+            )
+            await response(scope, receive, send)
+            return
+
+        if any(isinstance(m.root, JSONRPCRequest) and m.root.method == "initialize" for m in messages):
+            response = self._create_error_response(
+                "Bad Request: initialize request cannot be part of a batch",
+                HTTPStatus.BAD_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+
+        if not await self._validate_request_headers(request, send):
+            return
+
+        metadata = ServerMessageMetadata(request_context=request)
+
+        async def send_messages() -> None:
+            for message in messages:
+                await writer.send(SessionMessage(message, metadata=metadata))
+
+        stream_ids = [str(request_id) for request_id in dict.fromkeys(request_ids(messages))]
+        if not stream_ids:
+            # Notifications and responses only: nothing to answer
+            response = self._create_json_response(None, HTTPStatus.ACCEPTED)
+            await response(scope, receive, send)
+            await send_messages()
+            return
+
+        batches = BatchCollector()
+        batches.register(messages)
+        request_stream = anyio.create_memory_object_stream[EventMessage](0)
+        for stream_id in stream_ids:
+            self._request_streams[stream_id] = request_stream
+        request_stream_reader = request_stream[1]
+
+        async def clean_up() -> None:
+            for stream_id in stream_ids:
+                await self._clean_up_memory_streams(stream_id)
+
+        if self.is_json_response_enabled:
+            try:
+                responses: list[JSONRPCMessage] = []
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(send_messages)
+                    async for event_message in request_stream_reader:
+                        if batch := batches.add_response(event_message.message):
+                            responses = batch
+                            break
+
+                if responses:
+                    response = self._create_json_response(JSONRPCBatch(responses))
+                else:
+                    logger.error("Batch request stream closed before all responses were received")
+                    response = self._create_error_response(
+                        "Error processing request: No response received",
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                    )
+                await response(scope, receive, send)
+            except Exception:
+                logger.exception("Error processing batch JSON response")
+                response = self._create_error_response(
+                    "Error processing request",
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    INTERNAL_ERROR,
+                )
+                await response(scope, receive, send)
+            finally:
+                await clean_up()
+            return
+
+        sse_stream_writer, sse_stream_reader = anyio.create_memory_object_stream[dict[str, str]](0)
+
+        async def sse_writer():
+            try:
+                async with sse_stream_writer, request_stream_reader:
+                    async for event_message in request_stream_reader:
+                        batch = batches.add_response(event_message.message)
+                        if batch is None:
+                            await sse_stream_writer.send(self._create_event_data(event_message))
+                        elif batch:
+                            # Responses are stored individually in the event store, so
+                            # the batch event carries the ID of the last one stored.
+                            await sse_stream_writer.send(
+                                self._create_event_data(EventMessage(JSONRPCBatch(batch), event_message.event_id))
+                            )
+                            break
+            except Exception:
+                logger.exception("Error in batch SSE writer")
+            finally:
+                logger.debug("Closing batch SSE writer")
+                await clean_up()
+
+        headers = {
+            "Cache-Control": "no-cache, no-transform",
+            "Connection": "keep-alive",
+            "Content-Type": CONTENT_TYPE_SSE,
+            **({MCP_SESSION_ID_HEADER: self.mcp_session_id} if self.mcp_session_id else {}),
+        }
+        response = EventSourceResponse(
+            content=sse_stream_reader,
+            data_sender_callable=sse_writer,
+            headers=headers,
+        )
+        try:
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(response, scope, receive, send)
+                await send_messages()
+        except Exception:
+            logger.exception("Batch SSE response error")
+            await sse_stream_writer.aclose()
+            await sse_stream_reader.aclose()
+            await clean_up()
+
     async def _handle_get_request(self, request: Request, send: Send) -> None:
         """
         Handle GET request to establish SSE.
@@ -878,6 +1030,11 @@ class StreamableHTTPServerTransport:
                                 for message. Still processing message as the client
                                 might reconnect and replay."""
                             )
+                except anyio.ClosedResourceError:
+                    if self._terminated:
+                        logger.debug("Write stream closed by session termination")
+                    else:
+                        logger.exception("Unexpected closure of write stream in message router")
                 except Exception:
                     logger.exception("Error in message router")
 
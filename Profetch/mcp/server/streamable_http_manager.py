@@ -5,7 +5,9 @@ from __future__ import annotations
 import contextlib
 import logging
 import threading
+from collections import OrderedDict
 from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from http import HTTPStatus
 from typing import Any
 from uuid import uuid4
@@ -14,7 +16,7 @@ import anyio
 from anyio.abc import TaskStatus
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import Receive, Scope, Send
+from starlette.types import Message, Receive, Scope, Send
 
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.streamable_http import (
@@ -27,6 +29,38 @@ from mcp.server.transport_security import TransportSecuritySettings
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SessionStats:
+    """Per-session request and traffic counters kept by the session manager.
+
+    Times are on the event loop clock (``anyio.current_time()``).
+    ``bytes_received`` and ``bytes_sent`` count HTTP request and response
+    body bytes exchanged with the session; they measure traffic, not the
+    memory the session holds. What a session holds is sampled by
+    ``StreamableHTTPSessionManager.stats()`` instead: its open request
+    streams and the messages queued on them. Event store bytes are not
+    attributed to sessions, because the store is shared by all sessions,
+    keys events by request stream and evicts them on its own caps; only
+    the store-wide total is reported.
+    """
+
+    created_at: float
+    last_active: float
+    requests: int = 0
+    in_flight: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+
+
+def _queued_messages(transport: StreamableHTTPServerTransport) -> int:
+    """Messages routed to the session's request streams but not yet written to a response."""
+    queued = 0
+    for send_stream, _ in transport._request_streams.values():  # type: ignore[reportPrivateUsage]
+        statistics = send_stream.statistics()
+        queued += statistics.current_buffer_used + statistics.tasks_waiting_send
+    return queued
+
+
 class StreamableHTTPSessionManager:
     """
     Manages StreamableHTTP sessions with optional resumability via event store.
@@ -52,6 +86,12 @@ class StreamableHTTPSessionManager:
         json_response: Whether to use JSON responses instead of SSE streams
         stateless: If True, creates a completely fresh transport for each request
                    with no session tracking or state persistence between requests.
+        session_idle_timeout: Seconds after which a session with no request in
+                   progress is closed and forgotten. None keeps sessions until
+                   the client deletes them.
+        max_sessions: Maximum number of live sessions. When reached, the least
+                   recently used idle session is closed to admit a new one; if
+                   every session is busy, the new one is refused with 503.
     """
 
     def __init__(
@@ -61,16 +101,31 @@ class StreamableHTTPSessionManager:
         json_response: bool = False,
         stateless: bool = False,
         security_settings: TransportSecuritySettings | None = None,
+        session_idle_timeout: float | None = None,
+        max_sessions: int | None = None,
     ):
+        if session_idle_timeout is not None and session_idle_timeout <= 0:
+            raise ValueError("session_idle_timeout must be positive")
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
         self.app = app
         self.event_store = event_store
         self.json_response = json_response
         self.stateless = stateless
         self.security_settings = security_settings
+        self.session_idle_timeout = session_idle_timeout
+        self.max_sessions = max_sessions
 
-        # Session tracking (only used if not stateless)
+        # Session tracking (only used if not stateless), least recently used first
         self._session_creation_lock = anyio.Lock()
-        self._server_instances: dict[str, StreamableHTTPServerTransport] = {}
+        self._server_instances: OrderedDict[str, StreamableHTTPServerTransport] = OrderedDict()
+        self._session_stats: dict[str, SessionStats] = {}
+
+        # Counters for sessions closed by the manager rather than the client
+        self.idle_sessions_reaped = 0
+        self.sessions_evicted = 0
+        self.sessions_rejected = 0
 
         # The task group will be set during lifespan
         self._task_group = None
@@ -108,6 +163,8 @@ class StreamableHTTPSessionManager:
         async with anyio.create_task_group() as tg:
             # Store the task group for later use
             self._task_group = tg
+            if self.session_idle_timeout is not None and not self.stateless:
+                tg.start_soon(self._reap_idle_sessions)
             logger.info("StreamableHTTP session manager started")
             try:
                 yield  # Let the application run
@@ -118,6 +175,40 @@ class StreamableHTTPSessionManager:
                 self._task_group = None
                 # Clear any remaining server instances
                 self._server_instances.clear()
+                self._session_stats.clear()
+
+    @property
+    def active_sessions(self) -> int:
+        """Number of live sessions."""
+        return len(self._server_instances)
+
+    @property
+    def reclaimed_sessions(self) -> int:
+        """Sessions closed by the manager, through idle reaping or eviction."""
+        return self.idle_sessions_reaped + self.sessions_evicted
+
+    def stats(self) -> dict[str, Any]:
+        """Gauges, counters and per-session request, traffic and queue figures for monitoring."""
+        return {
+            "active_sessions": self.active_sessions,
+            "reclaimed_sessions": self.reclaimed_sessions,
+            "idle_sessions_reaped": self.idle_sessions_reaped,
+            "sessions_evicted": self.sessions_evicted,
+            "sessions_rejected": self.sessions_rejected,
+            "bytes_received": sum(stats.bytes_received for stats in self._session_stats.values()),
+            "bytes_sent": sum(stats.bytes_sent for stats in self._session_stats.values()),
+            # Store-wide: the bundled stores expose ``nbytes``, other stores may not
+            "event_store_bytes": getattr(self.event_store, "nbytes", None),
+            "sessions": {
+                session_id: {
+                    **vars(stats),
+                    "open_streams": len(transport._request_streams),  # type: ignore[reportPrivateUsage]
+                    "queued_messages": _queued_messages(transport),
+                }
+                for session_id, transport in self._server_instances.items()
+                if (stats := self._session_stats.get(session_id)) is not None
+            },
+        }
 
     async def handle_request(
         self,
@@ -210,14 +301,24 @@ class StreamableHTTPSessionManager:
         # Existing session case
         if request_mcp_session_id is not None and request_mcp_session_id in self._server_instances:
             transport = self._server_instances[request_mcp_session_id]
+            self._server_instances.move_to_end(request_mcp_session_id)
             logger.debug("Session already exists, handling request directly")
-            await transport.handle_request(scope, receive, send)
+            await self._handle_session_request(request_mcp_session_id, transport, scope, receive, send)
             return
 
         if request_mcp_session_id is None:
             # New session case
             logger.debug("Creating new transport")
             async with self._session_creation_lock:
+                if not await self._make_room_for_session():
+                    self.sessions_rejected += 1
+                    response = Response(
+                        "Service Unavailable: Too many active sessions",
+                        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                    )
+                    await response(scope, receive, send)
+                    return
+
                 new_session_id = uuid4().hex
                 http_transport = StreamableHTTPServerTransport(
                     mcp_session_id=new_session_id,
@@ -228,6 +329,8 @@ class StreamableHTTPSessionManager:
 
                 assert http_transport.mcp_session_id is not None
                 self._server_instances[http_transport.mcp_session_id] = http_transport
+                now = anyio.current_time()
+                self._session_stats[new_session_id] = SessionStats(created_at=now, last_active=now)
                 logger.info(f"Created new transport with session ID: {new_session_id}")
 
                 # Define the server runner
@@ -248,18 +351,14 @@ class StreamableHTTPSessionManager:
                                 exc_info=True,
                             )
                         finally:
-                            # Only remove from instances if not terminated
-                            if (
-                                http_transport.mcp_session_id
-                                and http_transport.mcp_session_id in self._server_instances
-                                and not http_transport.is_terminated
-                            ):
-                                logger.info(
-                                    "Cleaning up crashed session "
-                                    f"{http_transport.mcp_session_id} from "
-                                    "active instances."
-                                )
-                                del self._server_instances[http_transport.mcp_session_id]
+                            # Forget the session once its server has stopped, whether it
+                            # crashed or the client terminated it with DELETE. Sessions
+                            # closed by the manager have already been removed.
+                            if self._server_instances.get(new_session_id) is http_transport:
+                                if not http_transport.is_terminated:
+                                    logger.info(f"Cleaning up crashed session {new_session_id} from active instances.")
+                                del self._server_instances[new_session_id]
+                                self._session_stats.pop(new_session_id, None)
 
                 # Assert task group is not None for type checking
                 assert self._task_group is not None
@@ -267,11 +366,85 @@ class StreamableHTTPSessionManager:
                 await self._task_group.start(run_server)
 
                 # Handle the HTTP request and return the response
-                await http_transport.handle_request(scope, receive, send)
+                await self._handle_session_request(new_session_id, http_transport, scope, receive, send)
         else:
-            # Invalid session ID
+            # Unknown, expired or terminated session: the client must re-initialize.
+            # The MCP spec (2025-03-26 and later) requires 404 here; this server
+            # answered 400 before, and clients that only re-initialize on 400
+            # need updating. The bundled streamable HTTP client handles 404.
             response = Response(
-                "Bad Request: No valid session ID provided",
-                status_code=HTTPStatus.BAD_REQUEST,
+                "Not Found: Invalid or expired session ID",
+                status_code=HTTPStatus.NOT_FOUND,
             )
             await response(scope, receive, send)
+
+    async def _handle_session_request(
+        self,
+        session_id: str,
+        transport: StreamableHTTPServerTransport,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """Handle a request for a session, keeping its request and byte counters up to date."""
+        stats = self._session_stats.get(session_id)
+        if stats is None:
+            await transport.handle_request(scope, receive, send)
+            return
+
+        async def counting_receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                stats.bytes_received += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            if message["type"] == "http.response.body":
+                stats.bytes_sent += len(message.get("body", b""))
+            await send(message)
+
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.last_active = anyio.current_time()
+        try:
+            await transport.handle_request(scope, counting_receive, counting_send)
+        finally:
+            stats.in_flight -= 1
+            stats.last_active = anyio.current_time()
+
+    async def _make_room_for_session(self) -> bool:
+        """Evict the least recently used idle session if at ``max_sessions``."""
+        if self.max_sessions is None or len(self._server_instances) < self.max_sessions:
+            return True
+        for session_id in self._server_instances:
+            stats = self._session_stats.get(session_id)
+            if stats is None or stats.in_flight == 0:
+                await self._close_session(session_id)
+                self.sessions_evicted += 1
+                logger.info(f"Evicted least recently used session {session_id}")
+                return True
+        return False
+
+    async def _close_session(self, session_id: str) -> None:
+        """Forget a session and terminate its transport, stopping its server task."""
+        transport = self._server_instances.pop(session_id, None)
+        self._session_stats.pop(session_id, None)
+        if transport is not None and not transport.is_terminated:
+            await transport._terminate_session()  # type: ignore[reportPrivateUsage]
+
+    async def _reap_idle_sessions(self) -> None:
+        """Periodically close sessions that have been idle past the timeout."""
+        assert self.session_idle_timeout is not None
+        interval = min(self.session_idle_timeout / 4, 60.0)
+        while True:
+            await anyio.sleep(interval)
+            deadline = anyio.current_time() - self.session_idle_timeout
+            idle = [
+                session_id
+                for session_id, stats in self._session_stats.items()
+                if stats.in_flight == 0 and stats.last_active < deadline
+            ]
+            for session_id in idle:
+                await self._close_session(session_id)
+                self.idle_sessions_reaped += 1
+                logger.info(f"Reaped idle session {session_id}")
@@ -7,7 +7,7 @@ from pydantic_core import ValidationError
 from starlette.types import Receive, Scope, Send
 from starlette.websockets import WebSocket
 
-import mcp.types as types
+from mcp.shared.batch import BatchCollector, is_batch, parse_messages
 from mcp.shared.message import SessionMessage
 
 logger = logging.getLogger(__name__)
@@ -31,28 +31,32 @@ async def websocket_server(scope: Scope, receive: Receive, send: Send):
 
     read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
     write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batches = BatchCollector()
 
     async def ws_reader():
         try:
             async with read_stream_writer:
                 async for msg in websocket.iter_text():
                     try:
-                        client_message = types.JSONRPCMessage.model_validate_json(msg)
+                        client_messages = parse_messages(msg)
                     except ValidationError as exc:
                         await read_stream_writer.send(exc)
                         continue
 
-                    session_message = SessionMessage(client_message)
-                    await read_stream_writer.send(session_message)
+                    if is_batch(msg):
+                        batches.register(client_messages)
+                    for client_message in client_messages:
+                        await read_stream_writer.send(SessionMessage(client_message))
         except anyio.ClosedResourceError:
             await websocket.close()
 
     async def ws_writer():
         try:
             async with write_stream_reader:
-                async for session_message in write_stream_reader:
-                    obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
-                    await websocket.send_text(obj)
+                async for outgoing in write_stream_reader:
+                    for session_message in batches.collect([outgoing]):
+                        obj = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                        await websocket.send_text(obj)
         except anyio.ClosedResourceError:
             await websocket.close()
 
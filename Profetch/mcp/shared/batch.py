@@ -0,0 +1,100 @@
+"""
+JSON-RPC 2.0 batch support shared by the transports.
+
+A batch arrives as a single JSON array. Server transports split it into
+individual messages for the session, which handles them exactly as if they
+had been sent one by one, and register the batch with a ``BatchCollector``.
+As the session writes responses, the collector holds back those belonging to
+a batch until every request in it has been answered, and then releases them
+together so the transport can send them as one array.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from mcp.shared.message import SessionMessage
+from mcp.types import (
+    JSONRPCBatch,
+    JSONRPCError,
+    JSONRPCMessage,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    RequestId,
+)
+
+
+def is_batch(raw: str | bytes) -> bool:
+    """Whether a raw JSON payload is an array rather than a single object."""
+    return raw.lstrip()[:1] in ("[", b"[")
+
+
+def parse_messages(raw: str | bytes) -> list[JSONRPCMessage]:
+    """Parse a raw JSON payload holding either one message or a batch of them."""
+    if is_batch(raw):
+        return JSONRPCBatch.model_validate_json(raw).root
+    return [JSONRPCMessage.model_validate_json(raw)]
+
+
+def request_ids(messages: Iterable[JSONRPCMessage]) -> list[RequestId]:
+    """IDs of the requests among ``messages``, i.e. those expecting a response."""
+    return [message.root.id for message in messages if isinstance(message.root, JSONRPCRequest)]
+
+
+@dataclass
+class _Batch:
+    order: list[RequestId]
+    responses: dict[RequestId, JSONRPCMessage] = field(default_factory=dict)
+
+
+class BatchCollector:
+    """Groups responses to batched requests so they can be sent as one array."""
+
+    def __init__(self) -> None:
+        self._batches: dict[RequestId, _Batch] = {}
+
+    def register(self, messages: Iterable[JSONRPCMessage]) -> None:
+        """Start collecting responses for the requests in a received batch.
+
+        Batches made up only of notifications and responses get no reply, so
+        nothing is registered for them.
+        """
+        ids = list(dict.fromkeys(request_ids(messages)))
+        if ids:
+            batch = _Batch(order=ids)
+            for request_id in ids:
+                self._batches[request_id] = batch
+
+    def add_response(self, message: JSONRPCMessage) -> list[JSONRPCMessage] | None:
+        """Offer an outgoing message to the collector.
+
+        Returns ``None`` if the message is not a response to a batched request
+        and should be sent as is, an empty list if it was held back while other
+        responses in its batch are outstanding, or every response of the batch,
+        in request order, once the batch is complete.
+        """
+        root = message.root
+        if not isinstance(root, JSONRPCResponse | JSONRPCError):
+            return None
+        batch = self._batches.pop(root.id, None)
+        if batch is None:
+            return None
+        batch.responses[root.id] = message
+        if len(batch.responses) < len(batch.order):
+            return []
+        return [batch.responses[request_id] for request_id in batch.order]
+
+    def collect(self, messages: Iterable[SessionMessage]) -> list[SessionMessage]:
+        """Filter outgoing messages through ``add_response``.
+
+        Messages unrelated to a batch pass through unchanged; each completed
+        batch is emitted as a single ``JSONRPCBatch`` message in its place.
+        """
+        ready: list[SessionMessage] = []
+        for session_message in messages:
+            if not isinstance(session_message.message, JSONRPCMessage):
+                ready.append(session_message)
+            elif (batch := self.add_response(session_message.message)) is None:
+                ready.append(session_message)
+            elif batch:
+                ready.append(SessionMessage(JSONRPCBatch(batch)))
+        return ready
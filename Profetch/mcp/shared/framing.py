@@ -0,0 +1,73 @@
+"""
+Newline-delimited JSON-RPC framing shared by the stdio transports.
+
+Reading works on raw bytes: large chunks are split on ``\\n`` without going
+through a text wrapper, and each line is handed to pydantic as bytes. Writing
+drains every message already waiting on the memory stream and emits them as a
+single buffer, so a burst of notifications costs one write and one flush
+instead of one per message.
+"""
+
+from collections.abc import Iterable
+from typing import TypeVar
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream
+
+from mcp.shared.message import SessionMessage
+
+T = TypeVar("T")
+
+READ_CHUNK_SIZE = 64 * 1024
+MAX_BATCH_MESSAGES = 256
+
+
+class LineSplitter:
+    """Incrementally splits a byte stream into newline-terminated lines."""
+
+    def __init__(self) -> None:
+        self._pending: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk and return the complete, non-blank lines it finished."""
+        if b"\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        if self._pending:
+            self._pending.append(chunk)
+            chunk = b"".join(self._pending)
+            self._pending = []
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if tail:
+            self._pending.append(tail)
+        return [line for line in lines if line.strip()]
+
+    def flush(self) -> bytes | None:
+        """Return any unterminated trailing data (e.g. at end of stream)."""
+        tail = b"".join(self._pending)
+        self._pending = []
+        return tail if tail.strip() else None
+
+
+def drain_ready(
+    stream: MemoryObjectReceiveStream[T],
+    first: T,
+    limit: int = MAX_BATCH_MESSAGES,
+) -> list[T]:
+    """Collect ``first`` plus every item that can be received without waiting."""
+    batch = [first]
+    while len(batch) < limit:
+        try:
+            batch.append(stream.receive_nowait())
+        except (anyio.WouldBlock, anyio.EndOfStream):
+            break
+    return batch
+
+
+def encode_messages(messages: Iterable[SessionMessage]) -> bytes:
+    """Serialize session messages as newline-delimited JSON in one buffer."""
+    return b"".join(
+        message.message.model_dump_json(by_alias=True, exclude_none=True).encode() + b"\n" for message in messages
+    )
@@ -11,6 +11,7 @@ import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
 import mcp.types as types
+from mcp.client.result_cache import ToolResultCache
 from mcp.client.session import (
     ClientSession,
     ElicitationFnT,
@@ -61,6 +62,9 @@ async def create_connected_server_and_client_session(
     client_info: types.Implementation | None = None,
     raise_exceptions: bool = False,
     elicitation_callback: ElicitationFnT | None = None,
+    validation_sample_rate: float = 1.0,
+    result_cache: ToolResultCache | None = None,
+    result_cache_namespace: str | None = None,
 ) -> AsyncGenerator[ClientSession, None]:
     """Creates a ClientSession that is connected to a running MCP server."""
     async with create_client_server_memory_streams() as (
@@ -92,6 +96,9 @@ async def create_connected_server_and_client_session(
                     message_handler=message_handler,
                     client_info=client_info,
                     elicitation_callback=elicitation_callback,
+                    validation_sample_rate=validation_sample_rate,
+                    result_cache=result_cache,
+                    result_cache_namespace=result_cache_namespace,
                 ) as client_session:
                     await client_session.initialize()
                     yield client_session
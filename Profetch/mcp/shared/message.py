@@ -8,7 +8,7 @@ to support transport-specific features like resumability.
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
-from mcp.types import JSONRPCMessage, RequestId
+from mcp.types import JSONRPCBatch, JSONRPCMessage, RequestId
 
 ResumptionToken = str
 
@@ -39,5 +39,5 @@ MessageMetadata = ClientMessageMetadata | ServerMessageMetadata | None
 class SessionMessage:
     """A message with specific metadata for transport-specific features."""
 
-    message: JSONRPCMessage
+    message: JSONRPCMessage | JSONRPCBatch
     metadata: MessageMetadata = None
@@ -1,16 +1,18 @@
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import AsyncExitStack
 from datetime import timedelta
+from functools import lru_cache
 from types import TracebackType
-from typing import Any, Generic, Protocol, TypeVar
+from typing import Any, Generic, Protocol, TypeVar, get_args
 
 import anyio
 import httpx
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
-from pydantic import BaseModel
+from pydantic import BaseModel, RootModel
 from typing_extensions import Self
 
+from mcp.shared import tracing
 from mcp.shared.exceptions import McpError
 from mcp.shared.message import MessageMetadata, ServerMessageMetadata, SessionMessage
 from mcp.types import (
@@ -21,6 +23,7 @@ from mcp.types import (
     ClientRequest,
     ClientResult,
     ErrorData,
+    JSONRPCBatch,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCNotification,
@@ -42,6 +45,35 @@ ReceiveNotificationT = TypeVar("ReceiveNotificationT", ClientNotification, Serve
 
 RequestId = str | int
 
+RootModelT = TypeVar("RootModelT", bound=RootModel[Any])
+
+
+@lru_cache(maxsize=None)
+def _members_by_method(root_type: type[RootModel[Any]]) -> dict[str, type[BaseModel]]:
+    """Map each method name of a request/notification union to its model."""
+    members: dict[str, type[BaseModel]] = {}
+    for member in get_args(root_type.model_fields["root"].annotation):
+        for method in get_args(member.model_fields["method"].annotation):
+            members[method] = member
+    return members
+
+
+def validate_incoming(root_type: type[RootModelT], message: JSONRPCRequest | JSONRPCNotification) -> RootModelT:
+    """Validate an already-parsed JSON-RPC request or notification as ``root_type``.
+
+    The union member is picked by ``method``, and validated straight from the
+    parsed message fields, instead of dumping the message back to a dict and
+    trying every union member in turn. Unknown methods fall back to validating
+    against the whole union so callers see the same ValidationError as before.
+    """
+    data = {k: v for k, v in message.__dict__.items() if v is not None}
+    if message.model_extra:
+        data.update(message.model_extra)
+    member = _members_by_method(root_type).get(message.method)
+    if member is None:
+        return root_type.model_validate(data)
+    return root_type.model_construct(member.model_validate(data))
+
 
 class ProgressFnT(Protocol):
     """Protocol for progress notification callbacks."""
@@ -49,6 +81,20 @@ class ProgressFnT(Protocol):
     async def __call__(self, progress: float, total: float | None, message: str | None) -> None: ...
 
 
+class PreparedResult:
+    """A result already dumped to JSON-compatible data.
+
+    Handlers that answer the same request over and over, such as list_tools,
+    can build one once and return it in place of a result model; it is sent
+    as is instead of being serialized again for every response.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: dict[str, Any]):
+        self.data = data
+
+
 class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
     """Handles responding to MCP requests and manages request lifecycle.
 
@@ -113,7 +159,7 @@ class RequestResponder(Generic[ReceiveRequestT, SendResultT]):
                 raise RuntimeError("No active cancel scope")
             self._cancel_scope.__exit__(exc_type, exc_val, exc_tb)
 
-    async def respond(self, response: SendResultT | ErrorData) -> None:
+    async def respond(self, response: SendResultT | PreparedResult | ErrorData) -> None:
         """Send a response for this request.
 
         Must be called within a context manager block.
@@ -260,13 +306,7 @@ class BaseSession(
 
             await self._write_stream.send(SessionMessage(message=JSONRPCMessage(jsonrpc_request), metadata=metadata))
 
-            # request read timeout takes precedence over session read timeout
-            timeout = None
-            if request_read_timeout_seconds is not None:
-                timeout = request_read_timeout_seconds.total_seconds()
-            elif self._session_read_timeout_seconds is not None:
-                timeout = self._session_read_timeout_seconds.total_seconds()
-
+            timeout = self._request_timeout(request_read_timeout_seconds)
             try:
                 with anyio.fail_after(timeout):
                     response_or_error = await response_stream_reader.receive()
@@ -293,6 +333,86 @@ class BaseSession(
             await response_stream.aclose()
             await response_stream_reader.aclose()
 
+    async def send_request_batch(
+        self,
+        requests: Sequence[SendRequestT],
+        result_type: type[ReceiveResultT],
+        request_read_timeout_seconds: timedelta | None = None,
+        metadata: MessageMetadata = None,
+    ) -> list[ReceiveResultT | ErrorData]:
+        """
+        Sends several requests as a single JSON-RPC batch and waits for all of
+        their responses. Results are returned in request order; a request that
+        failed yields its ErrorData in place of a result rather than raising.
+        The read timeout applies to the batch as a whole.
+        """
+        if not requests:
+            return []
+
+        request_ids: list[RequestId] = []
+        messages: list[JSONRPCMessage] = []
+        streams: list[MemoryObjectSendStream[JSONRPCResponse | JSONRPCError]] = []
+        readers: list[MemoryObjectReceiveStream[JSONRPCResponse | JSONRPCError]] = []
+        try:
+            for request in requests:
+                request_id = self._request_id
+                self._request_id = request_id + 1
+                response_stream, response_stream_reader = anyio.create_memory_object_stream[
+                    JSONRPCResponse | JSONRPCError
+                ](1)
+                self._response_streams[request_id] = response_stream
+                request_ids.append(request_id)
+                streams.append(response_stream)
+                readers.append(response_stream_reader)
+                messages.append(
+                    JSONRPCMessage(
+                        JSONRPCRequest(
+                            jsonrpc="2.0",
+                            id=request_id,
+                            **request.model_dump(by_alias=True, mode="json", exclude_none=True),
+                        )
+                    )
+                )
+
+            await self._write_stream.send(SessionMessage(message=JSONRPCBatch(messages), metadata=metadata))
+
+            timeout = self._request_timeout(request_read_timeout_seconds)
+            results: list[ReceiveResultT | ErrorData] = []
+            try:
+                with anyio.fail_after(timeout):
+                    for response_stream_reader in readers:
+                        response_or_error = await response_stream_reader.receive()
+                        if isinstance(response_or_error, JSONRPCError):
+                            results.append(response_or_error.error)
+                        else:
+                            results.append(result_type.model_validate(response_or_error.result))
+            except TimeoutError:
+                raise McpError(
+                    ErrorData(
+                        code=httpx.codes.REQUEST_TIMEOUT,
+                        message=(
+                            f"Timed out while waiting for responses to a batch of "
+                            f"{len(requests)} requests. Waited {timeout} seconds."
+                        ),
+                    )
+                )
+            return results
+
+        finally:
+            for request_id in request_ids:
+                self._response_streams.pop(request_id, None)
+            for response_stream, response_stream_reader in zip(streams, readers):
+                await response_stream.aclose()
+                await response_stream_reader.aclose()
+
+    def _request_timeout(self, request_read_timeout_seconds: timedelta | None) -> float | None:
+        # request read timeout takes precedence over session read timeout
+        if request_read_timeout_seconds is not None:
+            return request_read_timeout_seconds.total_seconds()
+        if self._session_read_timeout_seconds is not None:
+            return self._session_read_timeout_seconds.total_seconds()
+        return None
+
     async def send_notification(
         self,
         notification: SendNotificationT,
@@ -314,34 +434,48 @@ class BaseSession(
         )
         await self._write_stream.send(session_message)
 
-    async def _send_response(self, request_id: RequestId, response: SendResultT | ErrorData) -> None:
+    async def _send_response(
+        self, request_id: RequestId, response: SendResultT | PreparedResult | ErrorData
+    ) -> None:
         if isinstance(response, ErrorData):
             jsonrpc_error = JSONRPCError(jsonrpc="2.0", id=request_id, error=response)
             session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_error))
             await self._write_stream.send(session_message)
         else:
-            jsonrpc_response = JSONRPCResponse(
-                jsonrpc="2.0",
-                id=request_id,
-                result=response.model_dump(by_alias=True, mode="json", exclude_none=True),
-            )
+            if isinstance(response, PreparedResult):
+                result = response.data
+            else:
+                with tracing.span("session.serialize", request_id=request_id):
+                    result = response.model_dump(by_alias=True, mode="json", exclude_none=True)
+            jsonrpc_response = JSONRPCResponse(jsonrpc="2.0", id=request_id, result=result)
             session_message = SessionMessage(message=JSONRPCMessage(jsonrpc_response))
             await self._write_stream.send(session_message)
 
+    async def _read_messages(self) -> AsyncIterator[SessionMessage | Exception]:
+        async for message in self._read_stream:
+            # Wire transports split batches before they reach the session, but
+            # in-memory streams pass the client's batch through as is.
+            if isinstance(message, SessionMessage) and isinstance(message.message, JSONRPCBatch):
+                for item in message.message.root:
+                    yield SessionMessage(item, metadata=message.metadata)
+            else:
+                yield message
+
     async def _receive_loop(self) -> None:
         async with (
             self._read_stream,
             self._write_stream,
         ):
             try:
-                async for message in self._read_stream:
+                async for message in self._read_messages():
                     if isinstance(message, Exception):
                         await self._handle_incoming(message)
                     elif isinstance(message.message.root, JSONRPCRequest):
                         try:
-                            validated_request = self._receive_request_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
-                            )
+                            with tracing.span("session.validate", request_id=message.message.root.id):
+                                validated_request = validate_incoming(
+                                    self._receive_request_type, message.message.root
+                                )
                             responder = RequestResponder(
                                 request_id=message.message.root.id,
                                 request_meta=validated_request.root.params.meta
@@ -376,8 +510,8 @@ class BaseSession(
 
                     elif isinstance(message.message.root, JSONRPCNotification):
                         try:
-                            notification = self._receive_notification_type.model_validate(
-                                message.message.root.model_dump(by_alias=True, mode="json", exclude_none=True)
+                            notification = validate_incoming(
+                                self._receive_notification_type, message.message.root
                             )
                             # Handle cancellation notifications
                             if isinstance(notification.root, CancelledNotification):
@@ -0,0 +1,197 @@
+"""
+Lightweight tracing spans for request handling.
+
+Spans time the stages a request goes through (transport parsing, session
+validation, the handler, argument validation, the tool itself, result
+conversion and serialization) and are linked by JSON-RPC request ID. They
+are written to a local file, either as JSON lines or in the Chrome trace
+event format, which chrome://tracing and https://ui.perfetto.dev open.
+
+Tracing is off by default, and span() then returns a shared no-op span, so
+instrumented code pays for little more than a function call. Enable it with
+configure(), or through FastMCP's trace_file setting (FASTMCP_TRACE_FILE).
+
+Example:
+    tracing.configure("/tmp/trace.json")  # .json: Chrome trace; otherwise JSON lines
+
+    with tracing.span("bridge.fetch", gene=symbol) as span:
+        ...
+        span.set(status=response.status_code)
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Literal
+
+TraceFormat = Literal["jsonl", "chrome"]
+
+# The JSON-RPC ID of the request being handled, set by the lowlevel server
+request_id: ContextVar[str | int | None] = ContextVar("mcp_trace_request_id", default=None)
+
+
+class Span:
+    """A timed stage, recorded when its with block exits."""
+
+    __slots__ = ("name", "attrs", "_tracer", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, attrs: dict[str, Any]):
+        self.name = name
+        self.attrs = attrs
+        self._tracer = tracer
+        self._start = 0
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes, e.g. a request_id only known once the message is parsed."""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> Span:
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: Any) -> None:
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self._tracer.record(self.name, self._start, time.perf_counter_ns(), self.attrs)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Buffers finished spans and appends them to a file.
+
+    Spans are recorded from the event loop and from executor threads alike;
+    recording only appends to a buffer, which a writer thread writes out
+    every flush_interval seconds, so the event loop never waits on the
+    file. Each batch is one append, so pre-forked workers can share the file.
+    """
+
+    def __init__(self, path: str, format: TraceFormat | None = None, flush_interval: float = 1.0):
+        self.path = path
+        self.format: TraceFormat = format or ("chrome" if path.endswith(".json") else "jsonl")
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        # Held while a batch is taken and written, so batches reach the file in order
+        self._write_lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+        # perf_counter gives precise durations; this offset places them on the wall clock
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+        self._fd: int | None = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if self.format == "chrome" and os.fstat(self._fd).st_size == 0:
+            # The trace event format allows the array to be left unterminated
+            os.write(self._fd, b"[\n")
+        self._closing = threading.Event()
+        self._start_writer()
+
+    def _start_writer(self) -> None:
+        self._writer = threading.Thread(target=self._write_periodically, name="mcp-trace-writer", daemon=True)
+        self._writer.start()
+
+    def _write_periodically(self) -> None:
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def record(self, name: str, start_ns: int, end_ns: int, attrs: dict[str, Any]) -> None:
+        if "request_id" not in attrs:
+            rid = request_id.get()
+            if rid is not None:
+                attrs["request_id"] = rid
+        event = {
+            "name": name,
+            "ts": (start_ns + self._epoch_offset_ns) // 1000,
+            "dur": (end_ns - start_ns) // 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": attrs,
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def flush(self) -> None:
+        """Write the buffered spans now, on the calling thread."""
+        with self._write_lock:
+            self._write_locked()
+
+    def close(self) -> None:
+        self._closing.set()
+        if self._writer.is_alive() and self._writer is not threading.current_thread():
+            self._writer.join()
+        with self._write_lock:
+            self._write_locked()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _write_locked(self) -> None:
+        with self._lock:
+            events, self._events = self._events, []
+        if not events or self._fd is None:
+            return
+        if self.format == "chrome":
+            lines = "".join(json.dumps({**event, "ph": "X"}, default=str) + ",\n" for event in events)
+        else:
+            lines = "".join(json.dumps(event, default=str) + "\n" for event in events)
+        os.write(self._fd, lines.encode())
+
+
+_tracer: Tracer | None = None
+
+
+def configure(path: str | None, format: TraceFormat | None = None) -> Tracer | None:
+    """Start writing spans to ``path``, replacing any earlier tracer; None turns tracing off."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    _tracer = Tracer(path, format) if path else None
+    return _tracer
+
+
+def enabled() -> bool:
+    return _tracer is not None
+
+
+def span(name: str, **attrs: Any) -> Span | _NoopSpan:
+    """A span named ``name``, or a shared no-op span while tracing is off."""
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return Span(tracer, name, attrs)
+
+
+def flush() -> None:
+    if _tracer is not None:
+        _tracer.flush()
+
+
+def _after_fork_in_child() -> None:
+    # Spans buffered by the parent are the parent's to write, and its writer
+    # thread does not exist in the child
+    if _tracer is not None:
+        _tracer._lock = threading.Lock()  # type: ignore[reportPrivateUsage]
+        _tracer._write_lock = threading.Lock()  # type: ignore[reportPrivateUsage]
+        _tracer._events = []  # type: ignore[reportPrivateUsage]
+        _tracer._start_writer()  # type: ignore[reportPrivateUsage]
+
+
+atexit.register(flush)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -148,6 +148,7 @@ class JSONRPCResponse(BaseModel):
 
 # SDK error codes
 CONNECTION_CLOSED = -32000
+SERVER_BUSY = -32003  # concurrency limit reached; retry later
 # REQUEST_TIMEOUT = -32001  # the typescript sdk uses this
 
 # Standard JSON-RPC error codes
@@ -192,6 +193,10 @@ class JSONRPCMessage(RootModel[JSONRPCRequest | JSONRPCNotification | JSONRPCRes
     pass
 
 
+class JSONRPCBatch(RootModel[Annotated[list[JSONRPCMessage], Field(min_length=1)]]):
+    """A JSON-RPC 2.0 batch: a non-empty array of messages sent as one unit."""
+
+
 class EmptyResult(Result):
     """A response that indicates success but carries no data."""
 
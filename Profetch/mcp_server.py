@@ -4,32 +4,137 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "mcp_lib"))
 
 # === Now import MCP classes ===
-from mcp.server.fastmcp import FastMCP
-from bridge import Bridge
-import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-bridge = Bridge()
-mcp = FastMCP("UniPROscope MCP")
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+from mcp.server.fastmcp import Context, FastMCP
+from bridge import Bridge, Config
+from metrics import instrument_tool, register_server_metrics, registry
+
+# On shutdown, calls in flight get this many seconds to finish before they are cancelled
+DRAIN_GRACE = float(os.environ.get("PROFETCH_DRAIN_GRACE", "30"))
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[Bridge]:
+    """One Bridge per process, shared by every session and closed on shutdown."""
+    # A shared entry cache lets every HTTP worker reuse entries fetched by the others
+    bridge = Bridge(Config(
+        cache_path=os.environ.get("PROFETCH_CACHE_PATH"),
+        export_dir=os.environ.get("PROFETCH_EXPORT_DIR", Config.export_dir),
+    ))
+    await bridge.start()
+    try:
+        yield bridge
+    finally:
+        await bridge.aclose(DRAIN_GRACE)
+
+mcp = FastMCP("UniPROscope MCP", lifespan=lifespan)
+register_server_metrics(mcp)
+
+def get_bridge(ctx: Context) -> Bridge:
+    return ctx.request_context.lifespan_context
+
+# Tools still running after this many seconds are cancelled along with their
+# UniProt requests. Exports are left unbounded: a large query can take minutes.
+TOOL_TIMEOUT = float(os.environ.get("PROFETCH_TOOL_TIMEOUT", "120"))
 
 # === Define MCP tools ===
 
-@mcp.tool()
-async def get_gene_info(gene_symbol: str) -> dict:
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def get_gene_info(ctx: Context, gene_symbol: str) -> dict:
     """Fetch detailed UniProt information for a human gene symbol."""
-    return await bridge.get_gene_info(gene_symbol)
+    return await get_bridge(ctx).get_gene_info(gene_symbol)
 
-@mcp.tool()
-async def get_protein_expression(gene_symbol: str) -> str:
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def get_protein_expression(ctx: Context, gene_symbol: str) -> str:
     """Get a summary of the protein's function and expression for a given gene symbol."""
-    return await bridge.get_protein_expression(gene_symbol)
+    return await get_bridge(ctx).get_protein_expression(gene_symbol)
 
-@mcp.tool()
-async def get_subcellular_location(gene_symbol: str) -> list:
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def get_subcellular_location(ctx: Context, gene_symbol: str) -> list:
     """Get all known subcellular locations for a gene product."""
-    return await bridge.get_subcellular_location(gene_symbol)
+    return await get_bridge(ctx).get_subcellular_location(gene_symbol)
+
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def scan_motifs(ctx: Context, pattern: str, accessions: list[str] | str = "all_cached") -> dict:
+    """Scan protein sequences for a PROSITE pattern (e.g. N-{P}-[ST]-{P}) or regex.
+
+    Pass UniProt accessions to scan specific proteins, or "all_cached" to scan every
+    sequence this server process has fetched so far. The cache is shared by all
+    sessions, so results include proteins fetched by other clients.
+    """
+    return await get_bridge(ctx).scan_motifs(pattern, accessions)
+
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def compute_protein_properties(ctx: Context, accessions: list[str] | str = "all_cached") -> dict:
+    """Compute pI, GRAVY, aromaticity, extinction coefficients and amino-acid composition.
+
+    Takes UniProt accessions or "all_cached". Results are column-oriented: each property
+    is a list aligned with the "accession" list.
+    """
+    return await get_bridge(ctx).compute_protein_properties(accessions)
+
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def find_similar_proteins(ctx: Context, query: str, top_k: int = 10) -> dict:
+    """Find proteins similar to a UniProt accession or an amino-acid sequence.
+
+    Searches a k-mer MinHash index over every sequence this server process has fetched
+    so far and re-ranks the top hits by banded alignment score. The index is shared by
+    all sessions, so hits include proteins fetched by other clients.
+    """
+    return await get_bridge(ctx).find_similar_proteins(query, top_k)
+
+@mcp.tool(timeout=TOOL_TIMEOUT)
+@instrument_tool
+async def compare_genes(ctx: Context, gene_symbols: list[str]) -> dict:
+    """Compare 2-20 human genes side by side in one table.
+
+    Returns one row per gene with annotation counts and the GO terms, subcellular
+    locations and interactors unique to that gene, plus the annotations all genes share.
+    """
+    return await get_bridge(ctx).compare_genes(gene_symbols)
+
+@mcp.tool()
+@instrument_tool
+async def export_genes(ctx: Context, targets: list[str] | str, path: str, format: str = "parquet") -> dict:
+    """Export UniProt annotations to column-oriented files instead of returning them.
+
+    `targets` is a list of gene symbols or a UniProt query string (e.g.
+    "organism_id:9606 AND reviewed:true"). Writes long-format scalars, GO, locations and
+    interactions tables as parquet, arrow or tsv under the `path` directory, which is
+    relative to the server's export directory, and returns only the file locations and
+    row counts.
+    """
+    return await get_bridge(ctx).export(targets, path, format)
+
+# === Metrics ===
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> Response:
+    """Metrics of this worker process in the Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+@mcp.resource("profetch://metrics", mime_type="application/json")
+def metrics_snapshot() -> dict:
+    """Tool and UniProt latencies, cache, queue and session counters of this server process."""
+    return registry.snapshot()
 
 # === Entry point ===
 
 if __name__ == "__main__":
     if "--serve" in sys.argv:
         mcp.run()
+    elif "--http" in sys.argv:
+        # Stateless, so any worker can answer any request. FASTMCP_HOST, FASTMCP_PORT
+        # and FASTMCP_WORKERS configure the listener.
+        mcp.settings.stateless_http = True
+        mcp.run("streamable-http")
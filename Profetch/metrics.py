@@ -0,0 +1,446 @@
+"""
+In-process metrics for uniPROscope MCP Client.
+
+Counters, gauges and latency histograms are recorded from the event loop and
+from executor threads alike. Each thread records into its own shard, so the
+hot path takes no lock and allocates next to nothing; shards are summed only
+when the metrics are read. Histograms use HDR-style log-linear buckets, 16
+per power of two of microseconds, so any quantile is known to within about
+6% from a few hundred integers, whatever the range of latencies.
+
+``registry.render()`` gives the Prometheus text format, ``registry.snapshot()``
+a JSON-friendly summary with quantiles. Each worker process keeps its own
+metrics.
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Generic, Iterable, List, Sequence, Tuple, TypeVar, Union
+
+M = TypeVar("M", "Counter", "Histogram")
+
+_SUB_BUCKET_BITS = 4
+_MAX_MICROS = 1 << 36  # about 19 hours; slower observations land in the top bucket
+
+DEFAULT_BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _bucket_index(micros: int) -> int:
+    # Values below 2**(bits + 1) get a bucket each; above that, each power of
+    # two is split into 2**bits buckets by the bits after the leading one.
+    shift = max(micros.bit_length() - _SUB_BUCKET_BITS - 1, 0)
+    return (shift << _SUB_BUCKET_BITS) + (micros >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """The range [lower, upper) of microseconds counted in bucket ``index``."""
+    shift = max((index >> _SUB_BUCKET_BITS) - 1, 0)
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+_N_BUCKETS = _bucket_index(_MAX_MICROS - 1) + 1
+
+
+class _Sharded:
+    """Per-thread lists of numbers, created on a thread's first record."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: List[List[Any]] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> List[Any]:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0] * self._size
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _merged(self) -> List[Any]:
+        with self._lock:
+            shards = list(self._shards)
+        return [sum(column) for column in zip(*shards)] if shards else [0] * self._size
+
+
+class Counter(_Sharded):
+    """A count that only goes up, such as requests served or bytes received."""
+
+    def __init__(self) -> None:
+        super().__init__(1)
+
+    def inc(self, amount: Union[int, float] = 1) -> None:
+        try:
+            self._local.shard[0] += amount
+        except AttributeError:
+            self._shard()[0] += amount
+
+    @property
+    def value(self) -> Union[int, float]:
+        return self._merged()[0]
+
+
+class Gauge(Counter):
+    """A count that goes up and down, such as calls in flight."""
+
+    def dec(self, amount: Union[int, float] = 1) -> None:
+        self.inc(-amount)
+
+
+class Histogram(_Sharded):
+    """A distribution of durations in seconds, kept to microsecond resolution."""
+
+    def __init__(self) -> None:
+        # One slot per bucket, then the sum of the observations in seconds
+        super().__init__(_N_BUCKETS + 1)
+
+    def observe(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        if micros < 0:
+            micros = 0
+        elif micros >= _MAX_MICROS:
+            micros = _MAX_MICROS - 1
+        # _bucket_index, inlined
+        shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+        if shift < 0:
+            shift = 0
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+        shard[(shift << _SUB_BUCKET_BITS) + (micros >> shift)] += 1
+        shard[-1] += seconds
+
+    def time(self) -> "_Timer":
+        """Context manager observing the time spent in its block."""
+        return _Timer(self)
+
+    def summary(self) -> Dict[str, float]:
+        """Count, sum, selected quantiles and maximum, in seconds."""
+        merged = self._merged()
+        counts, total = merged[:-1], merged[-1]
+        count = sum(counts)
+        result = {"count": count, "sum": total}
+        targets = [(f"p{int(q * 100)}", q * count) for q in QUANTILES]
+        seen = 0
+        for index, n in enumerate(counts):
+            if not n:
+                continue
+            seen += n
+            while targets and seen >= targets[0][1]:
+                result[targets.pop(0)[0]] = _midpoint(index)
+            result["max"] = _bucket_bounds(index)[1] / 1_000_000
+        return result
+
+    def cumulative(self, bounds: Sequence[float]) -> Tuple[List[int], int, float]:
+        """Counts at or below each bound, the total count and the sum.
+
+        A bucket straddling a bound is counted below it, so counts are exact
+        to within the bucket width of about 6%.
+        """
+        merged = self._merged()
+        counts = merged[:-1]
+        cumulative, seen, start = [], 0, 0
+        for bound in bounds:
+            end = min(_bucket_index(int(bound * 1_000_000)) + 1, _N_BUCKETS)
+            seen += sum(counts[start:end])
+            start = max(start, end)
+            cumulative.append(seen)
+        return cumulative, seen + sum(counts[start:]), merged[-1]
+
+
+def _midpoint(index: int) -> float:
+    lower, upper = _bucket_bounds(index)
+    return (lower + upper) / 2 / 1_000_000
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: Histogram) -> None:
+        self._histogram = histogram
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class Family(Generic[M]):
+    """A metric with labels: one child metric per combination of label values."""
+
+    def __init__(self, kind: str, name: str, help: str, labelnames: Sequence[str], factory: Callable[[], M]):
+        self.kind = kind
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], M] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> M:
+        """The child for these label values. Hold on to it on hot paths."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._factory())
+        return child
+
+    def children(self) -> List[Tuple[Dict[str, str], M]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, values)), child) for values, child in items]
+
+
+Sampler = Callable[[], Union[float, Dict[Tuple[str, ...], float]]]
+
+
+class _Sampled:
+    """A metric read from elsewhere, such as a stats object, when collected."""
+
+    def __init__(self, kind: str, name: str, help: str, labelnames: Sequence[str], fn: Sampler):
+        self.kind = kind
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.fn = fn
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        value = self.fn()
+        if isinstance(value, dict):
+            return [(dict(zip(self.labelnames, key)), v) for key, v in value.items()]
+        return [({}, value)]
+
+
+class Registry:
+    """The set of metrics a process exposes."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Union[Family[Any], _Sampled]] = {}
+        self._bounds: Dict[str, Sequence[float]] = {}
+
+    def _add(self, metric: Union[Family[Any], _Sampled]) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Counter]:
+        return self._add(Family("counter", name, help, labelnames, Counter))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Family[Counter]:
+        return self._add(Family("gauge", name, help, labelnames, Gauge))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), bounds: Sequence[float] = DEFAULT_BOUNDS
+    ) -> Family[Histogram]:
+        family = self._add(Family("histogram", name, help, labelnames, Histogram))
+        self._bounds[name] = sorted(bounds)
+        return family
+
+    def sampled(
+        self, kind: str, name: str, help: str, fn: Sampler, labelnames: Sequence[str] = ()
+    ) -> None:
+        """Register a counter or gauge whose value ``fn`` returns when collected.
+
+        ``fn`` returns a number, or a dict from label value tuples to numbers.
+        """
+        self._add(_Sampled(kind, name, help, labelnames, fn))
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, metric in list(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            if isinstance(metric, _Sampled):
+                for labels, value in metric.samples():
+                    lines.append(f"{name}{_labels(labels)} {_number(value)}")
+            elif metric.kind == "histogram":
+                bounds = self._bounds[name]
+                for labels, child in metric.children():
+                    cumulative, count, total = child.cumulative(bounds)
+                    for bound, n in zip(bounds, cumulative):
+                        lines.append(f"{name}_bucket{_labels(labels, le=_number(bound))} {n}")
+                    lines.append(f"{name}_bucket{_labels(labels, le='+Inf')} {count}")
+                    lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+                    lines.append(f"{name}_count{_labels(labels)} {count}")
+            else:
+                for labels, child in metric.children():
+                    lines.append(f"{name}{_labels(labels)} {_number(child.value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Every metric's current values, with histogram quantiles, as plain data."""
+        result: Dict[str, Any] = {}
+        for name, metric in list(self._metrics.items()):
+            if isinstance(metric, _Sampled):
+                values: Iterable[Dict[str, Any]] = (
+                    {"labels": labels, "value": value} for labels, value in metric.samples()
+                )
+            elif metric.kind == "histogram":
+                values = ({"labels": labels, **child.summary()} for labels, child in metric.children())
+            else:
+                values = ({"labels": labels, "value": child.value} for labels, child in metric.children())
+            result[name] = {"type": metric.kind, "help": metric.help, "values": list(values)}
+        return result
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str], **extra: str) -> str:
+    labels = {**labels, **extra}
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+registry = Registry()
+
+TOOL_CALLS = registry.counter("profetch_tool_calls_total", "Tool calls by outcome.", ("tool", "outcome"))
+TOOL_SECONDS = registry.histogram("profetch_tool_duration_seconds", "Tool call latency.", ("tool",))
+TOOLS_IN_FLIGHT = registry.gauge("profetch_tool_calls_in_flight", "Tool calls running now.").labels()
+UPSTREAM_REQUESTS = registry.counter(
+    "profetch_upstream_requests_total", "UniProt requests by status code, or error.", ("status",)
+)
+UPSTREAM_SECONDS = registry.histogram(
+    "profetch_upstream_duration_seconds", "UniProt request latency, including reading the body."
+).labels()
+UPSTREAM_BYTES = registry.counter("profetch_upstream_response_bytes_total", "UniProt response body bytes.").labels()
+ENTRY_CACHE = registry.counter(
+    "profetch_entry_cache_lookups_total", "UniProt entry lookups by where they were answered.", ("result",)
+)
+EXECUTOR_QUEUE_SECONDS = registry.histogram(
+    "profetch_executor_queue_seconds", "Time blocking calls wait for an executor thread."
+).labels()
+
+
+def register_server_metrics(server: Any, registry: Registry = registry) -> None:
+    """Sample the session, concurrency-limit, token-cache and entry-cache counters of a FastMCP server."""
+
+    def session_stats() -> Dict[str, Any]:
+        try:
+            return server.session_manager.stats()
+        except RuntimeError:  # not serving streamable HTTP, so no sessions are tracked
+            return {}
+
+    def sessions_closed() -> Dict[Tuple[str, ...], float]:
+        stats = session_stats()
+        return {
+            ("idle",): stats.get("idle_sessions_reaped", 0),
+            ("evicted",): stats.get("sessions_evicted", 0),
+            ("rejected",): stats.get("sessions_rejected", 0),
+        }
+
+    def per_limit(field: str) -> Sampler:
+        def sample() -> Dict[Tuple[str, ...], float]:
+            stats = server._mcp_server.concurrency_stats()
+            return {(limit,): counters[field] for limit, counters in stats.items()}
+
+        return sample
+
+    registry.sampled(
+        "gauge",
+        "profetch_sessions_active",
+        "Live MCP sessions.",
+        lambda: session_stats().get("active_sessions", 0),
+    )
+    registry.sampled(
+        "counter",
+        "profetch_sessions_closed_total",
+        "Sessions closed or refused by the server, by reason.",
+        sessions_closed,
+        ("reason",),
+    )
+    for kind, name, help, field in (
+        ("gauge", "profetch_requests_in_flight", "Requests running, by concurrency limit.", "in_flight"),
+        ("gauge", "profetch_requests_queued", "Requests waiting, by concurrency limit.", "queued"),
+        (
+            "counter",
+            "profetch_request_queue_wait_seconds_total",
+            "Time requests spent queued, by concurrency limit.",
+            "wait_seconds",
+        ),
+        ("counter", "profetch_requests_rejected_total", "Requests refused as busy, by concurrency limit.", "rejected"),
+    ):
+        registry.sampled(kind, name, help, per_limit(field), ("limit",))
+
+    def entry_cache_evictions() -> float:
+        # The Bridge yielded by the server's lifespan, while the lifespan is entered
+        bridge = getattr(server._mcp_server.lifespan, "context", None)
+        entries = getattr(bridge, "_entries", None)
+        return entries.evictions if entries is not None else 0
+
+    registry.sampled(
+        "counter",
+        "profetch_entry_cache_evictions_total",
+        "UniProt entries evicted from the in-process cache to stay within its size.",
+        entry_cache_evictions,
+    )
+
+    token_cache = server.token_cache
+    if token_cache is not None:
+        stats = token_cache.stats
+        registry.sampled(
+            "counter",
+            "profetch_token_cache_total",
+            "Bearer-token cache lookups and removals, by result.",
+            lambda: {
+                ("hit",): stats.hits + stats.negative_hits,
+                ("miss",): stats.misses,
+                ("expired",): stats.expirations,
+                ("evicted",): stats.evictions,
+            },
+            ("result",),
+        )
+
+
+def instrument_tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Record calls, latency and concurrency of an async tool function.
+
+    A call is an error if it raises, or if it returns a dict with an "error"
+    key, which is how Bridge methods report failures.
+    """
+    name = fn.__name__
+    seconds = TOOL_SECONDS.labels(name)
+    outcomes = {outcome: TOOL_CALLS.labels(name, outcome) for outcome in ("ok", "error", "cancelled")}
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        TOOLS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            result = await fn(*args, **kwargs)
+            if isinstance(result, dict) and "error" in result:
+                outcome = "error"
+            return result
+        except Exception:
+            outcome = "error"
+            raise
+        except BaseException:
+            outcome = "cancelled"
+            raise
+        finally:
+            seconds.observe(time.perf_counter() - start)
+            outcomes[outcome].inc()
+            TOOLS_IN_FLIGHT.dec()
+
+    return wrapper
@@ -0,0 +1,203 @@
+"""
+Sequence cache and motif scanning for uniPROscope MCP Client.
+"""
+
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+_PROSITE_ELEMENT = r"(?:[A-Zx]|\[[A-Z<>]+\]|\{[A-Z]+\})(?:\(\d+(?:,\d+)?\))?"
+_PROSITE_RE = re.compile(
+    rf"<?{_PROSITE_ELEMENT}(?:-{_PROSITE_ELEMENT})*>?\.?"
+)
+_PROSITE_TOKEN_RE = re.compile(r"([A-Zx]|\[[A-Z<>]+\]|\{[A-Z]+\})(?:\((\d+(?:,\d+)?)\))?")
+
+
+class SequenceCache:
+    """
+    Append-only store of protein sequences kept in one contiguous byte buffer.
+
+    Sequences are separated by a newline so a single regex pass over the
+    buffer (with ``re.MULTILINE``) sees every sequence as its own line.
+    ``_offsets[i]`` is the start of sequence ``i``; ``_offsets[i + 1] - 1``
+    is its end.
+    """
+
+    SEPARATOR = b"\n"
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._offsets = array("q", [0])
+        self._index: Dict[str, int] = {}
+        self._accessions: List[str] = []
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._accessions)
+
+    def __contains__(self, accession: object) -> bool:
+        return accession in self._index
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+    def add(self, accession: str, sequence: str) -> bool:
+        """Store a sequence; returns False if the accession is already cached."""
+        if accession in self._index:
+            return False
+        data = "".join(sequence.split()).upper().encode("ascii")
+        with self._lock:
+            if accession in self._index:
+                return False
+            self._buffer += data + self.SEPARATOR
+            self._offsets.append(len(self._buffer))
+            self._index[accession] = len(self._accessions)
+            self._accessions.append(accession)
+        return True
+
+    def get(self, accession: str) -> Optional[str]:
+        i = self._index.get(accession)
+        if i is None:
+            return None
+        start, end = self.span(i)
+        return self._buffer[start:end].decode("ascii")
+
+    def span(self, i: int) -> Tuple[int, int]:
+        """Byte range ``[start, end)`` of sequence ``i`` in the buffer."""
+        return self._offsets[i], self._offsets[i + 1] - 1
+
+    def accessions(self) -> List[str]:
+        return list(self._accessions)
+
+    def items(self, start: int = 0) -> Iterator[Tuple[str, bytes]]:
+        """Yield ``(accession, sequence bytes)`` pairs from index ``start`` on."""
+        for i in range(start, len(self._accessions)):
+            begin, end = self.span(i)
+            yield self._accessions[i], bytes(self._buffer[begin:end])
+
+    def select(self, accessions: Iterable[str]) -> List[Tuple[str, bytes]]:
+        """``(accession, sequence bytes)`` pairs for the cached subset of ``accessions``."""
+        selected = []
+        for accession in dict.fromkeys(accessions):
+            i = self._index.get(accession)
+            if i is not None:
+                begin, end = self.span(i)
+                selected.append((accession, bytes(self._buffer[begin:end])))
+        return selected
+
+    def scan(
+        self,
+        regex: Pattern[bytes],
+        accessions: Optional[Iterable[str]] = None,
+        max_matches: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Run a compiled overlapping-match regex (see ``compile_motif``) over the
+        cache. Returns ``(matches, total_matches, sequences_scanned)``; only the
+        first ``max_matches`` hits are materialised.
+        """
+        matches: List[Dict[str, Any]] = []
+        total = 0
+
+        def record(i: int, start: int, end: int, seq_start: int) -> None:
+            nonlocal total
+            total += 1
+            if max_matches is None or len(matches) < max_matches:
+                matches.append({
+                    "accession": self._accessions[i],
+                    "start": start - seq_start + 1,
+                    "end": end - seq_start,
+                    "match": self._buffer[start:end].decode("ascii"),
+                })
+
+        with self._lock:
+            if accessions is None:
+                # Single pass over the whole buffer; hits arrive in order so
+                # the owning sequence only ever moves forward.
+                i = 0
+                for m in regex.finditer(self._buffer):
+                    start, end = m.span(1)
+                    if start == end:
+                        continue
+                    if start >= self._offsets[i + 1]:
+                        i = bisect_right(self._offsets, start, i) - 1
+                    if end > self._offsets[i + 1] - 1:
+                        continue
+                    record(i, start, end, self._offsets[i])
+                return matches, total, len(self._accessions)
+
+            scanned = 0
+            for accession in dict.fromkeys(accessions):
+                i = self._index.get(accession)
+                if i is None:
+                    continue
+                scanned += 1
+                seq_start, seq_end = self.span(i)
+                for m in regex.finditer(self._buffer, seq_start, seq_end):
+                    start, end = m.span(1)
+                    if start != end:
+                        record(i, start, end, seq_start)
+            return matches, total, scanned
+
+
+def is_prosite(pattern: str) -> bool:
+    """True if ``pattern`` is written in PROSITE pattern syntax."""
+    return bool(_PROSITE_RE.fullmatch(pattern.strip()))
+
+
+def prosite_to_regex(pattern: str) -> str:
+    """Translate a PROSITE pattern (e.g. ``N-{P}-[ST]-{P}.``) into a regex."""
+    pattern = pattern.strip()
+    if not _PROSITE_RE.fullmatch(pattern):
+        raise ValueError(f"Invalid PROSITE pattern '{pattern}'")
+    pattern = pattern.rstrip(".")
+    prefix = suffix = ""
+    if pattern.startswith("<"):
+        prefix, pattern = "^", pattern[1:]
+    if pattern.endswith(">"):
+        suffix, pattern = "$", pattern[:-1]
+
+    parts = []
+    for element in pattern.split("-"):
+        token, repeat = _PROSITE_TOKEN_RE.fullmatch(element).groups()
+        if token == "x":
+            regex = "[A-Z]"
+        elif token.startswith("{"):
+            regex = f"[^{token[1:-1]}\\n]"
+        elif token.startswith("["):
+            residues = token[1:-1]
+            regex = f"[{residues.replace('<', '').replace('>', '')}]"
+            if "<" in residues:
+                regex = f"(?:^|{regex})"
+            if ">" in residues:
+                regex = f"(?:{regex}|$)"
+        else:
+            regex = token
+        if repeat:
+            regex += f"{{{repeat}}}"
+        parts.append(regex)
+    return prefix + "".join(parts) + suffix
+
+
+def compile_motif(pattern: str, syntax: str = "auto") -> Tuple[Pattern[bytes], str]:
+    """
+    Compile a PROSITE pattern or regex for ``SequenceCache.scan``.
+
+    The expression is wrapped in a lookahead so overlapping sites (e.g.
+    ``NNST`` for N-glycosylation) are all reported. Returns the compiled
+    pattern and the regex source it was built from.
+    """
+    if syntax not in ("auto", "prosite", "regex"):
+        raise ValueError(f"Unknown motif syntax '{syntax}'")
+    if syntax == "prosite" or (syntax == "auto" and is_prosite(pattern)):
+        regex = prosite_to_regex(pattern)
+    else:
+        regex = pattern
+    try:
+        compiled = re.compile(f"(?=({regex}))".encode("ascii"), re.MULTILINE)
+    except re.error as e:
+        raise ValueError(f"Invalid motif pattern '{pattern}': {e}") from e
+    return compiled, regex
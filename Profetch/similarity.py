@@ -0,0 +1,152 @@
+"""
+k-mer MinHash similarity index for uniPROscope MCP Client.
+"""
+
+import heapq
+import threading
+from collections import defaultdict
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .sequences import SequenceCache
+
+
+def sketch(sequence: bytes, k: int, size: int) -> List[int]:
+    """Bottom-``size`` MinHash sketch of the k-mer set of ``sequence`` (sorted)."""
+    hashes = {hash(sequence[i:i + k]) for i in range(len(sequence) - k + 1)}
+    return heapq.nsmallest(size, hashes)
+
+
+def banded_alignment_score(
+    a: bytes,
+    b: bytes,
+    band: int = 32,
+    match: int = 2,
+    mismatch: int = -1,
+    gap: int = -2,
+) -> int:
+    """
+    Local alignment score of ``a`` and ``b`` restricted to a diagonal band.
+
+    Only cells with ``|i - j - shift| <= band`` are filled, where ``shift``
+    centres the band on the length difference, and each row keeps only
+    its ``2 * band + 1`` band cells, so time is O(len(a) * band) and memory
+    O(band) rather than O(len(a) * len(b)). Substitution scores come from a
+    query profile, one row of scores against ``b`` per residue of ``a``.
+    The cells are filled one at a time in Python; nothing here is vectorised,
+    since NumPy is not a dependency.
+    """
+    n, m = len(a), len(b)
+    shift = (m - n) // 2
+    width = 2 * band + 1
+    best = 0
+    profile = {residue: [match if c == residue else mismatch for c in b] for residue in set(a)}
+    # Row i keeps only its band: cell k holds column j = i + shift - band + k.
+    # The previous row's band starts one column earlier, so its cell k is
+    # column j - 1 (diagonal) and cell k + 1 is column j (above); the extra
+    # trailing cell stays 0 for the column just past the previous band.
+    prev = [0] * (width + 1)
+    for i in range(1, n + 1):
+        start = i + shift - band
+        if start > m:
+            break
+        scores = profile[a[i - 1]]
+        row = [0] * (width + 1)
+        lo = max(1, start)
+        hi = min(m, start + width - 1)
+        left = 0
+        for j in range(lo, hi + 1):
+            k = j - start
+            score = prev[k] + scores[j - 1]
+            up = prev[k + 1] + gap
+            if up > score:
+                score = up
+            left += gap
+            if left > score:
+                score = left
+            if score < 0:
+                score = 0
+            row[k] = score
+            left = score
+            if score > best:
+                best = score
+        prev = row
+    return best
+
+
+class KmerIndex:
+    """
+    Inverted index over bottom-k MinHash sketches of protein sequences.
+
+    Each sequence contributes ``sketch_size`` hashes; a query looks up its own
+    sketch in the postings, so candidate retrieval touches only sequences that
+    share at least one sketched k-mer. Jaccard similarity is then estimated
+    from the merged bottom-k sketch of query and candidate.
+    """
+
+    def __init__(self, k: int = 5, sketch_size: int = 64):
+        self.k = k
+        self.sketch_size = sketch_size
+        self._accessions: List[str] = []
+        self._sketches: List[List[int]] = []
+        self._postings: Dict[int, List[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._accessions)
+
+    def add(self, accession: str, sequence: bytes) -> None:
+        with self._lock:
+            self._add(accession, sequence)
+
+    def _add(self, accession: str, sequence: bytes) -> None:
+        i = len(self._accessions)
+        signature = sketch(sequence, self.k, self.sketch_size)
+        self._accessions.append(accession)
+        self._sketches.append(signature)
+        for h in signature:
+            self._postings[h].append(i)
+
+    def sync(self, cache: "SequenceCache") -> int:
+        """Index sequences appended to ``cache`` since the last sync; returns how many."""
+        with self._lock:
+            start = len(self._accessions)
+            for accession, sequence in cache.items(start):
+                self._add(accession, sequence)
+            return len(self._accessions) - start
+
+    def jaccard(self, a: List[int], b: List[int]) -> float:
+        union = heapq.nsmallest(self.sketch_size, set(a) | set(b))
+        if not union:
+            return 0.0
+        both = set(a) & set(b)
+        return sum(1 for h in union if h in both) / len(union)
+
+    def query(
+        self,
+        sequence: bytes,
+        top_k: int = 10,
+        exclude: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return up to ``top_k`` indexed sequences ranked by estimated Jaccard."""
+        signature = sketch(sequence, self.k, self.sketch_size)
+        shared: Dict[int, int] = defaultdict(int)
+        for h in signature:
+            for i in self._postings.get(h, ()):
+                shared[i] += 1
+
+        # Only the sequences sharing the most sketch hashes are worth an exact
+        # Jaccard estimate; low-complexity k-mers can otherwise hit thousands.
+        candidates = heapq.nlargest(max(5 * top_k, 50), shared.items(), key=itemgetter(1))
+        hits = []
+        for i, count in candidates:
+            if self._accessions[i] == exclude:
+                continue
+            hits.append({
+                "accession": self._accessions[i],
+                "jaccard": round(self.jaccard(signature, self._sketches[i]), 4),
+                "shared_hashes": count,
+            })
+        hits.sort(key=lambda hit: (hit["jaccard"], hit["shared_hashes"]), reverse=True)
+        return hits[:top_k]
@@ -0,0 +1,67 @@
+"""
+Benchmark sequential call_tool round trips against one JSON-RPC batch.
+
+Runs ``n_calls`` gene lookups between a ClientSession and a lowlevel Server
+connected by ``mcp.shared.memory``, first one awaited call at a time and then
+as a single ``call_tools_batch``. In-memory streams have no network latency,
+so the gap shown here is a lower bound on what a batch saves over HTTP.
+
+    python benchmarks/bench_batch_requests.py [n_calls]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.lowlevel import Server  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+
+def make_server() -> Server:
+    server = Server("bench")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [
+            types.Tool(
+                name="get_gene_info",
+                inputSchema={"type": "object", "properties": {"gene_symbol": {"type": "string"}}},
+            )
+        ]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=arguments["gene_symbol"])]
+
+    return server
+
+
+async def compare(n_calls: int) -> tuple[float, float]:
+    calls = [("get_gene_info", {"gene_symbol": f"GENE{i}"}) for i in range(n_calls)]
+    async with create_connected_server_and_client_session(make_server()) as client:
+        start = time.perf_counter()
+        for name, arguments in calls:
+            await client.call_tool(name, arguments)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = await client.call_tools_batch(calls)
+        batched = time.perf_counter() - start
+
+    assert [r.content[0].text for r in results] == [a["gene_symbol"] for _, a in calls]
+    return sequential, batched
+
+
+def main() -> None:
+    n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    sequential, batched = anyio.run(compare, n_calls)
+    print(f"{n_calls} calls: sequential {sequential * 1e3:.1f} ms, batch {batched * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark EventStore store and replay throughput across many streams.
+
+Each stream is written by its own task, so stores from all streams interleave
+the way concurrent SSE responses do. Every stream is then replayed from its
+first event. Reports events/s for both phases and each store.
+
+    python benchmarks/bench_event_store.py [n_streams] [events_per_stream]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.event_store import FileEventStore, InMemoryEventStore  # noqa: E402
+from mcp.server.streamable_http import EventMessage, EventStore  # noqa: E402
+
+MESSAGE = types.JSONRPCMessage(
+    types.JSONRPCNotification(
+        jsonrpc="2.0",
+        method="notifications/progress",
+        params={"progressToken": 1, "progress": 0.5, "total": 1.0, "message": "fetching UniProt entries"},
+    )
+)
+
+
+async def run(store: EventStore, n_streams: int, events_per_stream: int) -> tuple[float, float]:
+    first_ids: dict[str, str] = {}
+
+    async def writer(stream_id: str) -> None:
+        for i in range(events_per_stream):
+            event_id = await store.store_event(stream_id, MESSAGE)
+            if i == 0:
+                first_ids[stream_id] = event_id
+            await anyio.lowlevel.checkpoint()
+
+    total = n_streams * events_per_stream
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for n in range(n_streams):
+            tg.start_soon(writer, str(n))
+    store_rate = total / (time.perf_counter() - start)
+
+    replayed = 0
+
+    async def count(event: EventMessage) -> None:
+        nonlocal replayed
+        replayed += 1
+
+    start = time.perf_counter()
+    for event_id in first_ids.values():
+        await store.replay_events_after(event_id, count)
+    replay_rate = replayed / (time.perf_counter() - start)
+    assert replayed == n_streams * (events_per_stream - 1)
+    return store_rate, replay_rate
+
+
+async def main(n_streams: int, events_per_stream: int) -> None:
+    print(f"{n_streams} streams x {events_per_stream} events")
+    print(f"{'store':<24}{'store ev/s':>14}{'replay ev/s':>14}")
+    store_rate, replay_rate = await run(InMemoryEventStore(), n_streams, events_per_stream)
+    print(f"{'InMemoryEventStore':<24}{store_rate:>14.0f}{replay_rate:>14.0f}")
+    with tempfile.TemporaryDirectory() as directory:
+        store = FileEventStore(directory, segment_bytes=1 << 20)
+        try:
+            store_rate, replay_rate = await run(store, n_streams, events_per_stream)
+        finally:
+            store.close()
+    print(f"{'FileEventStore':<24}{store_rate:>14.0f}{replay_rate:>14.0f}")
+
+
+if __name__ == "__main__":
+    n_streams = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    events_per_stream = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    anyio.run(main, n_streams, events_per_stream)
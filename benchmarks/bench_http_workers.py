@@ -0,0 +1,115 @@
+"""
+Load test stateless streamable HTTP served from pre-forked worker processes.
+
+For each worker count the script starts the server in a subprocess, then
+drives it from several client processes that each post tools/call requests
+back to back for a fixed time. The tool scores a banded alignment, so every
+request costs real CPU. Prints requests/s and the speedup over one worker;
+with enough cores for both the workers and the clients, throughput scales
+close to linearly until the cores run out.
+
+    python benchmarks/bench_http_workers.py [max_workers] [clients] [seconds]
+"""
+
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import httpx  # noqa: E402
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from similarity import banded_alignment_score  # noqa: E402
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+CALL = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "align", "arguments": {}}}
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def serve(workers: int, port: int) -> None:
+    rng = random.Random(0)
+    a = "".join(rng.choice(AMINO_ACIDS) for _ in range(400)).encode()
+    b = "".join(rng.choice(AMINO_ACIDS) for _ in range(400)).encode()
+    mcp = FastMCP("workers", port=port, stateless_http=True, json_response=True, workers=workers, log_level="WARNING")
+
+    @mcp.tool()
+    def align() -> int:
+        return banded_alignment_score(a, b)
+
+    mcp.run("streamable-http")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.post(url, json=CALL, headers=HEADERS).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server at {url} did not start")
+
+
+def client(url: str, seconds: float) -> int:
+    done = 0
+    with httpx.Client(headers=HEADERS) as http:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            http.post(url, json=CALL).raise_for_status()
+            done += 1
+    return done
+
+
+def measure(workers: int, clients: int, seconds: float) -> float:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/mcp/"
+    server = subprocess.Popen([sys.executable, __file__, "--serve", str(workers), str(port)])
+    try:
+        wait_ready(url)
+        with multiprocessing.Pool(clients) as pool:
+            start = time.perf_counter()
+            total = sum(pool.starmap(client, [(url, seconds)] * clients))
+            elapsed = time.perf_counter() - start
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+    return total / elapsed
+
+
+def main(max_workers: int, clients: int, seconds: float) -> None:
+    print(f"{os.cpu_count()} cores, {clients} client processes, {seconds:.0f}s per run")
+    print(f"{'workers':>8}{'req/s':>10}{'speedup':>10}")
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    baseline = None
+    for workers in counts:
+        rate = measure(workers, clients, seconds)
+        baseline = baseline or rate
+        print(f"{workers:>8}{rate:>10.0f}{rate / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--serve"]:
+        serve(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        cores = os.cpu_count() or 1
+        max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(1, cores // 2)
+        clients = int(sys.argv[2]) if len(sys.argv) > 2 else 2 * max_workers
+        seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+        main(max_workers, clients, seconds)
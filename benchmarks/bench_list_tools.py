@@ -0,0 +1,75 @@
+"""
+Benchmark FastMCP list_tools against a large catalogue.
+
+Registers a few hundred tools with typed signatures, then times list_tools
+round trips over in-memory streams twice: once with the handler rebuilding
+and re-serializing every Tool per request, as FastMCP used to, and once with
+the prebuilt listing. Also walks the catalogue page by page with a page size.
+
+    python benchmarks/bench_list_tools.py [n_tools] [requests] [page_size]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from mcp.server.fastmcp.server import _mcp_tool  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+
+def make_server(n_tools: int, page_size: int | None = None) -> FastMCP:
+    mcp = FastMCP("catalogue", list_page_size=page_size)
+
+    def lookup(gene: str, organism: str = "human", limit: int = 10, reviewed: bool = True) -> dict[str, str]:
+        """Look up a gene in UniProt and return a summary."""
+        return {"gene": gene}
+
+    for i in range(n_tools):
+        mcp.add_tool(lookup, name=f"lookup_{i}")
+    return mcp
+
+
+async def time_list_tools(mcp: FastMCP, n_requests: int, expected: int) -> float:
+    async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+        start = time.perf_counter()
+        for _ in range(n_requests):
+            tools, cursor = 0, None
+            while True:
+                result = await client.list_tools(cursor=cursor)
+                tools += len(result.tools)
+                cursor = result.nextCursor
+                if cursor is None:
+                    break
+            assert tools == expected, tools
+        return time.perf_counter() - start
+
+
+async def main(n_tools: int, n_requests: int, page_size: int) -> None:
+    print(f"{n_tools} tools, {n_requests} full listings")
+
+    rebuilt = make_server(n_tools)
+
+    async def rebuild():
+        return [_mcp_tool(info) for info in rebuilt._tool_manager.list_tools()]
+
+    rebuilt._mcp_server.list_tools()(rebuild)
+    elapsed = await time_list_tools(rebuilt, n_requests, n_tools)
+    print(f"{'rebuilt per request':<26}{elapsed:>8.2f}s{n_requests / elapsed:>10.1f} listings/s")
+
+    elapsed = await time_list_tools(make_server(n_tools), n_requests, n_tools)
+    print(f"{'prebuilt listing':<26}{elapsed:>8.2f}s{n_requests / elapsed:>10.1f} listings/s")
+
+    elapsed = await time_list_tools(make_server(n_tools, page_size), n_requests, n_tools)
+    print(f"{f'pages of {page_size}':<26}{elapsed:>8.2f}s{n_requests / elapsed:>10.1f} listings/s")
+
+
+if __name__ == "__main__":
+    n_tools = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    n_requests = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    page_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    anyio.run(main, n_tools, n_requests, page_size)
@@ -0,0 +1,114 @@
+"""
+Benchmark lowlevel Server load shedding under a flooding client.
+
+One session fires a burst of slow tool calls while a second session pings
+the server once every 50 ms. Without limits every call runs at once; with
+limits the excess is queued or rejected with SERVER_BUSY, and pings jump the
+queue. Prints tool calls completed and rejected, peak concurrency, and ping
+latency for both configurations.
+
+    python benchmarks/bench_load_shedding.py [burst] [max_concurrent] [per_session]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.lowlevel import Server  # noqa: E402
+from mcp.shared.exceptions import McpError  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+
+def make_server(**limits: int | None) -> tuple[Server, dict[str, int]]:
+    server = Server("shedding", **limits)
+    running = {"now": 0, "peak": 0}
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [types.Tool(name="fetch", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        try:
+            await anyio.sleep(0.2)  # stands in for an upstream UniProt request
+        finally:
+            running["now"] -= 1
+        return [types.TextContent(type="text", text="ok")]
+
+    return server, running
+
+
+async def run(burst: int, **limits: int | None) -> None:
+    server, running = make_server(**limits)
+    completed = rejected = 0
+    latencies: list[float] = []
+    flooding = True
+
+    async def call(client) -> None:
+        nonlocal completed, rejected
+        try:
+            await client.call_tool("fetch", {})
+            completed += 1
+        except McpError as err:
+            assert err.error.code == types.SERVER_BUSY
+            rejected += 1
+
+    async def flood() -> None:
+        nonlocal flooding
+        async with create_connected_server_and_client_session(server) as client:
+            await client.list_tools()
+            async with anyio.create_task_group() as tg:
+                for _ in range(burst):
+                    tg.start_soon(call, client)
+        flooding = False
+
+    async def probe() -> None:
+        async with create_connected_server_and_client_session(server) as client:
+            while flooding:
+                start = time.perf_counter()
+                await client.send_ping()
+                latencies.append((time.perf_counter() - start) * 1000)
+                await anyio.sleep(0.05)
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(flood)
+        tg.start_soon(probe)
+    elapsed = time.perf_counter() - start
+    p50 = statistics.median(latencies)
+    worst = max(latencies)
+    label = "unlimited" if not any(limits.values()) else "limited"
+    print(
+        f"{label:<10}{completed:>10}{rejected:>10}{running['peak']:>6}{elapsed:>9.2f}s"
+        f"{p50:>11.2f}{worst:>11.2f}"
+    )
+    if server.concurrency_stats():
+        for name, stats in server.concurrency_stats().items():
+            print(f"  {name}: {stats}")
+
+
+async def main(burst: int, max_concurrent: int, per_session: int) -> None:
+    print(f"{'':<10}{'completed':>10}{'rejected':>10}{'peak':>6}{'elapsed':>10}{'ping p50ms':>11}{'ping max':>11}")
+    await run(burst)
+    await run(
+        burst,
+        max_concurrent_requests=max_concurrent,
+        max_queued_requests=max_concurrent * 4,
+        max_concurrent_requests_per_session=per_session,
+        max_queued_requests_per_session=per_session * 4,
+    )
+
+
+if __name__ == "__main__":
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    max_concurrent = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    per_session = int(sys.argv[3]) if len(sys.argv) > 3 else 16
+    anyio.run(main, burst, max_concurrent, per_session)
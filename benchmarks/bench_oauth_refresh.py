@@ -0,0 +1,111 @@
+"""
+Benchmark concurrent requests through OAuthClientProvider.
+
+Sends bursts of concurrent requests through an httpx client whose transport
+stands in for an MCP server and its token endpoint, first with a fresh
+token, then with one due for refresh, then with one the server has revoked.
+Prints the token requests made, the peak number of requests in flight and
+the time per burst.
+
+    python benchmarks/bench_oauth_refresh.py [burst] [request_delay]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+import httpx  # noqa: E402
+
+from mcp.client.auth import OAuthClientProvider  # noqa: E402
+from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken  # noqa: E402
+
+REDIRECT_URIS = ["http://localhost/callback"]
+
+
+class MemoryStorage:
+    def __init__(self, tokens: OAuthToken):
+        self.tokens = tokens
+
+    async def get_tokens(self) -> OAuthToken | None:
+        return self.tokens
+
+    async def set_tokens(self, tokens: OAuthToken) -> None:
+        self.tokens = tokens
+
+    async def get_client_info(self) -> OAuthClientInformationFull | None:
+        return OAuthClientInformationFull(client_id="bench", redirect_uris=REDIRECT_URIS)
+
+    async def set_client_info(self, client_info: OAuthClientInformationFull) -> None:
+        pass
+
+
+class FakeServer:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.valid = {"initial"}
+        self.token_requests = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/token":
+            self.token_requests += 1
+            await anyio.sleep(self.delay * 2)
+            token = f"token-{self.token_requests}"
+            self.valid.add(token)
+            body = {"access_token": token, "token_type": "Bearer", "expires_in": 3600, "refresh_token": "r"}
+            return httpx.Response(200, json=body)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await anyio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        return httpx.Response(200 if token in self.valid else 401)
+
+
+async def interactive_auth(*args: object) -> tuple[str, str | None]:
+    raise AssertionError("the benchmark never needs interactive authorization")
+
+
+async def run(label: str, burst: int, delay: float) -> None:
+    server = FakeServer(delay)
+    storage = MemoryStorage(OAuthToken(access_token="initial", token_type="Bearer", refresh_token="r"))
+    provider = OAuthClientProvider(
+        "http://bench/mcp", OAuthClientMetadata(redirect_uris=REDIRECT_URIS), storage, interactive_auth, interactive_auth
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server.handle), auth=provider) as client:
+        await client.get("http://bench/mcp")  # loads the stored tokens
+        server.token_requests = server.peak = 0
+        if label == "due":
+            provider.context.token_refresh_time = time.time()
+        elif label == "revoked":
+            server.valid.clear()
+
+        async def request() -> None:
+            response = await client.get("http://bench/mcp")
+            assert response.status_code == 200, response.status_code
+
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(burst):
+                tg.start_soon(request)
+        elapsed = time.perf_counter() - start
+    print(f"{label:<10}{server.token_requests:>8}{server.peak:>10}{elapsed:>9.2f}s")
+
+
+async def main(burst: int, delay: float) -> None:
+    print(f"bursts of {burst} requests, {delay * 1000:.0f} ms each")
+    print(f"{'token':<10}{'refresh':>8}{'peak':>10}{'elapsed':>10}")
+    for label in ("fresh", "due", "revoked"):
+        await run(label, burst, delay)
+
+
+if __name__ == "__main__":
+    burst = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    anyio.run(main, burst, delay)
@@ -0,0 +1,53 @@
+"""
+Benchmark resource template lookup: compiled trie vs. a linear regex scan.
+
+    python benchmarks/bench_resource_router.py [n_templates]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+from mcp.server.fastmcp.resources import ResourceManager  # noqa: E402
+
+
+def make_manager(n_templates: int) -> ResourceManager:
+    manager = ResourceManager()
+    for i in range(n_templates):
+        manager.add_template(lambda acc: acc, f"uniprot{i}://entry/{{acc}}/features", name=f"entry_{i}")
+    manager.add_template(lambda symbol: symbol, "uniprot://gene/{symbol}", name="gene")
+    return manager
+
+
+async def time_lookups(manager: ResourceManager, uri: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await manager.get_resource(uri)
+    return (time.perf_counter() - start) / iterations
+
+
+def linear_scan(manager: ResourceManager, uri: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for template in manager.list_templates():
+            if template.matches(uri):
+                break
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else [10, 100, 1000]
+    print(f"{'templates':>10} {'trie get_resource':>20} {'linear matches':>16}")
+    for n in sizes:
+        manager = make_manager(n)
+        iterations = max(100, 20000 // n)
+        routed = asyncio.run(time_lookups(manager, "uniprot://gene/TP53", iterations))
+        linear = linear_scan(manager, "uniprot://gene/TP53", iterations)
+        print(f"{n:>10} {routed * 1e6:>17.1f} us {linear * 1e6:>13.1f} us")
+
+
+if __name__ == "__main__":
+    main()
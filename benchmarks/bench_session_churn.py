@@ -0,0 +1,99 @@
+"""
+Benchmark StreamableHTTPSessionManager memory under session churn.
+
+Opens sessions in rounds through an in-process ASGI client. Each session
+initializes and makes one tool call, then is abandoned without a DELETE, as
+a vanished client would leave it. After every round the script prints live
+sessions, reclaimed sessions and resident memory. With an idle timeout or a
+session cap these stay flat; with neither they grow with every round.
+
+    python benchmarks/bench_session_churn.py [rounds] [sessions_per_round] [idle_timeout|none] [max_sessions|none]
+"""
+
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+import httpx  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.lowlevel import Server  # noqa: E402
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager  # noqa: E402
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 0,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "churn", "version": "0"}},
+}
+
+
+def rss_mib() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1 << 20)
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # peak, not current
+
+
+def make_server() -> Server:
+    server = Server("churn")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [types.Tool(name="lookup", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text="x" * 4096)]
+
+    return server
+
+
+async def open_session(client: httpx.AsyncClient) -> None:
+    response = await client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+    headers = {**HEADERS, "mcp-session-id": response.headers["mcp-session-id"]}
+    await client.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=headers)
+    call = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "lookup", "arguments": {}}}
+    await client.post("/mcp", json=call, headers=headers)
+
+
+async def main(rounds: int, per_round: int, idle_timeout: float | None, max_sessions: int | None) -> None:
+    manager = StreamableHTTPSessionManager(
+        app=make_server(),
+        json_response=True,
+        session_idle_timeout=idle_timeout,
+        max_sessions=max_sessions,
+    )
+    transport = httpx.ASGITransport(app=manager.handle_request)
+    async with manager.run(), httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'round':>5}{'active':>8}{'reclaimed':>11}{'rejected':>10}{'RSS MiB':>10}")
+        for n in range(1, rounds + 1):
+            async with anyio.create_task_group() as tg:
+                for _ in range(per_round):
+                    tg.start_soon(open_session, client)
+            if idle_timeout is not None:
+                await anyio.sleep(idle_timeout * 1.5)
+            gc.collect()
+            print(
+                f"{n:>5}{manager.active_sessions:>8}{manager.reclaimed_sessions:>11}"
+                f"{manager.sessions_rejected:>10}{rss_mib():>10.1f}"
+            )
+
+
+def optional(value: str, kind: type) -> float | int | None:
+    return None if value == "none" else kind(value)
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    per_round = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    idle_timeout = optional(sys.argv[3], float) if len(sys.argv) > 3 else 0.5
+    max_sessions = optional(sys.argv[4], int) if len(sys.argv) > 4 else None
+    anyio.run(main, rounds, per_round, idle_timeout, max_sessions)
@@ -0,0 +1,93 @@
+"""
+Benchmark ClientSessionGroup startup against many stdio servers.
+
+Each server is a subprocess of this script whose list_* handlers take a
+fixed delay, standing in for a remote server's round trip, and whose tools
+span several pages. Times connecting them one at a time with
+connect_to_server against connect_all, and checks both saw every tool.
+
+    python benchmarks/bench_session_group.py [n_servers] [list_delay]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.client.session_group import ClientSessionGroup  # noqa: E402
+from mcp.client.stdio import StdioServerParameters  # noqa: E402
+from mcp.server.lowlevel import Server  # noqa: E402
+from mcp.server.stdio import stdio_server  # noqa: E402
+
+PAGES = 3
+TOOLS_PER_PAGE = 5
+
+
+def serve(name: str, delay: float) -> None:
+    server = Server(name)
+
+    async def list_tools(request: types.ListToolsRequest) -> types.ServerResult:
+        await anyio.sleep(delay)
+        page = int(request.params.cursor) if request.params and request.params.cursor else 0
+        tools = [
+            types.Tool(name=f"{name}_{page}_{i}", inputSchema={"type": "object"}) for i in range(TOOLS_PER_PAGE)
+        ]
+        next_cursor = str(page + 1) if page + 1 < PAGES else None
+        return types.ServerResult(types.ListToolsResult(tools=tools, nextCursor=next_cursor))
+
+    server.request_handlers[types.ListToolsRequest] = list_tools
+
+    @server.list_prompts()
+    async def list_prompts() -> list[types.Prompt]:
+        await anyio.sleep(delay)
+        return [types.Prompt(name=f"{name}_prompt")]
+
+    @server.list_resources()
+    async def list_resources() -> list[types.Resource]:
+        await anyio.sleep(delay)
+        return []
+
+    async def main() -> None:
+        async with stdio_server() as (read, write):
+            await server.run(read, write, server.create_initialization_options())
+
+    anyio.run(main)
+
+
+def params(n_servers: int, delay: float) -> list[StdioServerParameters]:
+    return [
+        StdioServerParameters(command=sys.executable, args=[__file__, "--serve", f"s{i}", str(delay)])
+        for i in range(n_servers)
+    ]
+
+
+async def main(n_servers: int, delay: float) -> None:
+    expected = n_servers * PAGES * TOOLS_PER_PAGE
+    print(f"{n_servers} servers, {delay * 1000:.0f} ms per list call, {PAGES} pages of tools")
+
+    async with ClientSessionGroup() as group:
+        start = time.perf_counter()
+        for server_params in params(n_servers, delay):
+            await group.connect_to_server(server_params)
+        elapsed = time.perf_counter() - start
+    print(f"{'connect_to_server loop':<24}{elapsed:>8.2f}s")
+
+    async with ClientSessionGroup() as group:
+        start = time.perf_counter()
+        await group.connect_all(params(n_servers, delay), timeout=30)
+        elapsed = time.perf_counter() - start
+        assert len(group.tools) == expected, len(group.tools)
+    print(f"{'connect_all':<24}{elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--serve"]:
+        serve(sys.argv[2], float(sys.argv[3]))
+    else:
+        n_servers = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+        delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+        anyio.run(main, n_servers, delay)
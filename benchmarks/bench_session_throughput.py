@@ -0,0 +1,85 @@
+"""
+Benchmark request throughput through BaseSession over in-memory streams.
+
+Reports end-to-end call_tool round trips per second between a ClientSession
+and a lowlevel Server connected by ``mcp.shared.memory``, and the per-message
+cost of decoding a request into ``ClientRequest`` on its own.
+
+    python benchmarks/bench_session_throughput.py [n_requests]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.lowlevel import Server  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+from mcp.shared.session import validate_incoming  # noqa: E402
+
+
+def make_server() -> Server:
+    server = Server("bench")
+
+    @server.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return [
+            types.Tool(
+                name="get_gene_info",
+                inputSchema={"type": "object", "properties": {"gene_symbol": {"type": "string"}}},
+            )
+        ]
+
+    @server.call_tool()
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        return [types.TextContent(type="text", text=arguments["gene_symbol"])]
+
+    return server
+
+
+async def round_trips(n_requests: int, concurrency: int = 32) -> float:
+    async with create_connected_server_and_client_session(make_server()) as client:
+        start = time.perf_counter()
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                await client.call_tool("get_gene_info", {"gene_symbol": "TP53"})
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(concurrency):
+                tg.start_soon(worker, n_requests // concurrency)
+        return (n_requests // concurrency) * concurrency / (time.perf_counter() - start)
+
+
+def decode_cost(iterations: int) -> tuple[float, float]:
+    raw = (
+        b'{"jsonrpc": "2.0", "id": 7, "method": "tools/call",'
+        b' "params": {"name": "get_gene_info", "arguments": {"gene_symbol": "TP53"}}}'
+    )
+    message = types.JSONRPCMessage.model_validate_json(raw).root
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        types.ClientRequest.model_validate(message.model_dump(by_alias=True, mode="json", exclude_none=True))
+    dump_and_revalidate = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        validate_incoming(types.ClientRequest, message)
+    dispatched = (time.perf_counter() - start) / iterations
+    return dump_and_revalidate, dispatched
+
+
+def main() -> None:
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    old, new = decode_cost(20000)
+    print(f"decode: dump + union revalidate {old * 1e6:.2f} us, method dispatch {new * 1e6:.2f} us")
+    print(f"call_tool round trips: {anyio.run(round_trips, n_requests):.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark stdio_server framing throughput over a pair of OS pipes.
+
+Measures messages/s for the stdin reader (pipe -> read_stream) and for the
+stdout writer under a burst of concurrent senders (write_stream -> pipe).
+
+    python benchmarks/bench_stdio_framing.py [n_messages]
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+import mcp.types as types  # noqa: E402
+from mcp.server.stdio import stdio_server  # noqa: E402
+from mcp.shared.message import SessionMessage  # noqa: E402
+
+PROGRESS = (
+    b'{"jsonrpc":"2.0","method":"notifications/progress",'
+    b'"params":{"progressToken":1,"progress":0.5,"total":1.0}}\n'
+)
+
+
+def pipe_pair():
+    in_r, in_w = os.pipe()
+    out_r, out_w = os.pipe()
+    stdin = anyio.wrap_file(os.fdopen(in_r, "rb"))
+    stdout = anyio.wrap_file(os.fdopen(out_w, "wb"))
+    return stdin, os.fdopen(in_w, "wb"), stdout, os.fdopen(out_r, "rb")
+
+
+async def bench_reader(n_messages: int) -> float:
+    stdin, feed, stdout, _ = pipe_pair()
+
+    def produce() -> None:
+        with feed:
+            feed.write(PROGRESS * n_messages)
+
+    async with stdio_server(stdin=stdin, stdout=stdout) as (read_stream, write_stream):
+        start = time.perf_counter()
+        threading.Thread(target=produce, daemon=True).start()
+        received = 0
+        async for message in read_stream:
+            received += 1
+            if received == n_messages:
+                break
+        elapsed = time.perf_counter() - start
+        await write_stream.aclose()
+        await read_stream.aclose()
+    return n_messages / elapsed
+
+
+async def bench_writer(n_messages: int, senders: int = 64) -> float:
+    stdin, feed, stdout, drain = pipe_pair()
+    done = threading.Event()
+    senders = min(senders, n_messages)
+    total = (n_messages // senders) * senders
+
+    def consume() -> None:
+        lines = 0
+        while lines < total:
+            chunk = drain.read1(1 << 16)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+        done.set()
+
+    message = SessionMessage(types.JSONRPCMessage.model_validate_json(PROGRESS))
+    async with stdio_server(stdin=stdin, stdout=stdout) as (read_stream, write_stream):
+        threading.Thread(target=consume, daemon=True).start()
+        start = time.perf_counter()
+
+        async def sender(count: int) -> None:
+            for _ in range(count):
+                await write_stream.send(message)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(senders):
+                tg.start_soon(sender, n_messages // senders)
+        await anyio.to_thread.run_sync(done.wait)
+        elapsed = time.perf_counter() - start
+        feed.close()
+        await write_stream.aclose()
+    return total / elapsed
+
+
+def main() -> None:
+    n_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"stdin reader: {anyio.run(bench_reader, n_messages):>10.0f} msg/s")
+    print(f"stdout writer: {anyio.run(bench_writer, n_messages):>9.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
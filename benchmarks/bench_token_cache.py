@@ -0,0 +1,81 @@
+"""
+Benchmark bearer-token verification with and without CachingTokenVerifier.
+
+Serves a Starlette app behind BearerAuthBackend whose verifier sleeps for a
+fixed delay, standing in for a token introspection round trip, and sends it
+requests from a few clients, each reusing its own token, plus some requests
+with an invalid token. Prints the time per request and the cache hit rate.
+
+    python benchmarks/bench_token_cache.py [requests] [verify_delay]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+import httpx  # noqa: E402
+from starlette.applications import Starlette  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.middleware.authentication import AuthenticationMiddleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import PlainTextResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+from mcp.server.auth.middleware.bearer_auth import BearerAuthBackend  # noqa: E402
+from mcp.server.auth.provider import AccessToken, TokenVerifier  # noqa: E402
+from mcp.server.auth.token_cache import CachingTokenVerifier  # noqa: E402
+
+CLIENTS = 8
+
+
+class IntrospectingVerifier(TokenVerifier):
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def verify_token(self, token: str) -> AccessToken | None:
+        self.calls += 1
+        await anyio.sleep(self.delay)
+        if not token.startswith("valid-"):
+            return None
+        return AccessToken(token=token, client_id=token, scopes=["mcp"], expires_at=int(time.time()) + 3600)
+
+
+async def run(label: str, verifier: TokenVerifier, n_requests: int) -> None:
+    async def endpoint(request: Request) -> PlainTextResponse:
+        return PlainTextResponse("ok" if request.user.is_authenticated else "anonymous")
+
+    app = Starlette(
+        routes=[Route("/mcp/", endpoint, methods=["POST"])],
+        middleware=[Middleware(AuthenticationMiddleware, backend=BearerAuthBackend(verifier))],
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        start = time.perf_counter()
+        for i in range(n_requests):
+            token = f"valid-{i % CLIENTS}" if i % 10 else "expired"
+            response = await client.post("/mcp/", headers={"Authorization": f"Bearer {token}"})
+            assert response.text == ("ok" if i % 10 else "anonymous"), response.text
+        elapsed = time.perf_counter() - start
+    print(f"{label:<10}{elapsed / n_requests * 1000:>12.2f}", end="")
+
+
+async def main(n_requests: int, delay: float) -> None:
+    print(f"{n_requests} requests from {CLIENTS} clients, {delay * 1000:.0f} ms per verification")
+    print(f"{'':<10}{'ms/request':>12}{'verifications':>15}{'hit rate':>10}")
+    plain = IntrospectingVerifier(delay)
+    await run("plain", plain, n_requests)
+    print(f"{plain.calls:>15}")
+
+    inner = IntrospectingVerifier(delay)
+    cached = CachingTokenVerifier(inner, ttl=60, negative_ttl=5)
+    await run("cached", cached, n_requests)
+    print(f"{inner.calls:>15}{cached.stats.hit_rate:>10.1%}")
+
+
+if __name__ == "__main__":
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.01
+    anyio.run(main, n_requests, delay)
@@ -0,0 +1,57 @@
+"""
+Benchmark per-call argument validation overhead for FastMCP tools.
+
+    python benchmarks/bench_tool_arguments.py [iterations]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+from pydantic import BaseModel  # noqa: E402
+
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata  # noqa: E402
+
+
+class Filter(BaseModel):
+    organism_id: int = 9606
+    reviewed: bool = True
+
+
+async def get_gene_info(gene_symbol: str) -> dict:
+    return {}
+
+
+async def search(gene_symbols: list[str], filter: Filter, limit: int | None = None, fields: dict[str, str] | None = None) -> dict:
+    return {}
+
+
+CASES = {
+    "simple (str)": (get_gene_info, {"gene_symbol": "TP53"}),
+    "complex (list, model, JSON strings)": (
+        search,
+        {"gene_symbols": '["TP53", "BRCA1"]', "filter": '{"organism_id": 10090}', "limit": 5},
+    ),
+}
+
+
+async def time_calls(fn, arguments, iterations: int) -> float:
+    meta = func_metadata(fn)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await meta.call_fn_with_arg_validation(fn, True, arguments, None)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for name, (fn, arguments) in CASES.items():
+        per_call = asyncio.run(time_calls(fn, arguments, iterations))
+        print(f"{name:<40} {per_call * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
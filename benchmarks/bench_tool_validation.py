@@ -0,0 +1,92 @@
+"""
+Benchmark ClientSession validation of structured tool results.
+
+First times schema validation alone: jsonschema.validate, which checks the
+schema and builds a validator on every call, against the validator that
+ClientSession now compiles once per tool. Then times structured call_tool
+round trips over in-memory streams at several validation sample rates.
+
+    python benchmarks/bench_tool_validation.py [n_calls]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+from jsonschema import validate  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from mcp.client.session import _compile_validator  # noqa: E402
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+
+class GeneInfo(BaseModel):
+    gene_symbol: str
+    uniprot_id: str
+    protein_name: str
+    length: int
+    mass: int
+    go_terms: list[str]
+    subcellular_location: list[str]
+    interactions: list[str]
+
+
+RESULT = GeneInfo(
+    gene_symbol="TP53",
+    uniprot_id="P04637",
+    protein_name="Cellular tumor antigen p53",
+    length=393,
+    mass=43653,
+    go_terms=[f"GO:{n:07d}" for n in range(40)],
+    subcellular_location=["Nucleus", "Cytoplasm", "Endoplasmic reticulum"],
+    interactions=[f"Q{n:05d}" for n in range(30)],
+)
+
+
+def bench_validation(n: int) -> None:
+    schema = GeneInfo.model_json_schema()
+    instance = RESULT.model_dump()
+    start = time.perf_counter()
+    for _ in range(n):
+        validate(instance, schema)
+    per_call = (time.perf_counter() - start) / n * 1e6
+    print(f"{'jsonschema.validate':<24}{per_call:>10.1f} us/result")
+    validator = _compile_validator(schema)
+    start = time.perf_counter()
+    for _ in range(n):
+        assert validator.is_valid(instance)
+    per_call = (time.perf_counter() - start) / n * 1e6
+    print(f"{'compiled validator':<24}{per_call:>10.1f} us/result")
+
+
+async def bench_calls(n: int, sample_rate: float) -> None:
+    mcp = FastMCP("validation")
+
+    @mcp.tool()
+    def gene_info() -> GeneInfo:
+        return RESULT
+
+    async with create_connected_server_and_client_session(
+        mcp._mcp_server, validation_sample_rate=sample_rate
+    ) as client:
+        await client.list_tools()
+        start = time.perf_counter()
+        for _ in range(n):
+            await client.call_tool("gene_info", {})
+        rate = n / (time.perf_counter() - start)
+    print(f"{'sample rate ' + str(sample_rate):<24}{rate:>10.0f} calls/s")
+
+
+async def main(n: int) -> None:
+    bench_validation(n)
+    for sample_rate in (1.0, 0.1, 0.0):
+        await bench_calls(n, sample_rate)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    anyio.run(main, n)
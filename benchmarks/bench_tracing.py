@@ -0,0 +1,82 @@
+"""
+Benchmark the overhead of request tracing.
+
+Times tool calls over in-memory streams with tracing off, then writing JSON
+lines, then writing a Chrome trace, and prints the spans recorded per call
+and how many were linked to a request ID. Pass a directory to keep the trace
+files for chrome://tracing or https://ui.perfetto.dev.
+
+    python benchmarks/bench_tracing.py [calls] [trace_dir]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
+
+import anyio  # noqa: E402
+
+from mcp.server.fastmcp import FastMCP  # noqa: E402
+from mcp.shared import tracing  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+
+def make_server() -> FastMCP:
+    mcp = FastMCP("traced")
+
+    @mcp.tool()
+    def lookup(gene: str, organism: str = "human", limit: int = 10) -> dict[str, str]:
+        """Look up a gene in UniProt and return a summary."""
+        return {"gene": gene, "organism": organism}
+
+    return mcp
+
+
+async def time_calls(n_calls: int) -> float:
+    async with create_connected_server_and_client_session(make_server()._mcp_server) as client:
+        start = time.perf_counter()
+        for i in range(n_calls):
+            result = await client.call_tool("lookup", {"gene": f"GENE{i}", "limit": 5})
+            assert not result.isError, result
+        return time.perf_counter() - start
+
+
+def read_spans(path: str) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line.rstrip(",\n")) for line in f if line.strip() not in ("", "[")]
+
+
+async def run(label: str, n_calls: int, path: str | None, baseline: float | None) -> float:
+    tracing.configure(path)
+    elapsed = await time_calls(n_calls)
+    tracing.configure(None)
+    overhead = f"{(elapsed / baseline - 1):>+10.1%}" if baseline else f"{'':>10}"
+    print(f"{label:<10}{elapsed / n_calls * 1e6:>10.0f}{overhead}", end="")
+    if path is None:
+        print()
+    else:
+        spans = read_spans(path)
+        linked = sum("request_id" in span["args"] for span in spans)
+        print(f"{len(spans) / n_calls:>12.1f}{linked / len(spans):>10.0%}")
+    return elapsed
+
+
+async def main(n_calls: int, trace_dir: str) -> None:
+    print(f"{n_calls} tool calls")
+    print(f"{'tracing':<10}{'us/call':>10}{'overhead':>10}{'spans/call':>12}{'linked':>10}")
+    await time_calls(50)  # warm up
+    baseline = await run("off", n_calls, None, None)
+    for label, name in (("jsonl", "trace.jsonl"), ("chrome", "trace.json")):
+        path = os.path.join(trace_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+        await run(label, n_calls, path, baseline)
+
+
+if __name__ == "__main__":
+    n_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    trace_dir = sys.argv[2] if len(sys.argv) > 2 else tempfile.mkdtemp(prefix="mcp-trace-")
+    anyio.run(main, n_calls, trace_dir)
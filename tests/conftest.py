@@ -0,0 +1,11 @@
+"""
+Shared test setup.
+
+Profetch/mcp_server.py runs with Profetch/ first on sys.path, so ``mcp``
+is the vendored copy under Profetch/mcp. Tests import it the same way.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "Profetch"))
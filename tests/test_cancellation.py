@@ -0,0 +1,137 @@
+"""
+Tests for cancelling blocking UniProt requests.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from Profetch.bridge import Bridge, Config
+from Profetch.cancellation import CancelToken, RequestCancelled, _call, run_cancellable
+
+
+@pytest.fixture
+def hanging_url():
+    """URL of a server that accepts connections and never answers."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    held = []
+    stop = threading.Event()
+
+    def accept():
+        listener.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                held.append(listener.accept()[0])
+            except socket.timeout:
+                pass
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{listener.getsockname()[1]}"
+    stop.set()
+    thread.join()
+    for conn in held:
+        conn.close()
+    listener.close()
+
+
+@pytest.fixture
+def json_url():
+    """URL of a keep-alive server answering every GET with an empty result page."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"results": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestCancellation:
+    """Test run_cancellable and the Bridge session adapter."""
+
+    def test_cancel_aborts_blocked_request(self, hanging_url):
+        bridge = Bridge(Config(base_url=hanging_url, timeout=30))
+        finished = threading.Event()
+
+        def fetch():
+            try:
+                bridge.session.get(f"{hanging_url}/uniprotkb/search", timeout=30)
+            finally:
+                finished.set()
+
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(run_cancellable(fetch), 0.2)
+
+        start = time.monotonic()
+        asyncio.run(main())
+        assert finished.wait(2)
+        assert time.monotonic() - start < 5
+
+    def test_cancel_aborts_batch_subtasks(self, hanging_url):
+        bridge = Bridge(Config(base_url=hanging_url, timeout=30))
+
+        async def main():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bridge.compare_genes(["TP53", "BRCA1", "EGFR"]), 0.2)
+
+        start = time.monotonic()
+        asyncio.run(main())  # waits for the executor threads to finish
+        assert time.monotonic() - start < 5
+
+    def test_compare_genes_propagates_cancelled_subtask(self):
+        bridge = Bridge(Config(prewarm_connections=0))
+
+        async def run(fn, symbol):
+            if symbol == "BRCA1":
+                raise asyncio.CancelledError()
+            return {"primaryAccession": symbol}
+
+        bridge._run = run
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(bridge.compare_genes(["TP53", "BRCA1"]))
+
+    def test_cancelled_token_refuses_new_requests(self, hanging_url):
+        bridge = Bridge(Config(base_url=hanging_url))
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(RequestCancelled):
+            _call(token, bridge.session.get, (hanging_url,))
+
+    def test_pooled_connections_survive_finished_calls(self, json_url):
+        bridge = Bridge(Config(base_url=json_url))
+        token = CancelToken()
+        assert _call(token, bridge.session.get, (json_url,)).json() == {"results": []}
+        token.cancel()  # after the call finished: must not touch the pooled connection
+        assert asyncio.run(run_cancellable(bridge.session.get, json_url)).json() == {"results": []}
+
+    def test_aclose_cancels_calls_past_grace(self, hanging_url):
+        bridge = Bridge(Config(base_url=hanging_url, timeout=30, prewarm_connections=0))
+
+        async def main():
+            call = asyncio.ensure_future(bridge.get_gene_info("TP53"))
+            await asyncio.sleep(0.05)
+            await bridge.aclose(grace=0.1)
+            assert "error" in await asyncio.wait_for(call, 2)
+            with pytest.raises(RuntimeError):
+                await bridge.get_gene_info("BRCA1")
+
+        asyncio.run(main())
@@ -0,0 +1,139 @@
+"""
+Tests for the in-process and cross-process UniProt entry caches.
+"""
+
+import os
+import time
+
+import pytest
+from Profetch.bridge import Bridge, Config
+from Profetch.entry_store import MemoryEntryCache, SQLiteEntryStore
+
+ENTRY = {
+    "primaryAccession": "P04637",
+    "uniProtkbId": "P53_HUMAN",
+    "sequence": {"value": "MEEPQSDPSV", "length": 10},
+}
+
+
+class TestMemoryEntryCache:
+    """Test the bounded in-process entry cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = MemoryEntryCache(max_size=2)
+        cache.put("TP53", ENTRY)
+        cache.put("BRCA1", ENTRY)
+        assert cache.get("TP53") == ENTRY  # BRCA1 is now least recently used
+        cache.put("EGFR", ENTRY)
+        assert cache.get("BRCA1") is None
+        assert cache.get("TP53") == ENTRY
+        assert len(cache) == 2
+        assert cache.evictions == 1
+
+    def test_ttl(self, monkeypatch):
+        cache = MemoryEntryCache(ttl=60)
+        cache.put("TP53", ENTRY)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+        assert cache.get("TP53") is None
+        assert len(cache) == 0
+
+    def test_bridge_bounds_entries(self):
+        bridge = Bridge(Config(entry_cache_size=1))
+
+        class Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"results": [ENTRY]}
+
+        bridge.session.get = lambda *args, **kwargs: Response()
+        bridge._search_entry_sync("TP53")
+        bridge._search_entry_sync("BRCA1")
+        assert len(bridge._entries) == 1
+
+
+class TestSQLiteEntryStore:
+    """Test SQLiteEntryStore and its use by Bridge."""
+
+    def test_round_trip(self, tmp_path):
+        store = SQLiteEntryStore(str(tmp_path / "entries.sqlite3"))
+        assert store.get("TP53") is None
+        store.put("TP53", ENTRY)
+        assert store.get("TP53") == ENTRY
+        assert len(store) == 1
+
+    def test_shared_between_stores(self, tmp_path):
+        path = str(tmp_path / "entries.sqlite3")
+        SQLiteEntryStore(path).put("TP53", ENTRY)
+        assert SQLiteEntryStore(path).get("TP53") == ENTRY
+
+    def test_max_age(self, tmp_path):
+        store = SQLiteEntryStore(str(tmp_path / "entries.sqlite3"), max_age=-1)
+        store.put("TP53", ENTRY)
+        assert store.get("TP53") is None
+
+    def test_expired_rows_are_deleted(self, tmp_path):
+        store = SQLiteEntryStore(str(tmp_path / "entries.sqlite3"), max_age=60)
+        store.put("TP53", ENTRY)
+        store._connection().execute("UPDATE entries SET fetched_at = fetched_at - 61")
+        store.put("BRCA1", ENTRY)
+        assert len(store) == 1
+        store._connection().execute("UPDATE entries SET fetched_at = fetched_at - 61")
+        store.flush()
+        assert len(store) == 0
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_visible_across_fork(self, tmp_path):
+        store = SQLiteEntryStore(str(tmp_path / "entries.sqlite3"))
+        store.get("TP53")  # open a connection in the parent before forking
+        pid = os.fork()
+        if pid == 0:
+            store.put("TP53", ENTRY)
+            os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert store.get("TP53") == ENTRY
+
+    def test_bridge_reads_shared_store(self, tmp_path):
+        path = str(tmp_path / "entries.sqlite3")
+        SQLiteEntryStore(path).put("TP53", ENTRY)
+        bridge = Bridge(Config(cache_path=path))
+
+        def offline(*args, **kwargs):
+            raise AssertionError("entry should come from the shared store")
+
+        bridge.session.get = offline
+        assert bridge._search_entry_sync("tp53") == ENTRY
+        assert "P04637" in bridge.sequences
+
+    def test_bridge_refetches_aged_entry(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "entries.sqlite3")
+        SQLiteEntryStore(path).put("TP53", ENTRY)
+        bridge = Bridge(Config(cache_path=path, entry_cache_ttl=60))
+        assert bridge.entry_store.max_age == 60
+        fresh = {**ENTRY, "uniProtkbId": "FRESH"}
+
+        class Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"results": [fresh]}
+
+        fetches = []
+        bridge.session.get = lambda *args, **kwargs: fetches.append(args) or Response()
+
+        # Stored 50 seconds ago: served from the store, with 10 seconds left
+        bridge.entry_store._connection().execute("UPDATE entries SET fetched_at = fetched_at - 50")
+        assert bridge._search_entry_sync("TP53") == ENTRY
+        assert fetches == []
+
+        # 11 seconds later the copy in memory and the row have both expired
+        now, wall = time.monotonic(), time.time()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        monkeypatch.setattr(time, "time", lambda: wall + 11)
+        assert bridge._search_entry_sync("TP53") == fresh
+        assert len(fetches) == 1
+        assert bridge.entry_store.get("TP53") == fresh
@@ -0,0 +1,88 @@
+"""
+Tests for columnar bulk export.
+"""
+
+import csv
+import os
+
+import pytest
+from Profetch import export
+from Profetch.export import TABLES, entry_rows, export_directory, write_tables
+
+ENTRY = {
+    "primaryAccession": "P04637",
+    "uniProtkbId": "P53_HUMAN",
+    "sequence": {"length": 393, "mass": 43653},
+    "uniProtKBCrossReferences": [
+        {"database": "GO", "id": "GO:0005634", "properties": [{"key": "GoTerm", "value": "C:nucleus"}]},
+        {"database": "PDB", "id": "1A1U", "properties": []},
+    ],
+    "comments": [
+        {"commentType": "SUBCELLULAR LOCATION", "subcellularLocations": [{"location": {"value": "Nucleus"}}]},
+        {"commentType": "INTERACTION", "interactions": [{"interactantTwo": {"uniProtKBAccession": "Q00987"}}]},
+    ],
+}
+
+
+class TestExport:
+    """Test entry_rows and write_tables."""
+
+    def test_entry_rows(self):
+        rows = entry_rows("TP53", ENTRY)
+        assert set(rows) == set(TABLES)
+        assert rows["scalars"][0][:3] == ("TP53", "P04637", "P53_HUMAN")
+        assert rows["go"] == [("TP53", "P04637", "GO:0005634", "C:nucleus")]
+        assert rows["locations"] == [("TP53", "P04637", "Nucleus")]
+        assert rows["interactions"] == [("TP53", "P04637", "Q00987")]
+
+    def test_write_tsv_in_chunks(self, tmp_path):
+        result = write_tables((("TP53", ENTRY) for _ in range(5)), str(tmp_path / "out"), "tsv", chunk_size=2)
+        assert result["entries"] == 5
+        assert result["uri"].startswith("file://")
+        assert result["tables"]["go"] == {"file": "go.tsv", "rows": 5}
+        with open(tmp_path / "out" / "go.tsv", newline="") as f:
+            rows = list(csv.reader(f, delimiter="\t"))
+        assert rows[0] == [column for column, _ in TABLES["go"]]
+        assert len(rows) == 6
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_tables([], str(tmp_path), "xlsx")
+
+    @pytest.mark.parametrize("path", ["/tmp/out", "~/out", "../out", "a/../../out"])
+    def test_export_directory_rejects_escapes(self, tmp_path, path):
+        with pytest.raises(ValueError):
+            export_directory(str(tmp_path), path)
+
+    def test_export_directory_rejects_symlink_out(self, tmp_path):
+        root = tmp_path / "exports"
+        root.mkdir()
+        os.symlink(tmp_path, root / "link")
+        assert export_directory(str(root), "runs/1") == root / "runs" / "1"
+        with pytest.raises(ValueError):
+            export_directory(str(root), "link/out")
+
+    def test_refuses_symlinked_table_file(self, tmp_path):
+        root = tmp_path / "exports"
+        (root / "out").mkdir(parents=True)
+        os.symlink(tmp_path / "elsewhere.tsv", root / "out" / "go.tsv")
+        with pytest.raises(ValueError):
+            write_tables([("TP53", ENTRY)], "out", "tsv", root=str(root))
+        assert not (tmp_path / "elsewhere.tsv").exists()
+
+    def test_closes_opened_writers_when_one_fails(self, tmp_path, monkeypatch):
+        opened = []
+        real_writer = export._TableWriter
+
+        class FailingWriter(real_writer):
+            def __init__(self, name, *args):
+                if name == "locations":
+                    raise OSError("disk full")
+                super().__init__(name, *args)
+                opened.append(self)
+
+        monkeypatch.setattr(export, "_TableWriter", FailingWriter)
+        with pytest.raises(OSError):
+            write_tables([("TP53", ENTRY)], str(tmp_path / "out"), "tsv")
+        assert [writer.name for writer in opened] == ["scalars", "go"]
+        assert all(writer._file.closed for writer in opened)
@@ -65,3 +65,52 @@ class TestBridge:
         result = bridge.get_subcellular_location("TP53")
         assert isinstance(result, list)
         assert all(isinstance(loc, str) for loc in result)
+
+
+def _entry(accession, go_ids, locations, interactors):
+    return {
+        "primaryAccession": accession,
+        "uniProtKBCrossReferences": [
+            {"database": "GO", "id": go_id, "properties": [{"key": "GoTerm", "value": "term"}]}
+            for go_id in go_ids
+        ],
+        "comments": [
+            {
+                "commentType": "SUBCELLULAR LOCATION",
+                "subcellularLocations": [{"location": {"value": loc}} for loc in locations],
+            },
+            {
+                "commentType": "INTERACTION",
+                "interactions": [
+                    {"interactantTwo": {"uniProtKBAccession": acc}} for acc in interactors
+                ],
+            },
+        ],
+    }
+
+
+class TestCompareGenes:
+    """Test the set arithmetic behind compare_genes."""
+
+    def test_shared_and_unique(self):
+        bridge = Bridge()
+        result = bridge._compare_entries(
+            {
+                "TP53": _entry("P04637", ["GO:1", "GO:2"], ["Nucleus", "Cytoplasm"], ["Q00987"]),
+                "MDM2": _entry("Q00987", ["GO:2", "GO:3"], ["Nucleus"], ["P04637"]),
+            },
+            {"FAKE": "No data found for gene symbol 'FAKE'"},
+        )
+        assert result["shared"]["go_terms"] == ["GO:2: term"]
+        assert result["shared"]["subcellular_location"] == ["Nucleus"]
+        rows = {row[0]: dict(zip(result["columns"], row)) for row in result["rows"]}
+        assert rows["TP53"]["unique_go_terms"] == ["GO:1: term"]
+        assert rows["TP53"]["unique_subcellular_location"] == ["Cytoplasm"]
+        assert rows["MDM2"]["n_go_terms"] == 2
+        assert result["interacting_pairs"] == [["MDM2", "TP53"], ["TP53", "MDM2"]]
+        assert "FAKE" in result["errors"]
+
+    def test_gene_count_is_bounded(self):
+        import asyncio
+        result = asyncio.run(Bridge().compare_genes(["TP53"]))
+        assert "error" in result
@@ -0,0 +1,167 @@
+"""
+Tests for JSON-RPC batches in the MCP sessions and transports.
+"""
+
+import json
+from datetime import timedelta
+
+import anyio
+import httpx
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.shared.batch import BatchCollector, parse_messages
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.shared.message import SessionMessage
+
+
+def make_server():
+    server = Server("batch-test")
+
+    @server.list_tools()
+    async def list_tools():
+        return [types.Tool(name="echo", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        if name == "fail":
+            raise ValueError("tool failed")
+        if name == "sleep":
+            await anyio.sleep(10)
+        return [types.TextContent(type="text", text=str(arguments.get("x")))]
+
+    return server
+
+
+def request(request_id, method="ping", params=None):
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+def response(request_id):
+    return types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=request_id, result={}))
+
+
+def texts(results):
+    return [result.content[0].text if isinstance(result, types.CallToolResult) else result for result in results]
+
+
+class TestBatchCollector:
+    """Test parsing batches and grouping their responses."""
+
+    def test_parse_messages(self):
+        assert len(parse_messages(json.dumps(request(1)))) == 1
+        batch = parse_messages(json.dumps([request(1), {"jsonrpc": "2.0", "method": "notifications/initialized"}]))
+        assert [type(message.root) for message in batch] == [types.JSONRPCRequest, types.JSONRPCNotification]
+
+    def test_holds_responses_until_batch_complete(self):
+        collector = BatchCollector()
+        collector.register(parse_messages(json.dumps([request(1), {"jsonrpc": "2.0", "method": "x"}, request(2)])))
+        assert collector.add_response(response(7)) is None  # not part of the batch
+        assert collector.add_response(response(2)) == []
+        batch = collector.add_response(response(1))
+        assert [message.root.id for message in batch] == [1, 2]
+
+    def test_notifications_only_batch_registers_nothing(self):
+        collector = BatchCollector()
+        collector.register(parse_messages(json.dumps([{"jsonrpc": "2.0", "method": "x"}])))
+        assert collector.add_response(response(1)) is None
+
+    def test_collect_replaces_batch_with_one_message(self):
+        collector = BatchCollector()
+        collector.register(parse_messages(json.dumps([request(1), request(2)])))
+        out = collector.collect([SessionMessage(response(1)), SessionMessage(response(9)), SessionMessage(response(2))])
+        assert out[0].message.root.id == 9
+        assert [message.root.id for message in out[1].message.root] == [1, 2]
+
+
+class TestSessionBatch:
+    """Test batches between a ClientSession and a lowlevel Server."""
+
+    def test_round_trip_in_order(self):
+        async def main():
+            async with create_connected_server_and_client_session(make_server()) as client:
+                results = await client.call_tools_batch([("echo", {"x": i}) for i in range(10)])
+                assert texts(results) == [str(i) for i in range(10)]
+
+        anyio.run(main)
+
+    def test_partial_errors(self):
+        async def main():
+            async with create_connected_server_and_client_session(make_server()) as client:
+                results = await client.call_tools_batch([("echo", {"x": 1}), ("fail", {}), ("echo", {"x": 3})])
+                assert texts(results)[::2] == ["1", "3"]
+                assert results[1].isError
+
+                requests = [
+                    types.ClientRequest(types.PingRequest(method="ping")),
+                    types.ClientRequest(types.ListPromptsRequest(method="prompts/list")),
+                    types.ClientRequest(types.PingRequest(method="ping")),
+                ]
+                results = await client.send_request_batch(requests, types.EmptyResult)
+                assert isinstance(results[0], types.EmptyResult)
+                assert isinstance(results[1], types.ErrorData)
+                assert isinstance(results[2], types.EmptyResult)
+
+        anyio.run(main)
+
+    def test_read_timeout_covers_the_batch(self):
+        async def main():
+            async with create_connected_server_and_client_session(make_server()) as client:
+                with pytest.raises(McpError) as exc_info:
+                    await client.call_tools_batch(
+                        [("echo", {"x": 1}), ("sleep", {})], read_timeout_seconds=timedelta(seconds=0.2)
+                    )
+                assert exc_info.value.error.code == httpx.codes.REQUEST_TIMEOUT
+                assert client._response_streams == {}
+                # The session is still usable afterwards
+                assert texts(await client.call_tools_batch([("echo", {"x": 2})])) == ["2"]
+
+        anyio.run(main)
+
+
+class TestStreamableHTTPBatch:
+    """Test batch POSTs to the streamable HTTP server transport."""
+
+    async def post(self, body, json_response):
+        manager = StreamableHTTPSessionManager(app=make_server(), json_response=json_response, stateless=True)
+        async with manager.run():
+            transport = httpx.ASGITransport(app=manager.handle_request)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post(
+                    "/mcp",
+                    json=body,
+                    headers={"Accept": "application/json, text/event-stream"},
+                )
+
+    @pytest.mark.parametrize("json_response", [True, False])
+    def test_mixed_requests_and_notifications(self, json_response):
+        body = [
+            request(1, "tools/call", {"name": "echo", "arguments": {"x": 1}}),
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 99}},
+            request(2, "tools/call", {"name": "fail", "arguments": {}}),
+            request(3, "prompts/list"),
+        ]
+        result = anyio.run(self.post, body, json_response)
+        assert result.status_code == 200
+        if json_response:
+            messages = result.json()
+        else:
+            data = [line[len("data: "):] for line in result.text.splitlines() if line.startswith("data: ")]
+            messages = json.loads(data[-1])
+        assert [message["id"] for message in messages] == [1, 2, 3]
+        assert messages[0]["result"]["content"][0]["text"] == "1"
+        assert messages[1]["result"]["isError"] is True
+        assert "error" in messages[2]
+
+    def test_notifications_only_accepted(self):
+        body = [{"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}}]
+        assert anyio.run(self.post, body, True).status_code == 202
+
+    def test_initialize_not_allowed_in_batch(self):
+        body = [request(1, "initialize", {}), request(2)]
+        assert anyio.run(self.post, body, True).status_code == 400
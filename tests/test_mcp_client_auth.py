@@ -0,0 +1,142 @@
+"""
+Tests for token refresh in the OAuth client provider.
+"""
+
+import time
+
+import anyio
+import httpx
+from mcp.client.auth import OAuthClientProvider
+from mcp.shared.auth import OAuthClientInformationFull, OAuthClientMetadata, OAuthToken
+
+SERVER = "https://mcp.example.com"
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.tokens = None
+        self.client_info = None
+
+    async def get_tokens(self):
+        return self.tokens
+
+    async def set_tokens(self, tokens):
+        self.tokens = tokens
+
+    async def get_client_info(self):
+        return self.client_info
+
+    async def set_client_info(self, client_info):
+        self.client_info = client_info
+
+
+class Backend:
+    """Serves the MCP endpoint and the token endpoint."""
+
+    def __init__(self, refresh_status=200):
+        self.refresh_status = refresh_status
+        self.refresh_error = None
+        self.refreshes = 0
+        self.release = None
+        self.authorizations = []
+
+    async def __call__(self, request):
+        if request.url.path == "/token":
+            self.refreshes += 1
+            if self.release is not None:
+                await self.release.wait()
+            if self.refresh_error is not None:
+                raise self.refresh_error
+            token = {"access_token": "new", "token_type": "Bearer", "expires_in": 3600, "refresh_token": "r2"}
+            return httpx.Response(self.refresh_status, json=token)
+        self.authorizations.append(request.headers.get("Authorization"))
+        return httpx.Response(200, json={})
+
+
+def make_provider(backend, expires_in):
+    transport = httpx.MockTransport(backend)
+    provider = OAuthClientProvider(
+        SERVER,
+        OAuthClientMetadata(redirect_uris=["http://localhost/callback"]),
+        MemoryStorage(),
+        redirect_handler=None,
+        callback_handler=None,
+        httpx_client_factory=lambda **kwargs: httpx.AsyncClient(transport=transport),
+    )
+    context = provider.context
+    context.current_tokens = OAuthToken(access_token="old", refresh_token="r1", expires_in=3600)
+    context.client_info = OAuthClientInformationFull(client_id="client", redirect_uris=["http://localhost/callback"])
+    # Due for refresh in the next minute, expired if expires_in is not positive
+    context.token_expiry_time = time.time() + expires_in
+    context.token_refresh_time = time.time() - 1
+    provider._initialized = True
+    return provider, httpx.AsyncClient(transport=transport, auth=provider)
+
+
+async def get_all(client, count):
+    async with anyio.create_task_group() as tg:
+        for _ in range(count):
+            tg.start_soon(client.get, f"{SERVER}/mcp")
+
+
+class TestTokenRefresh:
+    """Test early and expired-token refreshes."""
+
+    def test_early_refresh_replaces_token(self):
+        async def main():
+            backend = Backend()
+            provider, client = make_provider(backend, expires_in=30)
+            async with client:
+                response = await client.get(f"{SERVER}/mcp")
+            assert response.status_code == 200
+            assert backend.authorizations == ["Bearer new"]
+            assert provider.context.storage.tokens.access_token == "new"
+
+        anyio.run(main)
+
+    def test_failed_early_refresh_keeps_token(self):
+        async def main():
+            for status, error in [(500, None), (200, httpx.ConnectError("unreachable"))]:
+                backend = Backend(refresh_status=status)
+                backend.refresh_error = error
+                provider, client = make_provider(backend, expires_in=30)
+                async with client:
+                    response = await client.get(f"{SERVER}/mcp")
+                    assert response.status_code == 200
+                    # The next attempt waits, so this request does not refresh again
+                    await client.get(f"{SERVER}/mcp")
+                assert backend.authorizations == ["Bearer old", "Bearer old"]
+                assert backend.refreshes == 1
+                assert provider.context.current_tokens.access_token == "old"
+                assert time.time() < provider.context.token_refresh_time < provider.context.token_expiry_time
+
+        anyio.run(main)
+
+    def test_concurrent_callers_share_early_refresh(self):
+        async def main():
+            backend = Backend()
+            backend.release = anyio.Event()
+            provider, client = make_provider(backend, expires_in=30)
+            async with client:
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(get_all, client, 5)
+                    while backend.refreshes == 0 or len(backend.authorizations) < 4:
+                        await anyio.sleep(0.01)
+                    # Callers that found the refresh in progress used the unexpired token
+                    assert backend.authorizations == ["Bearer old"] * 4
+                    backend.release.set()
+            assert backend.refreshes == 1
+            assert backend.authorizations[4] == "Bearer new"
+
+        anyio.run(main)
+
+    def test_concurrent_callers_share_expired_refresh(self):
+        async def main():
+            backend = Backend()
+            provider, client = make_provider(backend, expires_in=-1)
+            async with client:
+                await get_all(client, 5)
+            assert backend.refreshes == 1
+            assert backend.authorizations == ["Bearer new"] * 5
+
+        anyio.run(main)
@@ -0,0 +1,181 @@
+"""
+Tests for request admission control in the lowlevel Server.
+"""
+
+import anyio
+import anyio.lowlevel
+import mcp.types as types
+import pytest
+from anyio.abc import TaskStatus
+from mcp.server.lowlevel import Server
+from mcp.server.lowlevel.concurrency import PRIORITY_HIGH, PRIORITY_NORMAL, ConcurrencyLimiter
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+class TestConcurrencyLimiter:
+    """Test queue ordering, displacement and slot accounting."""
+
+    def test_grants_high_priority_first_then_fifo(self):
+        async def main():
+            limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=3)
+            holder = limiter.reserve()
+            order = []
+
+            async def waiter(label, priority):
+                slot = await limiter.acquire(priority)
+                order.append(label)
+                slot.release()
+
+            async with anyio.create_task_group() as tg:
+                for label, priority in [("a", PRIORITY_NORMAL), ("b", PRIORITY_NORMAL), ("ping", PRIORITY_HIGH)]:
+                    tg.start_soon(waiter, label, priority)
+                    await anyio.wait_all_tasks_blocked()
+                assert limiter.queued == 3
+                holder.release()
+
+            assert order == ["ping", "a", "b"]
+            assert limiter.in_flight == 0
+            assert limiter.stats.waited == 3
+
+        anyio.run(main)
+
+    def test_high_priority_displaces_newest_queued_call(self):
+        async def main():
+            limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=2)
+            holder = limiter.reserve()
+            first = limiter.reserve(PRIORITY_NORMAL)
+            newest = limiter.reserve(PRIORITY_NORMAL)
+            ping = limiter.reserve(PRIORITY_HIGH)
+
+            with pytest.raises(McpError) as exc_info:
+                await newest.wait()
+            assert exc_info.value.error.code == types.SERVER_BUSY
+            # Full of requests of equal or higher priority: turned away at once
+            with pytest.raises(McpError):
+                limiter.reserve(PRIORITY_NORMAL)
+            assert limiter.stats.rejected == 2
+
+            holder.release()
+            await ping.wait()
+            ping.release()
+            await first.wait()
+            first.release()
+            assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+        anyio.run(main)
+
+    def test_cancelled_waiter_leaves_queue(self):
+        async def main():
+            limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=1)
+            holder = limiter.reserve()
+            with anyio.move_on_after(0.05):
+                await limiter.acquire()
+            assert limiter.queued == 0
+            assert limiter.stats.abandoned == 1
+            # The freed queue position can be taken again, and the slot is not
+            # handed to the cancelled waiter
+            holder.release()
+            holder.release()
+            assert limiter.in_flight == 0
+            limiter.reserve().release()
+            assert limiter.in_flight == 0
+
+        anyio.run(main)
+
+    def test_cancel_racing_grant_does_not_leak_slot(self):
+        async def main():
+            limiter = ConcurrencyLimiter(max_concurrent=1, max_queued=2)
+            holder = limiter.reserve()
+
+            async def waiter(*, task_status: TaskStatus[None] = anyio.TASK_STATUS_IGNORED):
+                reservation = limiter.reserve()
+                task_status.started()
+                # Either wait() sees the cancellation and passes the slot on, or
+                # it returns the slot, which is released as the server does.
+                await reservation.wait()
+                try:
+                    await anyio.sleep_forever()
+                finally:
+                    reservation.release()
+
+            async with anyio.create_task_group() as tg:
+                await tg.start(waiter)
+                await anyio.wait_all_tasks_blocked()
+                # The slot passes to the waiter, which is cancelled before it runs
+                holder.release()
+                tg.cancel_scope.cancel()
+
+            assert (limiter.in_flight, limiter.queued) == (0, 0)
+
+        anyio.run(main)
+
+
+def make_server(**limits):
+    server = Server("limited", **limits)
+    release = anyio.Event()
+
+    @server.list_tools()
+    async def list_tools():
+        return [types.Tool(name="slow", inputSchema={"type": "object"})]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        if name == "fail":
+            raise RuntimeError("handler failed")
+        if name == "slow":
+            await release.wait()
+        return [types.TextContent(type="text", text=name)]
+
+    return server, release
+
+
+class TestServerLimits:
+    """Test the limiter as used by the lowlevel Server."""
+
+    def test_slot_released_when_handler_fails(self):
+        async def main():
+            server, _ = make_server(max_concurrent_requests=1, max_queued_requests=0)
+            async with create_connected_server_and_client_session(server) as client:
+                for _ in range(3):
+                    assert (await client.call_tool("fail", {})).isError
+                assert (await client.call_tool("ok", {})).content[0].text == "ok"
+            assert server.concurrency_stats()["server"]["in_flight"] == 0
+
+        anyio.run(main)
+
+    def test_rejects_when_full_and_recovers(self):
+        async def main():
+            server, release = make_server(max_concurrent_requests=1, max_queued_requests=0)
+            async with create_connected_server_and_client_session(server) as client:
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(client.call_tool, "slow", {})
+                    while server.concurrency_stats()["server"]["in_flight"] == 0:
+                        await anyio.lowlevel.checkpoint()
+                    with pytest.raises(McpError) as exc_info:
+                        await client.send_ping()
+                    assert exc_info.value.error.code == types.SERVER_BUSY
+                    release.set()
+                await client.send_ping()
+            stats = server.concurrency_stats()["server"]
+            assert (stats["in_flight"], stats["queued"], stats["rejected"]) == (0, 0, 1)
+
+        anyio.run(main)
+
+    def test_session_limit_queues_and_cancels(self):
+        async def main():
+            server, release = make_server(max_concurrent_requests_per_session=1, max_queued_requests_per_session=4)
+            async with create_connected_server_and_client_session(server) as client:
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(client.call_tool, "slow", {})
+                    while server.concurrency_stats()["session"]["in_flight"] == 0:
+                        await anyio.lowlevel.checkpoint()
+                    # Queued behind the slow call until the client gives up on it
+                    with anyio.move_on_after(0.1):
+                        await client.call_tool("ok", {})
+                    release.set()
+                assert (await client.call_tool("ok", {})).content[0].text == "ok"
+            stats = server.concurrency_stats()["session"]
+            assert (stats["in_flight"], stats["queued"]) == (0, 0)
+
+        anyio.run(main)
@@ -0,0 +1,185 @@
+"""
+Tests for the in-memory and on-disk EventStore implementations.
+"""
+
+import shutil
+
+import anyio
+import mcp.types as types
+from mcp.server.event_store import FileEventStore, InMemoryEventStore
+
+
+def message(n):
+    return types.JSONRPCMessage(
+        types.JSONRPCNotification(jsonrpc="2.0", method="notifications/progress", params={"progress": n})
+    )
+
+
+async def store_all(store, events):
+    return [await store.store_event(stream_id, message(n)) for stream_id, n in events]
+
+
+async def replay(store, event_id):
+    replayed = []
+
+    async def collect(event):
+        replayed.append((event.event_id, event.message.root.params["progress"]))
+
+    stream_id = await store.replay_events_after(event_id, collect)
+    return stream_id, replayed
+
+
+def progress(replayed):
+    return [n for _, n in replayed]
+
+
+def segment_files(directory):
+    return sorted(path.name for path in directory.glob("*.log"))
+
+
+class TestInMemoryEventStore:
+    """Test InMemoryEventStore."""
+
+    def test_replays_only_later_events_of_the_stream(self):
+        async def main():
+            store = InMemoryEventStore()
+            ids = await store_all(store, [("a", 1), ("b", 2), ("a", 3), ("a", 4)])
+            assert await replay(store, ids[0]) == ("a", [(ids[2], 3), (ids[3], 4)])
+            assert await replay(store, "junk") == (None, [])
+
+        anyio.run(main)
+
+    def test_drops_oldest_past_caps(self):
+        async def main():
+            store = InMemoryEventStore(max_events_per_stream=2)
+            ids = await store_all(store, [("a", n) for n in range(5)])
+            assert progress((await replay(store, "0:a"))[1]) == [3, 4]
+            assert ids[-1].endswith(":a")
+
+        anyio.run(main)
+
+
+class TestFileEventStore:
+    """Test FileEventStore writing, recovery and compaction."""
+
+    def test_append_and_replay(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path)
+            try:
+                ids = await store_all(store, [("a", 1), ("b", 2), ("a", 3)])
+                assert await replay(store, ids[0]) == ("a", [(ids[2], 3)])
+                assert progress((await replay(store, "0:b"))[1]) == [2]
+                assert await replay(store, "1:missing") == (None, [])
+            finally:
+                store.close()
+
+        anyio.run(main)
+
+    def test_fsync_waits_for_the_write(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path, fsync=True)
+            try:
+                await store.store_event("a", message(1))
+                assert (tmp_path / segment_files(tmp_path)[0]).stat().st_size == store.nbytes
+            finally:
+                store.close()
+
+        anyio.run(main)
+
+    def test_recovers_after_restart(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path)
+            ids = await store_all(store, [("a", 1), ("a", 2), ("b", 3)])
+            store.close()
+            # A record cut short by a crash is dropped on recovery
+            with open(tmp_path / segment_files(tmp_path)[-1], "ab") as f:
+                f.write(b"\x07partial")
+
+            store = FileEventStore(tmp_path)
+            try:
+                assert await replay(store, ids[0]) == ("a", [(ids[1], 2)])
+                new_id = await store.store_event("a", message(4))
+                assert int(new_id.split(":")[0]) > int(ids[-1].split(":")[0])
+                assert progress((await replay(store, "0:a"))[1]) == [1, 2, 4]
+            finally:
+                store.close()
+
+        anyio.run(main)
+
+    def test_compacts_segments_of_evicted_events(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path, segment_bytes=1000, max_events_per_stream=2)
+            try:
+                await store_all(store, [("a", n) for n in range(200)])
+                assert progress((await replay(store, "0:a"))[1]) == [198, 199]
+                # Evicted events leave sealed segments mostly dead, so they
+                # are compacted away instead of accumulating.
+                assert store.nbytes < 3000
+            finally:
+                store.close()
+            assert len(segment_files(tmp_path)) <= 3
+
+        anyio.run(main)
+
+    def test_recovery_recomputes_dead_bytes(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path, segment_bytes=1000)
+            await store_all(store, [("a", n) for n in range(50)])
+            store.close()
+            before = segment_files(tmp_path)
+
+            # Reopened with a lower cap, most recovered events are dead and
+            # the segments holding them are compacted when the store opens.
+            store = FileEventStore(tmp_path, segment_bytes=1000, max_events_per_stream=2)
+            try:
+                assert progress((await replay(store, "0:a"))[1]) == [48, 49]
+                assert store.nbytes < 1000
+            finally:
+                store.close()
+            assert len(segment_files(tmp_path)) < len(before)
+
+        anyio.run(main)
+
+    def test_crash_between_copy_and_unlink_replays_once(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path, segment_bytes=1000, ttl=None)
+            ids = await store_all(store, [("a", n) for n in range(10)] + [("b", n) for n in range(10, 20)])
+            store.close()
+            saved = tmp_path / "saved"
+            saved.mkdir()
+            for name in segment_files(tmp_path):
+                shutil.copy(tmp_path / name, saved / name)
+
+            # With both streams capped at 5 events, compaction copies the live
+            # records out of mostly dead segments and deletes them; restore
+            # those files as if the process had died before the deletes
+            # reached the disk.
+            store = FileEventStore(tmp_path, segment_bytes=1000, ttl=None, max_events_per_stream=5)
+            store.close()
+            deleted = [name for name in segment_files(saved) if not (tmp_path / name).exists()]
+            assert deleted
+            for name in deleted:
+                shutil.copy(saved / name, tmp_path / name)
+
+            store = FileEventStore(tmp_path, segment_bytes=1000, ttl=None, max_events_per_stream=5)
+            try:
+                _, replayed = await replay(store, ids[0])
+                assert progress(replayed) == [5, 6, 7, 8, 9]
+                assert len({event_id for event_id, _ in replayed}) == 5
+            finally:
+                store.close()
+
+        anyio.run(main)
+
+    def test_max_bytes_drops_oldest_segments(self, tmp_path):
+        async def main():
+            store = FileEventStore(tmp_path, segment_bytes=500, max_bytes=2000, ttl=None)
+            try:
+                await store_all(store, [(str(n), n) for n in range(100)])
+                assert store.nbytes <= 2500
+                assert (await replay(store, "0:0")) == (None, [])
+                assert progress((await replay(store, "0:99"))[1]) == [99]
+            finally:
+                store.close()
+
+        anyio.run(main)
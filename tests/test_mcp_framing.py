@@ -0,0 +1,188 @@
+"""
+Tests for the newline-delimited framing used by the stdio transports.
+"""
+
+import io
+import json
+import sys
+import textwrap
+
+import anyio
+import mcp.types as types
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.server.stdio import stdio_server
+from mcp.shared.framing import LineSplitter, drain_ready, encode_messages
+from mcp.shared.message import SessionMessage
+
+
+def ping(request_id):
+    return json.dumps({"jsonrpc": "2.0", "id": request_id, "method": "ping"})
+
+
+def response(request_id):
+    return SessionMessage(
+        types.JSONRPCMessage(types.JSONRPCResponse(jsonrpc="2.0", id=request_id, result={}))
+    )
+
+
+def run_server(stdin, stdout, expected):
+    """Read ``expected`` messages through stdio_server, answering each request."""
+
+    async def main():
+        received = []
+        async with stdio_server(anyio.wrap_file(stdin), anyio.wrap_file(stdout)) as (read, write):
+            async with read, write:
+                async for message in read:
+                    received.append(message)
+                    if isinstance(message, SessionMessage):
+                        await write.send(response(message.message.root.id))
+                    if len(received) == expected:
+                        break
+        return received
+
+    return anyio.run(main)
+
+
+class TestLineSplitter:
+    """Tests for LineSplitter."""
+
+    def test_line_split_across_chunks(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b'{"a":') == []
+        assert splitter.feed(b" 1") == []
+        assert splitter.feed(b'}\n{"b"') == [b'{"a": 1}']
+        assert splitter.feed(b": 2}\n") == [b'{"b": 2}']
+        assert splitter.flush() is None
+
+    def test_several_lines_in_one_chunk(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"one\ntwo\nthree\nfo") == [b"one", b"two", b"three"]
+        assert splitter.feed(b"ur\n") == [b"four"]
+
+    def test_blank_lines_are_dropped(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"\n\none\n  \r\n\ntwo\n") == [b"one", b"two"]
+        assert splitter.feed(b"\n") == []
+
+    def test_flush_returns_unterminated_tail(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"one\ntw") == [b"one"]
+        assert splitter.feed(b"o") == []
+        assert splitter.flush() == b"two"
+        assert splitter.flush() is None
+
+    def test_flush_ignores_blank_tail(self):
+        splitter = LineSplitter()
+        splitter.feed(b"one\n   ")
+        assert splitter.flush() is None
+
+
+class TestDrainAndEncode:
+    """Tests for drain_ready and encode_messages."""
+
+    def test_drain_ready_collects_waiting_items_up_to_limit(self):
+        async def main():
+            send, receive = anyio.create_memory_object_stream(10)
+            for item in range(5):
+                send.send_nowait(item)
+            first = await receive.receive()
+            assert drain_ready(receive, first, limit=3) == [0, 1, 2]
+            first = await receive.receive()
+            assert drain_ready(receive, first) == [3, 4]
+            send.close()
+            receive.close()
+
+        anyio.run(main)
+
+    def test_drain_ready_stops_at_end_of_stream(self):
+        async def main():
+            send, receive = anyio.create_memory_object_stream(10)
+            send.send_nowait("a")
+            send.send_nowait("b")
+            send.close()
+            first = await receive.receive()
+            assert drain_ready(receive, first) == ["a", "b"]
+            receive.close()
+
+        anyio.run(main)
+
+    def test_encode_messages_writes_one_line_per_message(self):
+        data = encode_messages([response(1), response(2)])
+        lines = data.split(b"\n")
+        assert lines[-1] == b""
+        assert [json.loads(line)["id"] for line in lines[:-1]] == [1, 2]
+
+
+class TestStdioServerFraming:
+    """Tests for stdio_server reading and writing explicitly passed streams."""
+
+    def test_binary_streams(self):
+        payload = f"{ping(1)}\n\n{ping(2)}\n  \n{ping(3)}".encode()
+        stdout = io.BytesIO()
+        received = run_server(io.BytesIO(payload), stdout, expected=3)
+        assert [message.message.root.id for message in received] == [1, 2, 3]
+        lines = stdout.getvalue().decode().splitlines()
+        assert sorted(json.loads(line)["id"] for line in lines) == [1, 2, 3]
+
+    def test_unparseable_line_is_reported_without_stopping(self):
+        payload = f"not json\n{ping(1)}\n".encode()
+        received = run_server(io.BytesIO(payload), io.BytesIO(), expected=2)
+        assert isinstance(received[0], Exception)
+        assert received[1].message.root.id == 1
+
+    def test_text_streams(self):
+        stdin = io.StringIO(f"{ping(1)}\n\n{ping('é')}\n{ping(3)}")
+        stdout = io.StringIO()
+        received = run_server(stdin, stdout, expected=3)
+        assert [message.message.root.id for message in received] == [1, "é", 3]
+        lines = stdout.getvalue().splitlines()
+        assert sorted(str(json.loads(line)["id"]) for line in lines) == ["1", "3", "é"]
+
+
+# Echoes each received notification's data back as a log message, encoded in
+# latin-1; the final reply is written without a trailing newline.
+ECHO_SERVER = textwrap.dedent(
+    """
+    import json, sys
+
+    replies = []
+    for line in sys.stdin.buffer:
+        data = json.loads(line.decode("latin-1"))["params"]["data"]
+        reply = {"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "info", "data": data}}
+        replies.append(json.dumps(reply, ensure_ascii=False))
+        if len(replies) == 2:
+            break
+    sys.stdout.buffer.write("\\n".join(replies).encode("latin-1"))
+    sys.stdout.buffer.flush()
+    """
+)
+
+
+class TestStdioClientFraming:
+    """Tests for stdio_client against a subprocess using a non-UTF-8 encoding."""
+
+    def test_latin1_round_trip_and_unterminated_tail(self):
+        def notification(data):
+            return SessionMessage(
+                types.JSONRPCMessage(
+                    types.JSONRPCNotification(
+                        jsonrpc="2.0", method="notifications/message", params={"level": "info", "data": data}
+                    )
+                )
+            )
+
+        async def main():
+            params = StdioServerParameters(command=sys.executable, args=["-c", ECHO_SERVER], encoding="latin-1")
+            received = []
+            async with stdio_client(params) as (read, write):
+                await write.send(notification("café"))
+                await write.send(notification("naïve"))
+                with anyio.fail_after(10):
+                    async for message in read:
+                        received.append(message)
+                        if len(received) == 2:
+                            break
+            return received
+
+        received = anyio.run(main)
+        assert [message.message.root.params["data"] for message in received] == ["café", "naïve"]
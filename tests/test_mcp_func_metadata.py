@@ -0,0 +1,83 @@
+"""
+Tests for JSON pre-parsing of FastMCP tool arguments.
+"""
+
+import enum
+from typing import Annotated, Any, Literal, Optional
+
+import anyio
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from pydantic import BaseModel, Field
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+    y: int
+
+
+def tool(
+    text: str,
+    count: int,
+    numbers: Optional[list[int]],
+    tags: Annotated[list[str], Field(description="tags")],
+    label: Annotated[str, Field(description="label")],
+    mode: Literal["a", "b"],
+    color: Color,
+    point: Point,
+    anything: Any,
+    untyped,
+):
+    return locals()
+
+
+def call(**arguments):
+    meta = func_metadata(tool)
+    return anyio.run(meta.call_fn_with_arg_validation, tool, False, arguments, None)
+
+
+ARGUMENTS = {
+    "text": "plain",
+    "count": 1,
+    "numbers": None,
+    "tags": [],
+    "label": "x",
+    "mode": "a",
+    "color": "red",
+    "point": {"x": 0, "y": 0},
+    "anything": None,
+    "untyped": None,
+}
+
+
+class TestPreParseJson:
+    """Test which argument types are pre-parsed from JSON strings."""
+
+    def test_only_fields_that_can_hold_structures_are_pre_parsed(self):
+        meta = func_metadata(tool)
+        assert set(meta._pre_parse_fields) == {"numbers", "tags", "point", "anything", "untyped"}
+
+    def test_json_string_lists_and_models_are_parsed(self):
+        result = call(**{**ARGUMENTS, "numbers": "[1, 2]", "tags": '["a", "b"]', "point": '{"x": 1, "y": 2}'})
+        assert result["numbers"] == [1, 2]
+        assert result["tags"] == ["a", "b"]
+        assert result["point"] == Point(x=1, y=2)
+
+    def test_json_looking_strings_are_left_alone(self):
+        result = call(**{**ARGUMENTS, "text": '["a", "b"]', "label": '{"k": 1}', "anything": '"quoted"'})
+        assert result["text"] == '["a", "b"]'
+        assert result["label"] == '{"k": 1}'
+        assert result["anything"] == '"quoted"'
+
+    def test_literal_and_enum_values_are_not_parsed(self):
+        result = call(**{**ARGUMENTS, "mode": "b", "color": "red"})
+        assert result["mode"] == "b"
+        assert result["color"] is Color.RED
+
+    def test_any_and_unannotated_fields_still_parse_structures(self):
+        result = call(**{**ARGUMENTS, "anything": '{"k": [1]}', "untyped": "[1]"})
+        assert result["anything"] == {"k": [1]}
+        assert result["untyped"] == [1]
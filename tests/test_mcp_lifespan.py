@@ -0,0 +1,82 @@
+"""
+Tests for the FastMCP lifespan shared across sessions.
+"""
+
+from contextlib import asynccontextmanager
+
+import anyio
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+def make_server(events, closing=None):
+    @asynccontextmanager
+    async def lifespan(server):
+        events.append("enter")
+        try:
+            yield object()
+        finally:
+            if closing is not None:
+                await closing.wait()
+            events.append("exit")
+
+    return FastMCP("lifespan", lifespan=lifespan)
+
+
+class TestSharedLifespan:
+    """Test entering, sharing and exiting the app lifespan."""
+
+    def test_overlapping_sessions_share_one_context(self):
+        async def main():
+            events = []
+            mcp = make_server(events)
+            async with create_connected_server_and_client_session(mcp._mcp_server) as first:
+                async with create_connected_server_and_client_session(mcp._mcp_server) as second:
+                    await first.send_ping()
+                    await second.send_ping()
+                    assert events == ["enter"]
+            assert events == ["enter", "exit"]
+
+        anyio.run(main)
+
+    def test_new_user_waits_for_exit_to_finish(self):
+        async def main():
+            events = []
+            closing = anyio.Event()
+            mcp = make_server(events, closing)
+            lifespan = mcp._mcp_server.lifespan
+            contexts = []
+
+            async def use():
+                async with lifespan(mcp._mcp_server) as context:
+                    contexts.append(context)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(use)
+                await anyio.wait_all_tasks_blocked()
+                # The first user is exiting the lifespan; a second must not get
+                # the context being torn down, nor enter alongside the exit
+                tg.start_soon(use)
+                await anyio.wait_all_tasks_blocked()
+                assert events == ["enter"]
+                assert len(contexts) == 1
+                closing.set()
+
+            assert events == ["enter", "exit", "enter", "exit"]
+            assert contexts[0] is not contexts[1]
+
+        anyio.run(main)
+
+    def test_cancelled_user_releases_lifespan(self):
+        async def main():
+            events = []
+            mcp = make_server(events)
+            lifespan = mcp._mcp_server.lifespan
+            with anyio.move_on_after(0.05):
+                async with lifespan(mcp._mcp_server):
+                    await anyio.sleep_forever()
+            assert events == ["enter", "exit"]
+            async with lifespan(mcp._mcp_server):
+                assert events == ["enter", "exit", "enter"]
+
+        anyio.run(main)
@@ -0,0 +1,77 @@
+"""
+Tests for FastMCP's prebuilt list responses.
+"""
+
+import anyio
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+def make_server(**settings):
+    mcp = FastMCP("listing", **settings)
+    for name in ["alpha", "beta", "gamma"]:
+        mcp.add_tool(lambda x: x, name=name, description=f"{name} tool")
+    return mcp
+
+
+class TestListing:
+    """Test that listings follow their managers and hand out copies."""
+
+    def test_replaced_template_is_relisted(self):
+        async def main():
+            mcp = make_server()
+
+            @mcp.resource("gene://{symbol}", description="old")
+            def gene(symbol: str) -> str:
+                return symbol
+
+            assert [t.description for t in await mcp.list_resource_templates()] == ["old"]
+
+            # add_template replaces the entry for an existing URI template in place
+            @mcp.resource("gene://{symbol}", description="new")
+            def gene_v2(symbol: str) -> str:
+                return symbol
+
+            assert [t.description for t in await mcp.list_resource_templates()] == ["new"]
+            async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+                result = await client.list_resource_templates()
+                assert [t.description for t in result.resourceTemplates] == ["new"]
+
+        anyio.run(main)
+
+    def test_removed_and_added_entries_are_relisted(self):
+        async def main():
+            mcp = make_server()
+            await mcp.list_tools()
+            del mcp._tool_manager._tools["beta"]
+            mcp.add_tool(lambda x: x, name="delta")
+            assert [tool.name for tool in await mcp.list_tools()] == ["alpha", "gamma", "delta"]
+
+        anyio.run(main)
+
+    def test_list_tools_returns_copies(self):
+        async def main():
+            mcp = make_server()
+            tools = await mcp.list_tools()
+            tools[0].description = "changed"
+            tools[0].inputSchema["properties"].clear()
+            again = await mcp.list_tools()
+            assert again[0].description == "alpha tool"
+            assert again[0].inputSchema["properties"]
+            async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+                listed = (await client.list_tools()).tools
+                assert listed[0].description == "alpha tool"
+
+        anyio.run(main)
+
+    def test_pages_follow_cursor(self):
+        async def main():
+            mcp = make_server(list_page_size=2)
+            async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+                first = await client.list_tools()
+                assert [tool.name for tool in first.tools] == ["alpha", "beta"]
+                second = await client.list_tools(cursor=first.nextCursor)
+                assert [tool.name for tool in second.tools] == ["gamma"]
+                assert second.nextCursor is None
+
+        anyio.run(main)
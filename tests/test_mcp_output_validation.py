@@ -0,0 +1,154 @@
+"""
+Tests for client-side validation of structured tool results.
+"""
+
+import anyio
+import mcp.client.session as client_session
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_connected_server_and_client_session
+
+SCHEMA = {"type": "object", "properties": {"count": {"type": "integer"}}, "required": ["count"]}
+
+
+def make_server(state):
+    """A server whose "structured" tool takes its output schema and result from ``state``.
+
+    The handlers are installed directly so that the server does not validate
+    the results itself: every check in these tests happens in the client.
+    """
+    server = Server("validation")
+
+    async def list_tools(req):
+        return types.ServerResult(
+            types.ListToolsResult(
+                tools=[
+                    types.Tool(name="structured", inputSchema={"type": "object"}, outputSchema=state["schema"]),
+                    types.Tool(name="notify", inputSchema={"type": "object"}),
+                ]
+            )
+        )
+
+    async def call_tool(req):
+        if req.params.name == "notify":
+            await server.request_context.session.send_tool_list_changed()
+            return types.ServerResult(types.CallToolResult(content=[]))
+        return types.ServerResult(types.CallToolResult(content=[], structuredContent=state["result"]))
+
+    server.request_handlers[types.ListToolsRequest] = list_tools
+    server.request_handlers[types.CallToolRequest] = call_tool
+    return server
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    """Schemas compiled by the client, in order."""
+    schemas = []
+    compile_validator = client_session._compile_validator
+
+    def counting(schema):
+        schemas.append(schema)
+        return compile_validator(schema)
+
+    monkeypatch.setattr(client_session, "_compile_validator", counting)
+    return schemas
+
+
+def run(state, test, **kwargs):
+    async def main():
+        async with create_connected_server_and_client_session(make_server(state), **kwargs) as client:
+            await test(client)
+
+    anyio.run(main)
+
+
+class TestOutputValidation:
+    """Test validating structured results and reusing compiled validators."""
+
+    def test_invalid_structured_result_raises(self, compiled):
+        state = {"schema": SCHEMA, "result": {"count": "three"}}
+
+        async def test(client):
+            with pytest.raises(RuntimeError, match="Invalid structured content"):
+                await client.call_tool("structured", {})
+            state["result"] = {"count": 3}
+            result = await client.call_tool("structured", {})
+            assert result.structuredContent == {"count": 3}
+
+        run(state, test)
+        assert compiled == [SCHEMA]
+
+    def test_invalid_schema_is_reported_on_every_call(self, compiled):
+        schema = {"type": "no-such-type"}
+        state = {"schema": schema, "result": {"count": 3}}
+
+        async def test(client):
+            for _ in range(2):
+                with pytest.raises(RuntimeError, match="Invalid schema for tool structured"):
+                    await client.call_tool("structured", {})
+
+        run(state, test)
+        assert compiled == [schema]
+
+    def test_validator_reused_until_schema_changes(self, compiled):
+        state = {"schema": SCHEMA, "result": {"count": 3}}
+        renamed = {"type": "object", "properties": {"total": {"type": "integer"}}, "required": ["total"]}
+
+        async def test(client):
+            await client.list_tools()
+            await client.list_tools()
+            await client.call_tool("structured", {})
+            assert compiled == [SCHEMA]
+
+            state["schema"] = renamed
+            await client.list_tools()
+            assert compiled == [SCHEMA, renamed]
+            with pytest.raises(RuntimeError, match="Invalid structured content"):
+                await client.call_tool("structured", {})
+
+        run(state, test)
+
+    def test_list_changed_notification_clears_validators(self, compiled):
+        state = {"schema": SCHEMA, "result": {"count": 3}}
+
+        async def test(client):
+            await client.list_tools()
+            assert set(client._tool_validators) == {"structured"}
+            # The notification arrives before the result, whose validation relists the tools
+            await client.call_tool("notify", {})
+            assert compiled == [SCHEMA, SCHEMA]
+
+        run(state, test)
+
+    def test_list_changed_notification_empties_caches(self):
+        state = {"schema": SCHEMA, "result": {"count": 3}}
+
+        async def test(client):
+            await client.list_tools()
+            notification = types.ServerNotification(
+                types.ToolListChangedNotification(method="notifications/tools/list_changed")
+            )
+            await client._received_notification(notification)
+            assert client._tool_validators == {}
+            assert client._tool_output_schemas == {}
+
+        run(state, test)
+
+    def test_zero_sample_rate_skips_validation_but_requires_structured_content(self):
+        state = {"schema": SCHEMA, "result": {"count": "three"}}
+
+        async def test(client):
+            result = await client.call_tool("structured", {})
+            assert result.structuredContent == {"count": "three"}
+            state["result"] = None
+            with pytest.raises(RuntimeError, match="did not return structured content"):
+                await client.call_tool("structured", {})
+
+        run(state, test, validation_sample_rate=0.0)
+
+    def test_sample_rate_out_of_range(self):
+        send_stream, receive_stream = anyio.create_memory_object_stream(0)
+        with send_stream, receive_stream:
+            with pytest.raises(ValueError, match="validation_sample_rate"):
+                client_session.ClientSession(receive_stream, send_stream, validation_sample_rate=1.5)
@@ -0,0 +1,82 @@
+"""
+Tests for the pre-fork supervisor and FastMCP's multi-worker setting.
+"""
+
+import os
+import signal
+import threading
+import time
+
+import pytest
+from mcp.server import prefork
+from mcp.server.fastmcp import FastMCP
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestRunPrefork:
+    """Test spawning, restarting and stopping workers."""
+
+    def test_spawn_restart_and_stop(self, tmp_path):
+        def worker(sock):
+            # Record the start, crash once, then serve until terminated
+            (tmp_path / str(os.getpid())).write_text(str(sock.getsockname()[1]))
+            try:
+                os.mkdir(tmp_path / "crashed")
+            except FileExistsError:
+                while True:
+                    time.sleep(1)
+            raise RuntimeError("worker crashed")
+
+        def started():
+            return [path for path in tmp_path.iterdir() if path.name.isdigit()]
+
+        def stop_when_restarted():
+            wait_for(lambda: len(started()) >= 3)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        previous = signal.getsignal(signal.SIGTERM)
+        stopper = threading.Thread(target=stop_when_restarted)
+        stopper.start()
+        prefork.run_prefork(worker, "127.0.0.1", 0, workers=2, restart_delay=0)
+        stopper.join()
+
+        # Two workers, plus the one that replaced the crashed worker
+        workers = started()
+        assert len(workers) == 3
+        # All of them served the same socket, and have exited
+        assert len({path.read_text() for path in workers}) == 1
+        for path in workers:
+            with pytest.raises(ProcessLookupError):
+                os.kill(int(path.name), 0)
+        assert signal.getsignal(signal.SIGTERM) is previous
+
+    def test_rejects_no_workers(self):
+        with pytest.raises(ValueError):
+            prefork.run_prefork(lambda sock: None, "127.0.0.1", 0, workers=0)
+
+
+class TestFastMCPWorkers:
+    """Test that FastMCP only pre-forks stateless servers."""
+
+    def test_workers_require_stateless_http(self, monkeypatch):
+        monkeypatch.setattr(prefork, "run_prefork", lambda *args, **kwargs: pytest.fail("must not fork"))
+        server = FastMCP("workers", workers=2)
+        with pytest.raises(ValueError, match="stateless_http"):
+            server.run("streamable-http")
+
+    def test_stateless_workers_are_preforked(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(prefork, "run_prefork", lambda *args: calls.append(args))
+        server = FastMCP("workers", workers=3, stateless_http=True, host="127.0.0.1", port=8123)
+        server.run("streamable-http")
+        assert [call[1:] for call in calls] == [("127.0.0.1", 8123, 3)]
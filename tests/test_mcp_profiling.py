@@ -0,0 +1,50 @@
+"""
+Tests for profiling sampled FastMCP tool calls.
+"""
+
+import pstats
+from pathlib import Path
+
+import anyio
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+class TestToolProfiler:
+    """Test that each mode writes a profile per call and summarizes it."""
+
+    @pytest.mark.parametrize("mode", ["deterministic", "statistical"])
+    def test_profiled_call_is_written_and_summarized(self, tmp_path, mode):
+        mcp = FastMCP("profiled", profile_dir=str(tmp_path), profile_mode=mode)
+
+        @mcp.tool()
+        def crunch(n: int) -> int:
+            return busy(n)
+
+        async def main():
+            async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+                result = await client.call_tool("crunch", {"n": 300_000})
+                assert not result.isError
+
+        anyio.run(main)
+        profiler = mcp._tool_manager.profiler
+        profiler.flush()
+
+        summary = profiler.summary()
+        assert summary["mode"] == mode
+        (call,) = summary["calls"]
+        assert call["tool"] == "crunch"
+        assert call["duration"] > 0
+        path = Path(call["path"])
+        assert path.parent == tmp_path
+        assert path.suffix == (".prof" if mode == "deterministic" else ".folded")
+        if mode == "deterministic":
+            assert pstats.Stats(str(path)).total_calls > 0
+        else:
+            assert all(line.rsplit(" ", 1)[1].isdigit() for line in path.read_text().splitlines())
+        assert any("busy" in entry["function"] or "genexpr" in entry["function"] for entry in summary["top_functions"])
@@ -0,0 +1,83 @@
+"""
+Tests for resolving resource URIs against templates.
+"""
+
+import pytest
+from mcp.server.fastmcp.resources.router import TemplateRouter
+from mcp.server.fastmcp.resources.templates import ResourceTemplate
+
+
+def template(uri_template, name="t"):
+    def read(a: str = "", b: str = "", name: str = "", symbol: str = "", x: str = "") -> str:
+        return ""
+
+    return ResourceTemplate.from_function(read, uri_template=uri_template, name=name)
+
+
+def router(*uri_templates):
+    r = TemplateRouter()
+    for uri_template in uri_templates:
+        r.add(template(uri_template, name=uri_template))
+    return r
+
+
+def resolve(r, uri):
+    match = r.match(uri)
+    return None if match is None else (match[0].uri_template, match[1])
+
+
+class TestTemplateRouter:
+    """Test trie matching against the linear-scan semantics it replaces."""
+
+    def test_literal_param_and_mixed_segments(self):
+        r = router("gene://list/all", "gene://{symbol}/info", "files://{name}.txt", "files://{a}-{b}.csv")
+        assert resolve(r, "gene://list/all") == ("gene://list/all", {})
+        assert resolve(r, "gene://TP53/info") == ("gene://{symbol}/info", {"symbol": "TP53"})
+        assert resolve(r, "files://notes.txt") == ("files://{name}.txt", {"name": "notes"})
+        assert resolve(r, "files://x-y.csv") == ("files://{a}-{b}.csv", {"a": "x", "b": "y"})
+        assert resolve(r, "files://notes.csv") is None
+        assert resolve(r, "gene://TP53") is None
+        assert resolve(r, "gene://TP53/info/extra") is None
+
+    def test_first_registered_template_wins(self):
+        assert resolve(router("gene://{symbol}", "gene://list"), "gene://list") == (
+            "gene://{symbol}",
+            {"symbol": "list"},
+        )
+        assert resolve(router("gene://list", "gene://{symbol}"), "gene://list") == ("gene://list", {})
+        # A parameter edge and a mixed segment both matching: still registration order
+        assert resolve(router("f://{name}.txt", "f://{x}"), "f://a.txt") == ("f://{name}.txt", {"name": "a"})
+        assert resolve(router("f://{x}", "f://{name}.txt"), "f://a.txt") == ("f://{x}", {"x": "a.txt"})
+
+    def test_re_adding_replaces_template_and_keeps_its_position(self):
+        r = TemplateRouter()
+        r.add(template("gene://{symbol}", name="old"))
+        r.add(template("gene://list", name="literal"))
+        r.add(template("gene://{symbol}", name="new"))
+        matched, params = r.match("gene://list")
+        assert matched.name == "new"
+        assert params == {"symbol": "list"}
+
+    def test_empty_segment_does_not_match_param(self):
+        r = router("a://{x}/b", "c://{name}.txt")
+        assert resolve(r, "a:///b") is None
+        assert resolve(r, "c://.txt") is None
+        assert template("a://{x}/b").matches("a:///b") is None
+
+    @pytest.mark.parametrize(
+        "uri_template, uri, expected",
+        [
+            ("calc://{a}+{b}", "calc://1+2", {"a": "1", "b": "2"}),
+            ("calc://{a}+{b}", "calc://12", None),
+            ("q://v1.0/{x}", "q://v1.0/y", {"x": "y"}),
+            ("q://v1.0/{x}", "q://v1x0/y", None),
+            ("p://({x})", "p://(z)", {"x": "z"}),
+            ("p://({x})", "p://z", None),
+            ("s://{x}.*", "s://a.*", {"x": "a"}),
+            ("s://{x}.*", "s://a.bc", None),
+        ],
+    )
+    def test_regex_special_characters_are_literal(self, uri_template, uri, expected):
+        assert template(uri_template).matches(uri) == expected
+        resolved = resolve(router(uri_template), uri)
+        assert (None if resolved is None else resolved[1]) == expected
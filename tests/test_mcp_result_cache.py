@@ -0,0 +1,124 @@
+"""
+Tests for the client-side tool result cache.
+"""
+
+import anyio
+import mcp.types as types
+import pytest
+from mcp.client.result_cache import ToolResultCache, is_cacheable
+from mcp.client.session import ClientSession
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams, create_connected_server_and_client_session
+
+
+def make_server(name="cached"):
+    server = Server(name)
+    calls = []
+
+    @server.list_tools()
+    async def list_tools():
+        return [
+            types.Tool(
+                name="lookup",
+                inputSchema={"type": "object"},
+                annotations=types.ToolAnnotations(readOnlyHint=True),
+            ),
+            types.Tool(
+                name="upsert",
+                inputSchema={"type": "object"},
+                annotations=types.ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+            ),
+        ]
+
+    @server.call_tool()
+    async def call_tool(name, arguments):
+        calls.append(name)
+        return [types.TextContent(type="text", text=f"{server.name}:{len(calls)}")]
+
+    return server, calls
+
+
+def text(result):
+    return result.content[0].text
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestToolResultCache:
+    """Test which tools are cached, hits and TTL expiry."""
+
+    def test_only_read_only_tools_are_cacheable(self):
+        def tool(**hints):
+            return types.Tool(name="t", inputSchema={}, annotations=types.ToolAnnotations(**hints))
+
+        assert is_cacheable(tool(readOnlyHint=True))
+        assert not is_cacheable(tool(idempotentHint=True))
+        assert not is_cacheable(types.Tool(name="t", inputSchema={}))
+
+    def test_hits_skip_the_server(self):
+        async def main():
+            server, calls = make_server()
+            cache = ToolResultCache()
+            async with create_connected_server_and_client_session(
+                server, result_cache=cache, result_cache_namespace="memory://a"
+            ) as client:
+                await client.list_tools()
+                first = await client.call_tool("lookup", {"q": 1, "r": 2})
+                assert text(await client.call_tool("lookup", {"r": 2, "q": 1})) == text(first)
+                assert text(await client.call_tool("lookup", {"q": 2})) != text(first)
+                await client.call_tool("upsert", {"q": 1})
+                await client.call_tool("upsert", {"q": 1})
+            assert calls == ["lookup", "lookup", "upsert", "upsert"]
+            assert (cache.stats.hits, cache.stats.stores) == (1, 2)
+
+        anyio.run(main)
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr("mcp.client.result_cache.time.monotonic", clock)
+        cache = ToolResultCache(ttl=60)
+        result = types.CallToolResult(content=[types.TextContent(type="text", text="x")])
+        cache.put("ns", "lookup", {"q": 1}, result)
+        clock.now += 59
+        assert cache.get("ns", "lookup", {"q": 1}) is result
+        clock.now += 1
+        assert cache.get("ns", "lookup", {"q": 1}) is None
+        assert (cache.stats.expirations, len(cache), cache.nbytes) == (1, 0, 0)
+
+    def test_namespaces_isolate_servers_with_the_same_name(self):
+        async def main():
+            cache = ToolResultCache()
+            first, first_calls = make_server("same")
+            second, second_calls = make_server("same")
+            async with create_connected_server_and_client_session(
+                first, result_cache=cache, result_cache_namespace="memory://first"
+            ) as client:
+                await client.list_tools()
+                await client.call_tool("lookup", {})
+            async with create_connected_server_and_client_session(
+                second, result_cache=cache, result_cache_namespace="memory://second"
+            ) as client:
+                await client.list_tools()
+                await client.call_tool("lookup", {})
+                await client.call_tool("lookup", {})
+            assert (len(first_calls), len(second_calls)) == (1, 1)
+            assert len(cache) == 2
+
+            assert cache.invalidate("memory://first") == 1
+            assert cache.get("memory://second", "lookup", {}) is not None
+
+        anyio.run(main)
+
+    def test_session_requires_a_namespace(self):
+        async def main():
+            async with create_client_server_memory_streams() as ((read, write), _):
+                with pytest.raises(ValueError):
+                    ClientSession(read, write, result_cache=ToolResultCache())
+
+        anyio.run(main)
@@ -0,0 +1,169 @@
+"""
+Tests for connecting a ClientSessionGroup to several servers at once.
+"""
+
+import contextlib
+
+import anyio
+import mcp.client.session_group as session_group
+import mcp.types as types
+import pytest
+from mcp.client.session_group import ClientSessionGroup, StreamableHttpParameters
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+
+
+class MemoryServers:
+    """Stands in for streamablehttp_client, connecting each URL to an in-memory server."""
+
+    def __init__(self, servers):
+        self.servers = servers
+        self.closed = []
+
+    @contextlib.asynccontextmanager
+    async def __call__(self, url, **kwargs):
+        server = self.servers[url]
+        async with create_client_server_memory_streams() as (client_streams, server_streams):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lambda: server.run(*server_streams, server.create_initialization_options()))
+                try:
+                    yield (*client_streams, lambda: None)
+                finally:
+                    self.closed.append(url)
+                    tg.cancel_scope.cancel()
+
+
+def make_server(name, list_tools=None):
+    server = Server(name)
+
+    async def default_list_tools():
+        return [types.Tool(name=f"{name}_tool", inputSchema={"type": "object"})]
+
+    async def call_tool(tool, arguments):
+        return [types.TextContent(type="text", text=f"{name}:{tool}")]
+
+    server.list_tools()(list_tools or default_list_tools)
+    server.call_tool()(call_tool)
+    return server
+
+
+def params(name):
+    return StreamableHttpParameters(url=f"http://{name}/mcp")
+
+
+@pytest.fixture
+def connect(monkeypatch):
+    def install(**servers):
+        memory = MemoryServers({params(name).url: server for name, server in servers.items()})
+        monkeypatch.setattr(session_group, "streamablehttp_client", memory)
+        return memory
+
+    return install
+
+
+class TestConnectAll:
+    """Test concurrent connects, timeouts, pagination and disconnects."""
+
+    def test_servers_connect_concurrently(self, connect):
+        listing = []
+        everyone_listing = anyio.Event()
+
+        def waiting_server(name):
+            async def list_tools():
+                # Only returns once both servers are listing at the same time
+                listing.append(name)
+                if len(listing) == 2:
+                    everyone_listing.set()
+                await everyone_listing.wait()
+                return [types.Tool(name=f"{name}_tool", inputSchema={"type": "object"})]
+
+            return make_server(name, list_tools)
+
+        connect(a=waiting_server("a"), b=waiting_server("b"))
+
+        async def main():
+            async with ClientSessionGroup() as group:
+                with anyio.fail_after(5):
+                    sessions = await group.connect_all([params("a"), params("b")])
+                assert all(isinstance(session, session_group.mcp.ClientSession) for session in sessions)
+                assert set(group.tools) == {"a_tool", "b_tool"}
+
+        anyio.run(main)
+
+    def test_timeout_or_failure_does_not_sink_other_servers(self, connect):
+        async def slow_list_tools():
+            await anyio.sleep(10)
+            return []
+
+        memory = connect(fast=make_server("fast"), slow=make_server("slow", slow_list_tools))
+
+        async def main():
+            async with ClientSessionGroup() as group:
+                with anyio.fail_after(5):
+                    results = await group.connect_all(
+                        [params("slow"), params("fast"), params("missing")], timeout=0.2
+                    )
+                assert isinstance(results[0], TimeoutError)
+                assert isinstance(results[1], session_group.mcp.ClientSession)
+                assert isinstance(results[2], KeyError)
+                assert set(group.tools) == {"fast_tool"}
+                assert group.sessions == [results[1]]
+                # The timed-out session was closed right away
+                assert memory.closed == [params("slow").url]
+                result = await group.call_tool("fast_tool", {})
+                assert result.content[0].text == "fast:fast_tool"
+
+        anyio.run(main)
+
+    def test_follows_cursors_and_stops_on_repeat(self, connect):
+        pages = {
+            None: (["a"], "p2"),
+            "p2": (["b"], "p3"),
+            "p3": (["c"], "p2"),  # a server bug: loops back to an earlier page
+        }
+        requested = []
+        server = make_server("paged")
+
+        async def list_tools(req):
+            cursor = req.params.cursor if req.params else None
+            requested.append(cursor)
+            names, next_cursor = pages[cursor]
+            tools = [types.Tool(name=name, inputSchema={"type": "object"}) for name in names]
+            return types.ServerResult(types.ListToolsResult(tools=tools, nextCursor=next_cursor))
+
+        server.request_handlers[types.ListToolsRequest] = list_tools
+        connect(paged=server)
+
+        async def main():
+            async with ClientSessionGroup() as group:
+                with anyio.fail_after(5):
+                    await group.connect_all([params("paged")])
+                assert set(group.tools) == {"a", "b", "c"}
+
+        anyio.run(main)
+        assert requested == [None, "p2", "p3"]
+
+    def test_disconnect_sessions_opened_by_connect_all(self, connect):
+        memory = connect(a=make_server("a"), b=make_server("b"))
+
+        async def main():
+            async with ClientSessionGroup() as group:
+                with anyio.fail_after(5):
+                    session_a, session_b = await group.connect_all([params("a"), params("b")])
+                    await group.disconnect_from_server(session_a)
+                assert memory.closed == [params("a").url]
+                assert set(group.tools) == {"b_tool"}
+                assert group.sessions == [session_b]
+            # Leaving the group closes the rest
+            assert sorted(memory.closed) == [params("a").url, params("b").url]
+
+        anyio.run(main)
+
+    def test_connect_all_requires_entering_the_group(self, connect):
+        connect(a=make_server("a"))
+
+        async def main():
+            with pytest.raises(RuntimeError, match="async with"):
+                await ClientSessionGroup().connect_all([params("a")])
+
+        anyio.run(main)
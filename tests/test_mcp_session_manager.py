@@ -0,0 +1,76 @@
+"""
+Tests for the streamable HTTP session manager.
+"""
+
+import anyio
+import httpx
+from mcp.server.event_store import InMemoryEventStore
+from mcp.server.lowlevel import Server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+HEADERS = {"Accept": "application/json, text/event-stream"}
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-06-18", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}},
+}
+
+
+class TestSessionManager:
+    """Test unknown-session handling and per-session traffic and queue figures."""
+
+    def test_unknown_session_gets_404_and_traffic_is_counted(self):
+        async def main():
+            manager = StreamableHTTPSessionManager(app=Server("sessions"), json_response=True)
+            async with manager.run():
+                transport = httpx.ASGITransport(app=manager.handle_request)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.post(
+                        "/mcp", json=INITIALIZE, headers={**HEADERS, "mcp-session-id": "no-such-session"}
+                    )
+                    assert response.status_code == 404
+
+                    response = await client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+                    assert response.status_code == 200
+                    session_id = response.headers["mcp-session-id"]
+                    stats = manager.stats()
+                    assert stats["active_sessions"] == 1
+                    session = stats["sessions"][session_id]
+                    assert session["requests"] == 1
+                    assert session["bytes_received"] == len(response.request.content)
+                    assert session["bytes_sent"] == len(response.content)
+
+        anyio.run(main)
+
+    def test_stats_report_queued_messages_and_event_store_bytes(self):
+        async def main():
+            event_store = InMemoryEventStore()
+            manager = StreamableHTTPSessionManager(app=Server("sessions"), event_store=event_store, json_response=True)
+            async with manager.run():
+                transport = httpx.ASGITransport(app=manager.handle_request)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.post("/mcp", json=INITIALIZE, headers=HEADERS)
+                    session_id = response.headers["mcp-session-id"]
+
+                stats = manager.stats()
+                assert stats["event_store_bytes"] == event_store.nbytes > 0
+                assert stats["sessions"][session_id]["queued_messages"] == 0
+
+                # A message routed to a request stream that nothing is reading yet
+                session_transport = manager._server_instances[session_id]
+                send_stream, receive_stream = anyio.create_memory_object_stream(0)
+                session_transport._request_streams["pending"] = (send_stream, receive_stream)
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(send_stream.send, "message")
+                    await anyio.wait_all_tasks_blocked()
+                    assert manager.stats()["sessions"][session_id]["queued_messages"] == 1
+                    assert await receive_stream.receive() == "message"
+                assert manager.stats()["sessions"][session_id]["queued_messages"] == 0
+                del session_transport._request_streams["pending"]
+
+        anyio.run(main)
+
+    def test_event_store_bytes_without_store(self):
+        manager = StreamableHTTPSessionManager(app=Server("sessions"))
+        assert manager.stats()["event_store_bytes"] is None
@@ -0,0 +1,167 @@
+"""
+Tests for the caching bearer-token verifier.
+"""
+
+import anyio
+import httpx
+import mcp.server.auth.token_cache as token_cache
+from mcp.server.auth.handlers.revoke import RevocationHandler
+from mcp.server.auth.middleware.client_auth import ClientAuthenticator
+from mcp.server.auth.provider import AccessToken
+from mcp.server.auth.token_cache import CachingTokenVerifier
+from mcp.shared.auth import OAuthClientInformationFull
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+
+class FakeTime:
+    """Stands in for the time module, with a wall clock and a monotonic clock."""
+
+    def __init__(self):
+        self.wall = 1_700_000_000.0
+        self.mono = 1000.0
+
+    def time(self):
+        return self.wall
+
+    def monotonic(self):
+        return self.mono
+
+    def advance(self, seconds):
+        self.wall += seconds
+        self.mono += seconds
+
+
+class CountingVerifier:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.calls = 0
+
+    async def verify_token(self, token):
+        self.calls += 1
+        return self.tokens.get(token)
+
+
+def access_token(token, client_id="client", expires_at=None):
+    return AccessToken(token=token, client_id=client_id, scopes=["read"], expires_at=expires_at)
+
+
+def make_cache(monkeypatch, tokens, **options):
+    clock = FakeTime()
+    monkeypatch.setattr(token_cache, "time", clock)
+    verifier = CountingVerifier(tokens)
+    return CachingTokenVerifier(verifier, **options), verifier, clock
+
+
+def verify(cache, *tokens):
+    async def main():
+        return [await cache.verify_token(token) for token in tokens]
+
+    return anyio.run(main)
+
+
+class TestCachingTokenVerifier:
+    """Test TTLs, expiry capping, revocation and eviction."""
+
+    def test_caches_valid_tokens_for_ttl(self, monkeypatch):
+        cache, verifier, clock = make_cache(monkeypatch, {"a": access_token("a")}, ttl=60)
+        verify(cache, "a", "a")
+        assert (verifier.calls, cache.stats.hits) == (1, 1)
+        clock.advance(60)
+        verify(cache, "a")
+        assert (verifier.calls, cache.stats.expirations) == (2, 1)
+
+    def test_ttl_is_capped_at_token_expiry(self, monkeypatch):
+        clock = FakeTime()
+        tokens = {
+            "short": access_token("short", expires_at=int(clock.wall) + 10),
+            "expired": access_token("expired", expires_at=int(clock.wall) - 1),
+        }
+        cache, verifier, clock = make_cache(monkeypatch, tokens, ttl=60)
+        verify(cache, "short", "expired")
+        # An already expired token is never cached
+        assert len(cache) == 1
+        clock.advance(9)
+        verify(cache, "short")
+        assert verifier.calls == 2
+        clock.advance(1)
+        verify(cache, "short")
+        assert verifier.calls == 3
+
+    def test_invalid_tokens_use_the_negative_ttl(self, monkeypatch):
+        cache, verifier, clock = make_cache(monkeypatch, {}, ttl=60, negative_ttl=5)
+        assert verify(cache, "bad", "bad") == [None, None]
+        assert (verifier.calls, cache.stats.negative_hits) == (1, 1)
+        clock.advance(5)
+        verify(cache, "bad")
+        assert verifier.calls == 2
+
+        cache, verifier, _ = make_cache(monkeypatch, {}, negative_ttl=0)
+        verify(cache, "bad", "bad")
+        assert (verifier.calls, len(cache)) == (2, 0)
+
+    def test_negative_entries_are_bounded_and_evicted_lru(self, monkeypatch):
+        cache, verifier, _ = make_cache(monkeypatch, {"good": access_token("good")}, max_entries=3)
+        verify(cache, "good", "bad1", "bad2", "good", "bad3", "bad4")
+        # A flood of invalid tokens cannot grow the cache past max_entries, and
+        # the recently used valid token outlives the older invalid ones.
+        assert len(cache) == 3
+        assert cache.stats.evictions == 2
+        calls = verifier.calls
+        verify(cache, "good", "bad3", "bad4")
+        assert verifier.calls == calls
+        verify(cache, "bad1")
+        assert verifier.calls == calls + 1
+
+    def test_token_revoked_drops_the_clients_tokens(self, monkeypatch):
+        tokens = {
+            "a1": access_token("a1", "a"),
+            "a2": access_token("a2", "a"),
+            "b1": access_token("b1", "b"),
+        }
+        cache, verifier, _ = make_cache(monkeypatch, tokens)
+        verify(cache, "a1", "a2", "b1")
+        cache.token_revoked(tokens["a1"])
+        assert len(cache) == 1
+        assert cache.stats.revocations == 2
+        verify(cache, "a1", "a2", "b1")
+        assert verifier.calls == 5
+
+
+class RevokingProvider:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.client = OAuthClientInformationFull(client_id="a", redirect_uris=["http://localhost/callback"])
+
+    async def get_client(self, client_id):
+        return self.client if client_id == self.client.client_id else None
+
+    async def load_access_token(self, token):
+        return self.tokens.get(token)
+
+    async def load_refresh_token(self, client, token):
+        return None
+
+    async def revoke_token(self, token):
+        self.tokens.pop(token.token, None)
+
+
+class TestRevocationEndpoint:
+    """Test that the revocation endpoint clears the cache through on_revoke."""
+
+    def test_revoked_token_is_verified_again(self):
+        async def main():
+            tokens = {"a1": access_token("a1", "a")}
+            provider = RevokingProvider(tokens)
+            cache = CachingTokenVerifier(CountingVerifier(tokens))
+            handler = RevocationHandler(provider, ClientAuthenticator(provider), on_revoke=cache.token_revoked)
+            app = Starlette(routes=[Route("/revoke", handler.handle, methods=["POST"])])
+
+            assert await cache.verify_token("a1") is not None
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/revoke", data={"token": "a1", "client_id": "a", "client_secret": ""})
+            assert response.status_code == 200
+            assert await cache.verify_token("a1") is None
+
+        anyio.run(main)
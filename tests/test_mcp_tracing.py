@@ -0,0 +1,84 @@
+"""
+Tests for request tracing spans.
+"""
+
+import json
+import threading
+import time
+
+import anyio
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared import tracing
+from mcp.shared.memory import create_connected_server_and_client_session
+from Profetch.cancellation import run_cancellable
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "trace.json"
+    tracing.configure(str(path))
+    try:
+        yield path
+    finally:
+        tracing.configure(None)
+
+
+def read_chrome_trace(path):
+    # The writer leaves the array unterminated, as the format allows
+    return json.loads(path.read_text().rstrip().rstrip(",") + "]")
+
+
+def lookup_in_thread(symbol):
+    with tracing.span("lookup", symbol=symbol):
+        return symbol.lower()
+
+
+class TestTracing:
+    """Test the spans recorded for a tool call and how they are written."""
+
+    def test_tool_call_spans_carry_request_id_into_executor(self, trace_file):
+        mcp = FastMCP("traced")
+
+        @mcp.tool()
+        async def lookup(symbol: str) -> str:
+            return await run_cancellable(lookup_in_thread, symbol)
+
+        async def main():
+            async with create_connected_server_and_client_session(mcp._mcp_server) as client:
+                result = await client.call_tool("lookup", {"symbol": "TP53"})
+                assert result.content[0].text == "tp53"
+
+        anyio.run(main)
+        tracing.configure(None)
+
+        events = read_chrome_trace(trace_file)
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in events)
+        assert {"name", "ts", "dur", "pid", "tid", "args"} <= set(events[0])
+        by_name = {}
+        for event in events:
+            by_name.setdefault(event["name"], []).append(event)
+        assert {"server.handle", "tool.validate_arguments", "tool.call", "executor.run", "lookup"} <= set(by_name)
+
+        handle = next(event for event in by_name["server.handle"] if event["args"]["method"] == "tools/call")
+        request_id = handle["args"]["request_id"]
+        for name in ["tool.call", "executor.run", "lookup"]:
+            assert [event["args"]["request_id"] for event in by_name[name]] == [request_id]
+        # The executor spans were recorded on another thread, in a copy of the context
+        assert by_name["lookup"][0]["tid"] != handle["tid"]
+        assert by_name["lookup"][0]["args"]["symbol"] == "TP53"
+
+    def test_spans_are_written_by_the_writer_thread(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        tracer = tracing.Tracer(str(path), flush_interval=0.01)
+        try:
+            tracer.record("stage", 0, 1000, {"request_id": 7})
+            assert tracer._writer.is_alive() and tracer._writer is not threading.current_thread()
+            deadline = time.monotonic() + 5
+            while not path.read_text() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            (line,) = path.read_text().splitlines()
+            assert json.loads(line)["args"] == {"request_id": 7}
+        finally:
+            tracer.close()
+        assert not tracer._writer.is_alive()
@@ -0,0 +1,100 @@
+"""
+Tests for validating incoming JSON-RPC requests and notifications by method.
+"""
+
+import anyio
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel import Server
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+from mcp.shared.session import validate_incoming
+from pydantic import ValidationError
+
+
+def request(method, params=None, **extra):
+    message = {"jsonrpc": "2.0", "id": 1, "method": method, **extra}
+    if params is not None:
+        message["params"] = params
+    return types.JSONRPCRequest.model_validate(message)
+
+
+def notification(method, params=None):
+    message = {"jsonrpc": "2.0", "method": method}
+    if params is not None:
+        message["params"] = params
+    return types.JSONRPCNotification.model_validate(message)
+
+
+class TestValidateIncoming:
+    """Test the method-to-member lookup against the union it replaces."""
+
+    @pytest.mark.parametrize(
+        "method, params, member",
+        [
+            ("ping", None, types.PingRequest),
+            ("tools/call", {"name": "echo", "arguments": {"x": 1}}, types.CallToolRequest),
+            ("tools/list", {"cursor": "2"}, types.ListToolsRequest),
+            ("resources/read", {"uri": "gene://TP53"}, types.ReadResourceRequest),
+            ("prompts/get", {"name": "p"}, types.GetPromptRequest),
+        ],
+    )
+    def test_known_request_methods(self, method, params, member):
+        validated = validate_incoming(types.ClientRequest, request(method, params))
+        assert type(validated.root) is member
+        assert validated == types.ClientRequest.model_validate(request(method, params).model_dump())
+
+    @pytest.mark.parametrize(
+        "method, params, member",
+        [
+            ("notifications/progress", {"progressToken": 1, "progress": 0.5}, types.ProgressNotification),
+            ("notifications/cancelled", {"requestId": 3}, types.CancelledNotification),
+            ("notifications/tools/list_changed", None, types.ToolListChangedNotification),
+        ],
+    )
+    def test_known_notification_methods(self, method, params, member):
+        validated = validate_incoming(types.ServerNotification, notification(method, params))
+        assert type(validated.root) is member
+
+    def test_unknown_method_and_bad_params_raise(self):
+        with pytest.raises(ValidationError):
+            validate_incoming(types.ClientRequest, request("tools/unknown"))
+        with pytest.raises(ValidationError):
+            validate_incoming(types.ClientRequest, request("tools/call", {"arguments": {}}))
+        with pytest.raises(ValidationError):
+            validate_incoming(types.ServerNotification, notification("notifications/progress", {"progress": "x"}))
+
+    def test_extra_fields_survive(self):
+        message = request("tools/call", {"name": "echo", "custom": 1}, vendorField="v")
+        validated = validate_incoming(types.ClientRequest, message).root
+        assert validated.model_extra["vendorField"] == "v"
+        assert validated.params.model_extra == {"custom": 1}
+
+
+class TestInvalidRequestsOverSession:
+    """Test that a server answers requests failing validation with INVALID_PARAMS."""
+
+    # The malformed requests are built with model_construct, so serializing them warns
+    @pytest.mark.filterwarnings("ignore::UserWarning")
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            types.PingRequest.model_construct(method="tools/unknown"),
+            types.CallToolRequest.model_construct(method="tools/call", params={"arguments": {}}),
+        ],
+    )
+    def test_answers_invalid_params_and_keeps_serving(self, raw):
+        async def main():
+            server = Server("validation")
+
+            @server.call_tool()
+            async def call_tool(name, arguments):
+                return []
+
+            async with create_connected_server_and_client_session(server) as client:
+                with pytest.raises(McpError) as exc_info:
+                    await client.send_request(types.ClientRequest.model_construct(root=raw), types.EmptyResult)
+                assert exc_info.value.error.code == types.INVALID_PARAMS
+                await client.send_ping()
+
+        anyio.run(main)
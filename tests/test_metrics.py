@@ -0,0 +1,142 @@
+"""
+Tests for the in-process metrics registry.
+"""
+
+import asyncio
+import random
+import threading
+from contextlib import asynccontextmanager
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from Profetch.bridge import Bridge, Config
+from Profetch.metrics import (
+    Registry,
+    _bucket_bounds,
+    _bucket_index,
+    instrument_tool,
+    register_server_metrics,
+    registry,
+)
+
+
+class TestMetrics:
+    """Test counters, histograms, the exposition formats and tool instrumentation."""
+
+    def test_buckets_cover_values_to_within_a_sixteenth(self):
+        for micros in [0, 1, 31, 32, 33, 999, 1000, 123456] + random.sample(range(1, 1 << 36), 1000):
+            lower, upper = _bucket_bounds(_bucket_index(micros))
+            assert lower <= micros < upper
+            assert upper - lower <= max(lower / 16, 1)
+
+    def test_counter_sums_threads(self):
+        counter = Registry().counter("requests_total", "Requests.").labels()
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5)
+        assert counter.value == 8005
+
+    def test_histogram_quantiles(self):
+        histogram = Registry().histogram("latency_seconds", "Latency.").labels()
+        for ms in range(1, 1001):
+            histogram.observe(ms / 1000)
+        summary = histogram.summary()
+        assert summary["count"] == 1000
+        assert summary["sum"] == pytest.approx(500.5)
+        assert summary["p50"] == pytest.approx(0.5, rel=0.07)
+        assert summary["p99"] == pytest.approx(0.99, rel=0.07)
+        assert summary["max"] == pytest.approx(1.0, rel=0.07)
+
+    def test_render_prometheus(self):
+        reg = Registry()
+        reg.counter("calls_total", "Calls.", ("tool",)).labels('say "hi"').inc(2)
+        histogram = reg.histogram("latency_seconds", "Latency.", bounds=(0.01, 0.1)).labels()
+        for seconds in (0.005, 0.05, 0.5):
+            histogram.observe(seconds)
+        reg.sampled("gauge", "sessions_active", "Sessions.", lambda: 3)
+        text = reg.render()
+        assert "# TYPE calls_total counter\ncalls_total{tool=\"say \\\"hi\\\"\"} 2\n" in text
+        assert 'latency_seconds_bucket{le="0.01"} 1\n' in text
+        assert 'latency_seconds_bucket{le="0.1"} 2\n' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3\n' in text
+        assert "latency_seconds_count 3\n" in text
+        assert "sessions_active 3\n" in text
+        assert reg.snapshot()["sessions_active"]["values"] == [{"labels": {}, "value": 3}]
+
+    def test_duplicate_name_rejected(self):
+        reg = Registry()
+        reg.counter("calls_total", "Calls.")
+        with pytest.raises(ValueError):
+            reg.gauge("calls_total", "Calls.")
+
+    def test_instrument_tool(self):
+        @instrument_tool
+        async def metrics_test_tool(fail: bool) -> str:
+            """Docstring kept for the tool description."""
+            if fail:
+                raise ValueError("boom")
+            return "done"
+
+        assert metrics_test_tool.__doc__ == "Docstring kept for the tool description."
+        assert asyncio.run(metrics_test_tool(False)) == "done"
+        with pytest.raises(ValueError):
+            asyncio.run(metrics_test_tool(True))
+
+        values = {
+            entry["labels"]["outcome"]: entry["value"]
+            for entry in registry.snapshot()["profetch_tool_calls_total"]["values"]
+            if entry["labels"]["tool"] == "metrics_test_tool"
+        }
+        assert values == {"ok": 1, "error": 1, "cancelled": 0}
+        latency = [
+            entry
+            for entry in registry.snapshot()["profetch_tool_duration_seconds"]["values"]
+            if entry["labels"] == {"tool": "metrics_test_tool"}
+        ]
+        assert latency[0]["count"] == 2
+
+    def test_instrument_tool_counts_returned_errors(self):
+        @instrument_tool
+        async def metrics_error_dict_tool(found: bool) -> dict:
+            return {"accession": "P04637"} if found else {"error": "No data found"}
+
+        asyncio.run(metrics_error_dict_tool(True))
+        asyncio.run(metrics_error_dict_tool(False))
+        values = {
+            entry["labels"]["outcome"]: entry["value"]
+            for entry in registry.snapshot()["profetch_tool_calls_total"]["values"]
+            if entry["labels"]["tool"] == "metrics_error_dict_tool"
+        }
+        assert values == {"ok": 1, "error": 1, "cancelled": 0}
+
+    def test_server_metrics_sample_entry_cache_evictions(self):
+        bridge = Bridge(Config(entry_cache_size=1))
+
+        @asynccontextmanager
+        async def lifespan(server):
+            yield bridge
+
+        server = FastMCP("metrics", lifespan=lifespan)
+        reg = Registry()
+        register_server_metrics(server, reg)
+
+        def evictions():
+            return reg.snapshot()["profetch_entry_cache_evictions_total"]["values"][0]["value"]
+
+        async def main():
+            assert evictions() == 0
+            async with server._mcp_server.lifespan(server._mcp_server):
+                bridge._entries.put("TP53", {})
+                bridge._entries.put("BRCA1", {})
+                assert evictions() == 1
+            assert evictions() == 0  # no Bridge outside the lifespan
+
+        asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Tests for batch physicochemical property computation.
+"""
+
+import random
+
+from Profetch.properties import (
+    AMINO_ACIDS,
+    PKA_C_TERM,
+    PKA_N_TERM,
+    PKA_SIDE_CHAINS,
+    compute_properties,
+    isoelectric_points,
+)
+
+
+def net_charge(counts, ph):
+    """Reference Henderson-Hasselbalch net charge of one composition."""
+    charge = 1.0 / (1.0 + 10 ** (ph - PKA_N_TERM)) - 1.0 / (1.0 + 10 ** (PKA_C_TERM - ph))
+    for residue, pka, sign in PKA_SIDE_CHAINS:
+        if sign > 0:
+            charge += counts[residue] / (1.0 + 10 ** (ph - pka))
+        else:
+            charge -= counts[residue] / (1.0 + 10 ** (pka - ph))
+    return charge
+
+
+def reference_pi(counts, iterations=30):
+    lo, hi = 0.0, 14.0
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        if net_charge(counts, mid) > 0:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+
+class TestProperties:
+    """Test compute_properties and isoelectric_points."""
+
+    def test_columns_are_aligned(self):
+        result = compute_properties([("P1", b"MWYCCAAG"), ("P2", b"KKKK")])
+        assert result["accession"] == ["P1", "P2"]
+        assert result["length"] == [8, 4]
+        assert len(result["pI"]) == 2
+        assert set(result["composition"]) == set(AMINO_ACIDS)
+        assert result["composition"]["C"] == [0.25, 0.0]
+
+    def test_scalar_properties(self):
+        result = compute_properties([("P1", b"MWYCCAAG")])
+        assert result["aromaticity"] == [0.25]
+        assert result["extinction_coefficient_reduced"] == [5500 + 1490]
+        assert result["extinction_coefficient_cystines"] == [5500 + 1490 + 125]
+        assert result["gravy"] == [round((1.9 - 0.9 - 1.3 + 2 * 2.5 + 2 * 1.8 - 0.4) / 8, 4)]
+
+    def test_isoelectric_points_ordering(self):
+        basic, acidic = isoelectric_points([
+            {aa: (4 if aa in "KR" else 0) for aa in AMINO_ACIDS},
+            {aa: (4 if aa in "DE" else 0) for aa in AMINO_ACIDS},
+        ])
+        assert basic > 10
+        assert acidic < 4
+
+    def test_isoelectric_points_match_per_sequence_bisection(self):
+        rng = random.Random(7)
+        compositions = [{aa: rng.randint(0, 40) for aa in AMINO_ACIDS} for _ in range(50)]
+        compositions.append({aa: 0 for aa in AMINO_ACIDS})
+        points = isoelectric_points(compositions)
+        for counts, pi in zip(compositions, points):
+            assert abs(pi - reference_pi(counts)) < 1e-9
+            assert abs(net_charge(counts, pi)) < 1e-4
+        assert isoelectric_points([]) == []
@@ -0,0 +1,60 @@
+"""
+Tests for the sequence cache and motif scanning.
+"""
+
+import pytest
+from Profetch.sequences import SequenceCache, compile_motif, prosite_to_regex
+
+
+class TestProsite:
+    """Test PROSITE pattern translation."""
+
+    def test_glycosylation_pattern(self):
+        assert prosite_to_regex("N-{P}-[ST]-{P}.") == "N[^P\\n][ST][^P\\n]"
+
+    def test_repeats_and_anchors(self):
+        assert prosite_to_regex("<M-x(2,3)-[ST]>") == "^M[A-Z]{2,3}[ST]$"
+
+    def test_invalid_pattern(self):
+        with pytest.raises(ValueError):
+            prosite_to_regex("N-{P")
+
+
+class TestSequenceCache:
+    """Test the SequenceCache class."""
+
+    def _cache(self):
+        cache = SequenceCache()
+        cache.add("P00001", "MNNSTAKNPSA")
+        cache.add("P00002", "mnqs\nggnat")
+        return cache
+
+    def test_add_and_get(self):
+        cache = self._cache()
+        assert len(cache) == 2
+        assert cache.get("P00002") == "MNQSGGNAT"
+        assert cache.add("P00001", "AAAA") is False
+        assert cache.get("P00003") is None
+
+    def test_scan_all_overlapping(self):
+        regex, _ = compile_motif("N-{P}-[ST]-{P}")
+        matches, total, scanned = self._cache().scan(regex)
+        assert scanned == 2
+        assert total == 3
+        assert [(m["accession"], m["start"], m["match"]) for m in matches] == [
+            ("P00001", 2, "NNST"),
+            ("P00001", 3, "NSTA"),
+            ("P00002", 2, "NQSG"),
+        ]
+
+    def test_scan_subset_respects_anchors(self):
+        regex, _ = compile_motif("<M-N")
+        matches, total, scanned = self._cache().scan(regex, ["P00002", "P99999"])
+        assert scanned == 1
+        assert [m["accession"] for m in matches] == ["P00002"]
+
+    def test_regex_does_not_cross_sequences(self):
+        regex, _ = compile_motif("A[^P]", syntax="regex")
+        matches, total, _ = self._cache().scan(regex, max_matches=1)
+        assert total == 2
+        assert len(matches) == 1
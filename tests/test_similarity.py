@@ -0,0 +1,72 @@
+"""
+Tests for the k-mer MinHash similarity index.
+"""
+
+import random
+
+from Profetch.sequences import SequenceCache
+from Profetch.similarity import KmerIndex, banded_alignment_score
+
+SEQ_A = "MEEPQSDPSVEPPLSQETFSDLWKLLPENNVLSPLPSQAMDDLMLSPDDIEQWFTEDPGP"
+SEQ_B = "MTAMEESQSDISLELPLSQETFSGLWKLLPPEDILPSPHCMDDLLLPQDVEEFFEGPSEA"
+SEQ_C = "GSHMKKLLLAIAGVAACAGSSQPTLTDNGKTYTVAVTGDNWTGSRFEEGRWLKVNGKQV"
+
+
+def full_matrix_score(a, b, band, match=2, mismatch=-1, gap=-2):
+    """Reference: the same banded recurrence over full-width rows."""
+    n, m = len(a), len(b)
+    shift = (m - n) // 2
+    best = 0
+    prev = [0] * (m + 1)
+    for i in range(1, n + 1):
+        row = [0] * (m + 1)
+        left = 0
+        for j in range(max(1, i + shift - band), min(m, i + shift + band) + 1):
+            diag = prev[j - 1] + (match if a[i - 1] == b[j - 1] else mismatch)
+            left = row[j] = max(0, diag, prev[j] + gap, left + gap)
+            best = max(best, left)
+        prev = row
+    return best
+
+
+class TestKmerIndex:
+    """Test the KmerIndex class."""
+
+    def _index(self):
+        cache = SequenceCache()
+        for accession, sequence in [("A", SEQ_A), ("B", SEQ_B), ("C", SEQ_C)]:
+            cache.add(accession, sequence)
+        index = KmerIndex(k=3)
+        assert index.sync(cache) == 3
+        assert index.sync(cache) == 0
+        return index
+
+    def test_query_finds_itself_first(self):
+        hits = self._index().query(SEQ_A.encode(), top_k=2)
+        assert hits[0]["accession"] == "A"
+        assert hits[0]["jaccard"] == 1.0
+
+    def test_query_excludes_accession(self):
+        hits = self._index().query(SEQ_A.encode(), exclude="A")
+        assert "A" not in [hit["accession"] for hit in hits]
+        assert hits[0]["accession"] == "B"
+
+
+class TestBandedAlignment:
+    """Test banded_alignment_score."""
+
+    def test_identical_sequences(self):
+        assert banded_alignment_score(b"ACDEFG", b"ACDEFG") == 12
+
+    def test_related_scores_higher_than_unrelated(self):
+        related = banded_alignment_score(SEQ_A.encode(), SEQ_B.encode())
+        unrelated = banded_alignment_score(SEQ_A.encode(), SEQ_C.encode())
+        assert related > unrelated
+
+    def test_matches_full_matrix(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            a = bytes(rng.choice(b"ACDE") for _ in range(rng.randint(0, 40)))
+            b = bytes(rng.choice(b"ACDE") for _ in range(rng.randint(0, 40)))
+            band = rng.randint(0, 12)
+            assert banded_alignment_score(a, b, band=band) == full_matrix_score(a, b, band)